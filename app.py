@@ -6,18 +6,29 @@ Professional REST API for economic indicator analysis
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import math
 from src.core.predictor import PredictorCore
+from src.utils import lock_file, release_lock_file
+from src.utils.http import build_session
+import concurrent.futures
+import json
 import os
+import queue
 import sqlite3
 import subprocess
+import threading
+import time
+import orjson
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from datetime import datetime, date
-from collections import defaultdict
+from datetime import datetime, date, timedelta
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from dateutil import parser as date_parser
 
 # Load environment variables
 load_dotenv()
@@ -33,7 +44,160 @@ ECONOMIC_DB_PATH = os.path.join(DATA_DIR, "economic_calendar.db")
 # Ensure DATA_DIR exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
-app = FastAPI(title="Macro Trading Terminal", version="3.0")
+
+class DBPool:
+    """
+    Pool of long-lived SQLite connections, one queue per database file.
+
+    Connections are opened lazily on first use of a given file (the scrapers
+    may create the databases after startup) and are reused across requests
+    so SQLite's page cache survives between calls. `attach` maps schema
+    aliases to extra database files attached to every connection.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=normal",
+        "PRAGMA temp_store=memory",
+        "PRAGMA cache_size=-64000",
+    )
+
+    def __init__(
+        self,
+        size: int = 4,
+        cached_statements: int = 64,
+        attach: Optional[Dict[str, str]] = None
+    ):
+        self.size = size
+        self.cached_statements = cached_statements
+        self.attach = attach or {}
+        self._queues: Dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.cached_statements
+        )
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        for alias, path in self.attach.items():
+            conn.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+        return conn
+
+    def _get_queue(self, db_path: str) -> queue.Queue:
+        with self._lock:
+            pool = self._queues.get(db_path)
+            if pool is None:
+                pool = queue.Queue(maxsize=self.size)
+                for _ in range(self.size):
+                    pool.put(self._connect(db_path))
+                self._queues[db_path] = pool
+            return pool
+
+    @contextmanager
+    def get_conn(self, db_path: str):
+        """Borrow a connection for `db_path` and return it to the pool afterwards."""
+        pool = self._get_queue(db_path)
+        conn = pool.get()
+        try:
+            yield conn
+        finally:
+            pool.put(conn)
+
+
+_db_pool = DBPool()
+get_conn = _db_pool.get_conn
+# Stocks DB with the economic calendar attached as `econ`, for combined reads
+_calendar_db_pool = DBPool(size=2, attach={"econ": ECONOMIC_DB_PATH})
+
+
+# Indexes on the calendar filter columns. The scrapers rebuild their tables,
+# so these are re-applied after every refresh.
+CALENDAR_INDEXES = {
+    STOCKS_DB_PATH: 'CREATE INDEX IF NOT EXISTS ix_sp500_earning_date ON sp500_earning("Earnings Date")',
+    ECONOMIC_DB_PATH: "CREATE INDEX IF NOT EXISTS ix_economic_events_date ON economic_events(Date)",
+}
+
+# Calendar queries. Kept as constants so each pooled connection reuses its
+# prepared statement from sqlite3's per-connection statement cache.
+STOCKS_UPCOMING_SQL = 'SELECT * FROM sp500_earning WHERE "Earnings Date" BETWEEN ? AND ? ORDER BY "Earnings Date" LIMIT 1000'
+ECONOMIC_UPCOMING_SQL = "SELECT * FROM economic_events WHERE Date BETWEEN ? AND ? ORDER BY Date LIMIT 1000"
+STOCKS_FROM_SQL = 'SELECT * FROM sp500_earning WHERE "Earnings Date" >= ? ORDER BY "Earnings Date"'
+ECONOMIC_FROM_SQL = "SELECT * FROM economic_events WHERE Date >= ? ORDER BY Date"
+STOCKS_ON_DATE_SQL = 'SELECT * FROM sp500_earning WHERE "Earnings Date" = ?'
+ECONOMIC_ON_DATE_SQL = "SELECT * FROM economic_events WHERE Date = ?"
+
+# Combined stocks + economic read over the attached `econ` schema. Each side is
+# padded with NULLs for the other's columns so one UNION ALL returns both;
+# SQLite names are case-insensitive, so the economic "Link" shares `link`.
+_STOCK_UNION_COLS = ('"Earnings Date"', "ticker", "company_name", "market_cap", "price",
+                     "change_pct", "revenue", '"Price Target"', "analysts", "link")
+_ECON_UNION_COLS = ("Date", "Time", "Country", "Event",
+                    "Actual", "Previous", "Consensus", "Forecast")
+
+
+def _calendar_union_sql(stock_where: str, econ_where: str, limit: str = "") -> str:
+    """Build a UNION ALL query over sp500_earning and econ.economic_events."""
+    stock_select = ", ".join(_STOCK_UNION_COLS + tuple(f"NULL AS {c}" for c in _ECON_UNION_COLS))
+    econ_select = ", ".join(("NULL",) * (len(_STOCK_UNION_COLS) - 1) + ("Link",) + _ECON_UNION_COLS)
+    return (
+        f'SELECT * FROM (SELECT \'stock\' AS typ, "Earnings Date" AS sort_date, {stock_select} '
+        f'FROM main.sp500_earning WHERE {stock_where} ORDER BY "Earnings Date" {limit}) '
+        f"UNION ALL SELECT * FROM (SELECT 'economic', Date, {econ_select} "
+        f"FROM econ.economic_events WHERE {econ_where} ORDER BY Date {limit}) "
+        "ORDER BY sort_date"
+    )
+
+
+CALENDAR_UPCOMING_SQL = _calendar_union_sql('"Earnings Date" BETWEEN ? AND ?', "Date BETWEEN ? AND ?", "LIMIT 1000")
+CALENDAR_ON_DATE_SQL = _calendar_union_sql('"Earnings Date" = ?', "Date = ?")
+
+# How far ahead /api/calendar looks for earnings and economic events
+CALENDAR_HORIZON_DAYS = 90
+
+
+def _ensure_indexes() -> None:
+    """Create date indexes on the calendar tables if the databases exist."""
+    for db_path, ddl in CALENDAR_INDEXES.items():
+        if not os.path.exists(db_path):
+            continue
+        try:
+            with get_conn(db_path) as conn:
+                conn.execute(ddl)
+        except sqlite3.OperationalError as e:
+            # Table not created yet
+            print(f"Skipping index for {os.path.basename(db_path)}: {e}")
+
+
+_ensure_indexes()
+
+
+def query_dicts(db_path: str, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    """Run a SELECT on a pooled connection and return rows as dicts."""
+    with get_conn(db_path) as conn:
+        cursor = conn.execute(sql, params)
+        cols = [c[0] for c in cursor.description]
+        return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+app = FastAPI(
+    title="Macro Trading Terminal",
+    version="3.0",
+    default_response_class=ORJSONResponse
+)
+
+# Blocking handlers are declared with plain `def` so FastAPI runs them in the
+# anyio threadpool; raise its default limit (40) to allow more concurrent calls.
+THREADPOOL_TOKENS = 200
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Raise the anyio worker thread limit used for sync path operations."""
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
 
 # CORS middleware
 app.add_middleware(
@@ -56,12 +220,27 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 # Indicators dictionary with display names
 # Indicators loaded from config
-from config import INDICATORS
+from config import INDICATORS_LIST, CACHE_TTL, get_display_name
 
 # Global predictor instance
 _predictor = None
+_PREDICTOR_INIT_LOCK = threading.Lock()
+# The predictor holds the currently loaded series (df, series_id, inferred_freq),
+# so each fetch + fit/correlate sequence must run alone (handlers are threaded)
+_PREDICTOR_STATE_LOCK = threading.Lock()
 # Cache for precomputed best models
 PRECOMPUTED_MODELS: Dict[str, Any] = {}
+# Precompute worker output, re-parsed only when its mtime changes
+PRECOMPUTED_JSON_PATH = os.path.join(DATA_DIR, "precomputed_models.json")
+# Shared with precompute_worker.py (WRITE_LOCK_FILE) around every write of the file
+PRECOMPUTED_WRITE_LOCK_PATH = PRECOMPUTED_JSON_PATH + ".lock"
+_DISK_CACHE: Dict[str, Any] = {"mtime": 0.0, "data": {}}
+_DISK_CACHE_LOCK = threading.Lock()
+# Guards PRECOMPUTED_MODELS mutations and the in-flight computation map
+_PRECOMPUTED_LOCK = threading.Lock()
+_INFLIGHT: Dict[str, concurrent.futures.Future] = {}
+# Single thread so cache writes to disk never interleave
+_PERSIST_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 def get_predictor() -> PredictorCore:
     """Get or create PredictorCore instance"""
@@ -69,7 +248,9 @@ def get_predictor() -> PredictorCore:
     if _predictor is None:
         if not FRED_API_KEY:
             raise HTTPException(status_code=500, detail="FRED_API_KEY not configured in .env")
-        _predictor = PredictorCore(FRED_API_KEY)
+        with _PREDICTOR_INIT_LOCK:
+            if _predictor is None:
+                _predictor = PredictorCore(FRED_API_KEY)
     return _predictor
 
 def sanitize_for_json(obj):
@@ -86,20 +267,132 @@ def sanitize_for_json(obj):
         return obj
 
 
+# Release date formats tried before falling back to dateutil's fuzzy parser
+RELEASE_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%b %d, %Y", "%B %d, %Y")
+
+
+@lru_cache(maxsize=4096)
+def _parse_release(release_text: str) -> Optional[str]:
+    """
+    Parse a FRED release date string to a YYYY-MM-DD key.
+    
+    Tries datetime.fromisoformat and a few strptime formats before the
+    (much slower) fuzzy dateutil parser. Returns None if unparseable.
+    """
+    text = release_text.strip()
+    try:
+        return datetime.fromisoformat(text).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+    for fmt in RELEASE_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    try:
+        return date_parser.parse(text, fuzzy=True).strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        return None
+
+
+def load_disk_cache() -> Dict[str, Any]:
+    """
+    Return the contents of precomputed_models.json, re-parsing it only when
+    the file's mtime changes. Newer entries are merged into PRECOMPUTED_MODELS.
+    """
+    try:
+        mtime = os.stat(PRECOMPUTED_JSON_PATH).st_mtime
+    except OSError:
+        return _DISK_CACHE["data"]
+    if mtime == _DISK_CACHE["mtime"]:
+        return _DISK_CACHE["data"]
+    
+    with _DISK_CACHE_LOCK:
+        if mtime != _DISK_CACHE["mtime"]:
+            with open(PRECOMPUTED_JSON_PATH, "rb") as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # json.dump writes NaN/Infinity tokens, which orjson rejects
+                data = json.loads(raw)
+            
+            with _PRECOMPUTED_LOCK:
+                for sid, entry in data.items():
+                    current = PRECOMPUTED_MODELS.get(sid)
+                    if current is None or entry.get("computed_at", "") > current.get("computed_at", ""):
+                        PRECOMPUTED_MODELS[sid] = entry
+            _DISK_CACHE.update(mtime=mtime, data=data)
+    return _DISK_CACHE["data"]
+
+
+def persist_precomputed() -> None:
+    """
+    Write PRECOMPUTED_MODELS to precomputed_models.json atomically.
+    Runs on _PERSIST_POOL so HTTP responses don't wait on disk.
+    """
+    try:
+        # The precompute worker writes the same file; hold the shared write
+        # lock across read-merge-replace so neither side drops the other's entries
+        lock = lock_file(PRECOMPUTED_WRITE_LOCK_PATH)
+        try:
+            # Pull in anything the worker wrote since our last read
+            load_disk_cache()
+            with _PRECOMPUTED_LOCK:
+                snapshot = dict(PRECOMPUTED_MODELS)
+            
+            tmp_path = PRECOMPUTED_JSON_PATH + ".tmp"
+            with _DISK_CACHE_LOCK:
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(snapshot, option=orjson.OPT_SERIALIZE_NUMPY))
+                os.replace(tmp_path, PRECOMPUTED_JSON_PATH)
+                # Our own write shouldn't trigger a re-parse
+                _DISK_CACHE.update(mtime=os.stat(PRECOMPUTED_JSON_PATH).st_mtime, data=snapshot)
+        finally:
+            release_lock_file(lock)
+    except Exception as e:
+        print(f"Error persisting precompute cache: {e}")
+
+
+def _compute_precomputed_entry(series_id: str) -> Dict[str, Any]:
+    """Run best-model search for a series and build its cache entry."""
+    core = get_predictor()
+    with _PREDICTOR_STATE_LOCK:
+        core.fetch_data(series_id)
+        result = core.find_best_model(n_test=12, h_future=6)
+    
+    # Sanitize result before caching and returning
+    sanitized_result = sanitize_for_json(result)
+    
+    return {
+        "result": sanitized_result,
+        "best_model": sanitized_result.get("best_model", "unknown") if isinstance(sanitized_result, dict) else "unknown",
+        "computed_at": datetime.now().isoformat()
+    }
+
+
+
+PRECOMPUTE_LOCK_PATH = os.path.join(DATA_DIR, "precompute.lock")
+
 
 def precompute_all_models():
     """
     Launch background worker to precompute models.
     Uses subprocess to avoid blocking the main server thread/GIL.
+    Skipped if another worker already holds the precompute lock file.
     """
-    import subprocess
     import sys
+    from src.utils import try_lock_file, release_lock_file
     
     script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "precompute_worker.py")
     
-    # Check if worker is already running (simple check)
-    # Windows doesn't have easy 'pgrep', so we just blindly launch or rely on lock file.
-    # For this MVP, we just launch.
+    # The worker takes this lock for its whole run; if we can't get it, one is already running.
+    # (If two servers race past this check, the second worker exits on its own lock attempt.)
+    lock = try_lock_file(PRECOMPUTE_LOCK_PATH)
+    if lock is None:
+        print("[*] Precomputation worker already running, skipping launch")
+        return
+    release_lock_file(lock)
     
     try:
         if os.name == 'nt':
@@ -113,8 +406,11 @@ def precompute_all_models():
     except Exception as e:
         print(f"[!] Failed to start precomputation worker: {e}")
 
-# Start precomputation on module load
-precompute_all_models()
+
+@app.on_event("startup")
+async def start_precompute_worker():
+    """Start precomputation when the server starts (not on plain module import)."""
+    precompute_all_models()
 
 
 
@@ -146,63 +442,162 @@ async def home(request: Request):
 # API ROUTES
 # ============================================
 
-@app.get("/api/calendar")
-async def get_calendar():
+# Shared executor for calendar data sources (FRED scraping + SQLite reads)
+_CALENDAR_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+# In-memory cache of the assembled /api/calendar payload (pre-serialized JSON bytes)
+_CAL_CACHE: Dict[str, Any] = {"date": None, "payload": None, "built_at": 0.0}
+
+
+def invalidate_calendar_cache() -> None:
+    """Drop the cached calendar payload (called after data refreshes)."""
+    _CAL_CACHE["payload"] = None
+    _CAL_CACHE["built_at"] = 0.0
+
+
+@lru_cache(maxsize=256)
+def _release_for_day(core: PredictorCore, sid: str, day: str) -> str:
+    """Next release text for a series, memoised per day (FRED dates don't move intra-day)."""
+    next_date = core.get_next_release(sid)
+    if next_date == "N/A":
+        # Scrape failed - raise so lru_cache does not memoise it
+        raise LookupError(f"Release date unavailable for {sid}")
+    return next_date
+
+
+def get_next_release_cached(core: PredictorCore, sid: str, day: Optional[str] = None) -> str:
+    """Get next release date for a series through the per-day cache (`day` defaults to today)."""
+    try:
+        return _release_for_day(core, sid, day or date.today().isoformat())
+    except LookupError:
+        return "N/A"
+
+
+def _fetch_release_date(core: PredictorCore, sid: str, day: str) -> str:
+    """Fetch next release date for a FRED series."""
+    try:
+        # Try to get next release from core (cached or fast)
+        next_date = get_next_release_cached(core, sid, day)
+        return next_date or "TBD"
+    except Exception as e:
+        print(f"Error fetching release for {sid}: {e}")
+        return "TBD"
+
+
+def _fetch_stock_rows(today_str: str, end_str: str) -> List[Dict[str, Any]]:
+    """Fetch S&P 500 earnings rows between today and the calendar horizon."""
+    if not os.path.exists(STOCKS_DB_PATH):
+        return []
+    try:
+        return query_dicts(STOCKS_DB_PATH, STOCKS_UPCOMING_SQL, (today_str, end_str))
+    except Exception as e:
+        print(f"Error fetching stocks: {e}")
+        return []
+
+
+def _fetch_economic_rows(today_str: str, end_str: str) -> List[Dict[str, Any]]:
+    """Fetch economic calendar rows between today and the calendar horizon."""
+    if not os.path.exists(ECONOMIC_DB_PATH):
+        return []
+    try:
+        return query_dicts(ECONOMIC_DB_PATH, ECONOMIC_UPCOMING_SQL, (today_str, end_str))
+    except Exception as e:
+        print(f"Error fetching economic calendar: {e}")
+        return []
+
+
+def _fetch_db_rows(sql: str, params: tuple, stock_fallback, econ_fallback):
+    """
+    Fetch (stock_rows, economic_rows) with one UNION ALL query when both
+    databases exist, otherwise with the per-database fallback callables.
+    """
+    if os.path.exists(STOCKS_DB_PATH) and os.path.exists(ECONOMIC_DB_PATH):
+        try:
+            with _calendar_db_pool.get_conn(STOCKS_DB_PATH) as conn:
+                cursor = conn.execute(sql, params)
+                cols = [c[0] for c in cursor.description]
+                rows = [dict(zip(cols, row)) for row in cursor.fetchall()]
+            stock_rows, economic_rows = [], []
+            for row in rows:
+                if row["typ"] == "stock":
+                    stock_rows.append(row)
+                else:
+                    row["Link"] = row.pop("link")
+                    economic_rows.append(row)
+            return stock_rows, economic_rows
+        except sqlite3.Error as e:
+            # e.g. one of the tables not created yet
+            print(f"Combined calendar query failed, using separate queries: {e}")
+    return stock_fallback(), econ_fallback()
+
+
+@app.get("/api/calendar", response_model=None, response_class=ORJSONResponse)
+def get_calendar() -> Response:
     """Get calendar of indicators grouped by release date (Chronological)"""
     try:
+        # Serve cached payload while it is fresh and from the same day
+        today = date.today()
+        today_str = today.strftime("%Y-%m-%d")
+        if (
+            _CAL_CACHE["payload"] is not None
+            and _CAL_CACHE["date"] == today_str
+            and time.monotonic() - _CAL_CACHE["built_at"] < CACHE_TTL["calendar"]
+        ):
+            return Response(content=_CAL_CACHE["payload"], media_type="application/json")
+        
         core = get_predictor()
-        from dateutil import parser
-        import concurrent.futures
         
         # Build calendar data
-        calendar_data = {}
+        calendar_data: Dict[str, List[Dict]] = defaultdict(list)
         
-        # Helper function for parallel execution
-        def fetch_date(sid, meta):
-            """Fetch next release date for a FRED series."""
-            try:
-                # Try to get next release from core (cached or fast)
-                next_date = core.get_next_release(sid)
-                return sid, meta, next_date or "TBD"
-            except Exception as e:
-                print(f"Error fetching release for {sid}: {e}")
-                return sid, meta, "TBD"
-
-        # Run fetching in parallel threads
-        results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_sid = {executor.submit(fetch_date, sid, meta): sid for sid, meta in INDICATORS.items()}
-            for future in concurrent.futures.as_completed(future_to_sid):
-                results.append(future.result())
+        # Run all data sources in parallel on the shared pool. The local DB
+        # read goes first so it doesn't queue behind the FRED network calls.
+        end_str = (today + timedelta(days=CALENDAR_HORIZON_DAYS)).strftime("%Y-%m-%d")
+        db_future = _CALENDAR_POOL.submit(
+            _fetch_db_rows,
+            CALENDAR_UPCOMING_SQL,
+            (today_str, end_str, today_str, end_str),
+            lambda: _fetch_stock_rows(today_str, end_str),
+            lambda: _fetch_economic_rows(today_str, end_str)
+        )
+        fred_futures = [
+            _CALENDAR_POOL.submit(_fetch_release_date, core, record[0], today_str)
+            for record in INDICATORS_LIST
+        ]
+        concurrent.futures.wait(
+            fred_futures + [db_future],
+            return_when=concurrent.futures.ALL_COMPLETED
+        )
+        stock_rows, economic_rows = db_future.result()
+        results = [
+            (*record, future.result())
+            for record, future in zip(INDICATORS_LIST, fred_futures)
+        ]
 
         # Process results
-        for sid, meta, next_date in results:
+        for sid, name, display_name, category, next_date in results:
             try:
                 # Normalize date key to ISO format for sorting
                 date_key = "9999-12-31" # Default for TBD/Error (end of list)
                 display_date = next_date
                 
                 if next_date not in ["TBD", "N/A", "Error"]:
-                    try:
-                        # Try parsing date
-                        dt = parser.parse(next_date, fuzzy=True)
-                        date_key = dt.strftime("%Y-%m-%d")
+                    parsed_key = _parse_release(next_date)
+                    if parsed_key:
+                        date_key = parsed_key
                         display_date = date_key # Use ISO for key
-                    except:
+                    else:
                         # If parsing fails or TBD, default to today to ensure it's visible in Daily AI
-                        date_key = date.today().strftime("%Y-%m-%d")
+                        date_key = today_str
                 else:
                     # If date is TBD/Error, pin to today so it's visible in Daily AI as "Active Indicators"
-                    date_key = date.today().strftime("%Y-%m-%d")
-                
-                if date_key not in calendar_data:
-                    calendar_data[date_key] = []
+                    date_key = today_str
                 
                 calendar_data[date_key].append({
                     "series_id": sid,
-                    "name": meta["name"],
-                    "display_name": meta["display_name"],
-                    "category": meta["category"],
+                    "name": name,
+                    "display_name": display_name,
+                    "category": category,
                     "release_text": next_date, # Keep original text for display
                     "sort_date": date_key,
                     "link": f"https://fred.stlouisfed.org/series/{sid}"
@@ -212,74 +607,51 @@ async def get_calendar():
                 continue
         
         # ====== DODAJ DANE SPÓŁEK S&P 500 ======
-        if os.path.exists(STOCKS_DB_PATH):
-            try:
-                conn = sqlite3.connect(STOCKS_DB_PATH)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                # Fetch earnings for today and future
-                today_str = date.today().strftime("%Y-%m-%d")
-                cursor.execute("SELECT * FROM sp500_earning WHERE \"Earnings Date\" >= ? ORDER BY \"Earnings Date\" LIMIT 1000", (today_str,))
-                for row in cursor.fetchall():
-                    stock = dict(row)
-                    d_key = stock.get("Earnings Date", "9999-12-31")
-                    if d_key not in calendar_data:
-                        calendar_data[d_key] = []
-                    
-                    calendar_data[d_key].append({
-                        "type": "stock",
-                        "series_id": f"STOCK_{stock.get('ticker')}",
-                        "ticker": stock.get("ticker"),
-                        "name": stock.get("company_name"),
-                        "display_name": f"{stock.get('ticker')} - {stock.get('company_name')}",
-                        "market_cap": stock.get("market_cap"),
-                        "price": stock.get("price"),
-                        "change_pct": stock.get("change%"),
-                        "revenue": stock.get("revenue"),
-                        "price_target": stock.get("Price Target"),
-                        "analysts": stock.get("analysts"),
-                        "link": stock.get("link"),
-                        "category": "Earnings",
-                        "release_text": stock.get("Earnings Date"),
-                        "sort_date": d_key
-                    })
-                conn.close()
-            except Exception as e:
-                print(f"Error merging stocks: {e}")
+        try:
+            for stock in stock_rows:
+                d_key = stock.get("Earnings Date", "9999-12-31")
+                calendar_data[d_key].append({
+                    "type": "stock",
+                    "series_id": f"STOCK_{stock.get('ticker')}",
+                    "ticker": stock.get("ticker"),
+                    "name": stock.get("company_name"),
+                    "display_name": f"{stock.get('ticker')} - {stock.get('company_name')}",
+                    "market_cap": stock.get("market_cap"),
+                    "price": stock.get("price"),
+                    "change_pct": stock.get("change_pct"),
+                    "revenue": stock.get("revenue"),
+                    "price_target": stock.get("Price Target"),
+                    "analysts": stock.get("analysts"),
+                    "link": stock.get("link"),
+                    "category": "Earnings",
+                    "release_text": stock.get("Earnings Date"),
+                    "sort_date": d_key
+                })
+        except Exception as e:
+            print(f"Error merging stocks: {e}")
         
         # ====== DODAJ KALENDARZ EKONOMICZNY ======
-        if os.path.exists(ECONOMIC_DB_PATH):
-            try:
-                conn = sqlite3.connect(ECONOMIC_DB_PATH)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                today_str = date.today().strftime("%Y-%m-%d")
-                cursor.execute("SELECT * FROM economic_events WHERE Date >= ? ORDER BY Date LIMIT 1000", (today_str,))
-                for row in cursor.fetchall():
-                    event = dict(row)
-                    d_key = event.get("Date")
-                    if d_key not in calendar_data:
-                        calendar_data[d_key] = []
-                        
-                    calendar_data[d_key].append({
-                        "type": "economic",
-                        "series_id": f"ECON_{event.get('Event')[:30]}",
-                        "name": event.get("Event"),
-                        "display_name": event.get("Event"),
-                        "category": "Economic Calendar",
-                        "time": event.get("Time"),
-                        "country": event.get("Country"),
-                        "actual": event.get("Actual"),
-                        "previous": event.get("Previous"),
-                        "consensus": event.get("Consensus"),
-                        "forecast": event.get("Forecast"),
-                        "link": event.get("Link"),
-                        "release_text": f"{event.get('Time')} {event.get('Country')}",
-                        "sort_date": d_key
-                    })
-                conn.close()
-            except Exception as e:
-                print(f"Error merging economic calendar: {e}")
+        try:
+            for event in economic_rows:
+                d_key = event.get("Date")
+                calendar_data[d_key].append({
+                    "type": "economic",
+                    "series_id": f"ECON_{event.get('Event')[:30]}",
+                    "name": event.get("Event"),
+                    "display_name": event.get("Event"),
+                    "category": "Economic Calendar",
+                    "time": event.get("Time"),
+                    "country": event.get("Country"),
+                    "actual": event.get("Actual"),
+                    "previous": event.get("Previous"),
+                    "consensus": event.get("Consensus"),
+                    "forecast": event.get("Forecast"),
+                    "link": event.get("Link"),
+                    "release_text": f"{event.get('Time')} {event.get('Country')}",
+                    "sort_date": d_key
+                })
+        except Exception as e:
+            print(f"Error merging economic calendar: {e}")
         
         print("DEBUG: Calendar fetch complete, returning data")
         
@@ -287,62 +659,57 @@ async def get_calendar():
         sorted_keys = sorted(calendar_data.keys())
         sorted_calendar = {k: calendar_data[k] for k in sorted_keys}
         
-        return sorted_calendar
+        # Serialize once with orjson; bypasses jsonable_encoder and is reused from cache
+        payload = orjson.dumps(sorted_calendar)
+        _CAL_CACHE.update(date=today_str, payload=payload, built_at=time.monotonic())
+        return Response(content=payload, media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/calendar/stocks")
-async def get_stocks_calendar():
+@app.get("/api/calendar/stocks", response_model=None, response_class=ORJSONResponse)
+def get_stocks_calendar() -> ORJSONResponse:
     """Get S&P 500 earnings calendar from SQLite database"""
     try:
         if not os.path.exists(STOCKS_DB_PATH):
-            return {"error": "Database not found. Run tickery.py first."}
+            return ORJSONResponse({"error": "Database not found. Run tickery.py first."})
         
         today_str = date.today().strftime("%Y-%m-%d")
-        conn = sqlite3.connect(STOCKS_DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM sp500_earning WHERE \"Earnings Date\" >= ? ORDER BY \"Earnings Date\"", (today_str,))
-        stocks = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return {"count": len(stocks), "stocks": stocks}
+        stocks = query_dicts(STOCKS_DB_PATH, STOCKS_FROM_SQL, (today_str,))
+        
+        return ORJSONResponse({"count": len(stocks), "stocks": stocks})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/calendar/economic")
-async def get_economic_calendar():
+@app.get("/api/calendar/economic", response_model=None, response_class=ORJSONResponse)
+def get_economic_calendar() -> ORJSONResponse:
     """Get economic calendar from SQLite database"""
     try:
         if not os.path.exists(ECONOMIC_DB_PATH):
-            return {"error": "Database not found. Run TE.py first."}
+            return ORJSONResponse({"error": "Database not found. Run TE.py first."})
         
         today_str = date.today().strftime("%Y-%m-%d")
-        conn = sqlite3.connect(ECONOMIC_DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM economic_events WHERE Date >= ? ORDER BY Date", (today_str,))
-        events = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return {"count": len(events), "events": events}
+        events = query_dicts(ECONOMIC_DB_PATH, ECONOMIC_FROM_SQL, (today_str,))
+        
+        return ORJSONResponse({"count": len(events), "events": events})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/refresh/stocks")
-async def refresh_stocks_data():
+def refresh_stocks_data():
     """Refresh S&P 500 stocks data using StocksScraper"""
     try:
         from src.integrations import StocksScraper
         
-        scraper = StocksScraper(db_path=STOCKS_DB_PATH)
-        df = scraper.run()
+        with StocksScraper(db_path=STOCKS_DB_PATH) as scraper:
+            df = scraper.run()
         
         if not df.empty:
+            _ensure_indexes()
+            invalidate_calendar_cache()
             return {"status": "success", "message": f"Stocks data refreshed successfully ({len(df)} stocks)"}
         else:
             return {"status": "error", "message": "No data retrieved"}
@@ -350,16 +717,26 @@ async def refresh_stocks_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Warm browser reused across refreshes; one refresh drives it at a time
+_economic_scraper = None
+_ECONOMIC_SCRAPER_LOCK = threading.Lock()
+
+
 @app.post("/api/refresh/economic")
-async def refresh_economic_data():
+def refresh_economic_data():
     """Refresh economic calendar data using EconomicCalendarScraper"""
+    global _economic_scraper
     try:
         from src.integrations import EconomicCalendarScraper
         
-        scraper = EconomicCalendarScraper(db_path=ECONOMIC_DB_PATH, headless=True)
-        df = scraper.run()
+        with _ECONOMIC_SCRAPER_LOCK:
+            if _economic_scraper is None:
+                _economic_scraper = EconomicCalendarScraper(db_path=ECONOMIC_DB_PATH, headless=True)
+            df = _economic_scraper.run()
         
         if not df.empty:
+            _ensure_indexes()
+            invalidate_calendar_cache()
             return {"status": "success", "message": f"Economic calendar refreshed successfully ({len(df)} events)"}
         else:
             return {"status": "error", "message": "No data retrieved"}
@@ -367,62 +744,73 @@ async def refresh_economic_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.on_event("shutdown")
+def close_economic_scraper():
+    """Quit the warm Chrome instance kept by refresh_economic_data."""
+    with _ECONOMIC_SCRAPER_LOCK:
+        if _economic_scraper is not None:
+            _economic_scraper.close()
+
+
+# Browsers may reuse a precomputed result for this long before revalidating
+PRECOMPUTED_MAX_AGE = 60
+
+
 @app.get("/api/precomputed/{series_id}")
-async def get_precomputed_model(series_id: str):
+def get_precomputed_model(series_id: str, request: Request):
     """
     Get precomputed best model results for a FRED series.
     Returns cached results if available, otherwise computes on-demand.
+    Cached results carry an ETag so polling clients get 304 Not Modified.
     """
     try:
+        # Pick up new worker output (cheap stat unless the file changed)
+        try:
+            load_disk_cache()
+        except Exception as e:
+            print(f"Error reading precompute cache: {e}")
+        
         # Check cache first
         if series_id in PRECOMPUTED_MODELS and "result" in PRECOMPUTED_MODELS[series_id]:
             cached = PRECOMPUTED_MODELS[series_id]
-            return sanitize_for_json({
+            # computed_at changes whenever the entry is recomputed
+            headers = {
+                "ETag": f'"{series_id}-{cached["computed_at"]}"',
+                "Cache-Control": f"max-age={PRECOMPUTED_MAX_AGE}"
+            }
+            if request.headers.get("if-none-match") == headers["ETag"]:
+                return Response(status_code=304, headers=headers)
+            return ORJSONResponse(sanitize_for_json({
                 "cached": True,
                 "best_model": cached["best_model"],
                 "computed_at": cached["computed_at"],
                 "result": cached["result"]
-            })
+            }), headers=headers)
+        
+        # Compute on-demand if not cached; concurrent requests share one computation
+        with _PRECOMPUTED_LOCK:
+            future = _INFLIGHT.get(series_id)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                _INFLIGHT[series_id] = future
         
-        # Check disk cache (JSON file)
-        import json
-        json_path = os.path.join(DATA_DIR, "precomputed_models.json")
-        if os.path.exists(json_path):
+        if is_owner:
             try:
-                # Optimized: Only read if we assume it might be there. 
-                # Reading whole file every request is slow, but better than recomputing.
-                # Ideally we should load this into memory periodically or on demand.
-                with open(json_path, 'r') as f:
-                    disk_cache = json.load(f)
-                    if series_id in disk_cache and "result" in disk_cache[series_id]:
-                        # Update memory cache
-                        PRECOMPUTED_MODELS[series_id] = disk_cache[series_id]
-                        cached = disk_cache[series_id]
-                        return sanitize_for_json({
-                            "cached": True,
-                            "source": "disk",
-                            "best_model": cached["best_model"],
-                            "computed_at": cached["computed_at"],
-                            "result": cached["result"]
-                        })
+                entry = _compute_precomputed_entry(series_id)
+                with _PRECOMPUTED_LOCK:
+                    PRECOMPUTED_MODELS[series_id] = entry
+                future.set_result(entry)
+                _PERSIST_POOL.submit(persist_precomputed)
             except Exception as e:
-                print(f"Error reading precompute cache: {e}")
-
-        
-        # Compute on-demand if not cached
-        core = get_predictor()
-        core.fetch_data(series_id)
-        result = core.find_best_model(n_test=12, h_future=6)
+                future.set_exception(e)
+                raise
+            finally:
+                with _PRECOMPUTED_LOCK:
+                    _INFLIGHT.pop(series_id, None)
         
-        # Sanitize result before caching and returning
-        sanitized_result = sanitize_for_json(result)
-        
-        # Cache the result
-        PRECOMPUTED_MODELS[series_id] = {
-            "result": sanitized_result,
-            "best_model": sanitized_result.get("best_model", "unknown") if isinstance(sanitized_result, dict) else "unknown",
-            "computed_at": datetime.now().isoformat()
-        }
+        entry = future.result()
+        sanitized_result = entry["result"]
         
         return {
             "cached": False,
@@ -433,55 +821,58 @@ async def get_precomputed_model(series_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/precomputed")
-async def get_all_precomputed():
-    """Get status of all precomputed models."""
-    return {
-        "count": len(PRECOMPUTED_MODELS),
-        "ready": sum(1 for v in PRECOMPUTED_MODELS.values() if "result" in v),
-        "errors": sum(1 for v in PRECOMPUTED_MODELS.values() if "error" in v),
+@app.get("/api/precomputed", response_model=None, response_class=ORJSONResponse)
+async def get_all_precomputed() -> ORJSONResponse:
+    """Get status of all precomputed models (memory only, no I/O)."""
+    # Snapshot: worker threads may add entries while we iterate
+    models = dict(PRECOMPUTED_MODELS)
+    return ORJSONResponse({
+        "count": len(models),
+        "ready": sum(1 for v in models.values() if "result" in v),
+        "errors": sum(1 for v in models.values() if "error" in v),
         "models": {
             sid: {
                 "best_model": v.get("best_model", "pending" if "error" not in v else "error"),
                 "computed_at": v.get("computed_at"),
                 "error": v.get("error")
             }
-            for sid, v in PRECOMPUTED_MODELS.items()
+            for sid, v in models.items()
         }
-    }
+    })
 
 @app.post("/api/analyze")
-async def analyze(req: AnalysisRequest):
+def analyze(req: AnalysisRequest):
     """Run analysis on indicator with selected model"""
     try:
         core = get_predictor()
-        core.fetch_data(req.series_id, n_test=req.n_test)
-        
-        if req.model_type == "ARIMA":
-            order = tuple(req.order) if req.order else (1, 1, 1)
-            results = core.analyze_arima(
-                order=order,
-                n_test=req.n_test,
-                h_future=req.h_future
-            )
-        elif req.model_type == "MovingAverage":
-            results = core.analyze_moving_average(
-                windows=req.windows or [3],
-                n_test=req.n_test,
-                h_future=req.h_future
-            )
-        elif req.model_type == "MonteCarlo":
-            results = core.analyze_monte_carlo(
-                simulations=req.simulations or 1000,
-                n_test=req.n_test,
-                h_future=req.h_future
-            )
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported model type: {req.model_type}")
+        with _PREDICTOR_STATE_LOCK:
+            core.fetch_data(req.series_id, n_test=req.n_test)
+            
+            if req.model_type == "ARIMA":
+                order = tuple(req.order) if req.order else (1, 1, 1)
+                results = core.analyze_arima(
+                    order=order,
+                    n_test=req.n_test,
+                    h_future=req.h_future
+                )
+            elif req.model_type == "MovingAverage":
+                results = core.analyze_moving_average(
+                    windows=req.windows or [3],
+                    n_test=req.n_test,
+                    h_future=req.h_future
+                )
+            elif req.model_type == "MonteCarlo":
+                results = core.analyze_monte_carlo(
+                    simulations=req.simulations or 1000,
+                    n_test=req.n_test,
+                    h_future=req.h_future
+                )
+            else:
+                raise HTTPException(status_code=400, detail=f"Unsupported model type: {req.model_type}")
         
         # Add metadata
         results["series_id"] = req.series_id
-        results["series_name"] = INDICATORS.get(req.series_id, {}).get("display_name", req.series_id)
+        results["series_name"] = get_display_name(req.series_id)
         results["fred_link"] = f"https://fred.stlouisfed.org/series/{req.series_id}"
         
         return results
@@ -491,21 +882,21 @@ async def analyze(req: AnalysisRequest):
 
 
 @app.get("/api/correlation/{series_id}")
-async def get_correlation(series_id: str):
+def get_correlation(series_id: str):
     """Get market correlation analysis for indicator"""
     try:
         core = get_predictor()
-        # core.fetch_data(series_id) # Assumes data already fetched by analyze, but safest to fetch if missing
-        if core.series_id != series_id or core.df is None:
-             core.fetch_data(series_id)
-             
-        correlations = core.get_market_correlation(series_id)
+        with _PREDICTOR_STATE_LOCK:
+            # Reuse the series loaded by analyze when it matches, otherwise fetch it
+            if core.series_id != series_id or core.df is None:
+                core.fetch_data(series_id)
+            correlations = core.get_market_correlation(series_id)
         return correlations
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/market_glance")
-async def get_market_glance():
+def get_market_glance():
     """Get Top ETF overview"""
     try:
         core = get_predictor()
@@ -518,29 +909,29 @@ class ResearchRequest(BaseModel):
     query: Optional[str] = None
 
 @app.post("/api/research")
-async def post_research(req: ResearchRequest):
+def post_research(req: ResearchRequest):
     """Get Perplexity AI research with custom query (POST)"""
     try:
         core = get_predictor()
-        indicator_name = INDICATORS.get(req.series_id, {}).get("display_name", req.series_id)
+        indicator_name = get_display_name(req.series_id)
         custom_query = req.query if req.query else indicator_name
         return core.get_perplexity_research(req.series_id, custom_query)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/research/{series_id}")
-async def get_research(series_id: str):
+def get_research(series_id: str):
     """Get Perplexity AI research (GET - for backward compatibility)"""
     try:
         core = get_predictor()
-        indicator_name = INDICATORS.get(series_id, {}).get("display_name", series_id)
+        indicator_name = get_display_name(series_id)
         return core.get_perplexity_research(series_id, indicator_name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/news/{series_id}")
-async def get_news(series_id: str):
+def get_news(series_id: str):
     """Get news sentiment analysis for indicator"""
     try:
         core = get_predictor()
@@ -551,25 +942,42 @@ async def get_news(series_id: str):
 
 
 @app.get("/api/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
+async def health_check() -> ORJSONResponse:
+    """Health check endpoint (memory only, runs inline on the event loop)"""
+    return ORJSONResponse({
         "status": "healthy",
         "fred_api": bool(FRED_API_KEY),
         "perplexity_api": bool(os.getenv("PERPLEXITY_API_KEY")),
         "news_api": bool(os.getenv("NEWS_API_KEY")),
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 
 # ============================================
 # YAHOO FINANCE CHART DATA
 # ============================================
 
+# Per-ticker chart payloads: TICKER -> (built_at monotonic, payload);
+# insertion order doubles as LRU order, oldest evicted beyond CHART_CACHE_SIZE
+CHART_CACHE_SIZE = 256
+_CHART_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_CHART_CACHE_LOCK = threading.Lock()
+
+
 @app.get("/api/stocks/chart/{ticker}")
-async def get_stock_chart(ticker: str):
+def get_stock_chart(ticker: str):
     """Get 1-year price history for a stock from Yahoo Finance"""
     try:
+        # Tickers are case-insensitive; one cache entry per symbol
+        ticker = ticker.strip().upper()
+        with _CHART_CACHE_LOCK:
+            cached = _CHART_CACHE.get(ticker)
+            if cached:
+                if time.monotonic() - cached[0] < CACHE_TTL["stock_chart"]:
+                    _CHART_CACHE.move_to_end(ticker)
+                    return cached[1]
+                del _CHART_CACHE[ticker]
+        
         import yfinance as yf
         
         stock = yf.Ticker(ticker)
@@ -579,16 +987,22 @@ async def get_stock_chart(ticker: str):
             return {"error": f"No data found for {ticker}"}
         
         # Convert to separate arrays for frontend Chart.js
-        dates = [idx.strftime("%Y-%m-%d") for idx, _ in hist.iterrows()]
-        prices = [round(row["Close"], 2) for _, row in hist.iterrows()]
+        dates = hist.index.strftime("%Y-%m-%d").tolist()
+        prices = hist["Close"].round(2).tolist()
         
-        return {
+        payload = {
             "ticker": ticker,
             "period": "1y",
             "count": len(dates),
             "dates": dates,
             "prices": prices
         }
+        with _CHART_CACHE_LOCK:
+            _CHART_CACHE[ticker] = (time.monotonic(), payload)
+            _CHART_CACHE.move_to_end(ticker)
+            while len(_CHART_CACHE) > CHART_CACHE_SIZE:
+                _CHART_CACHE.popitem(last=False)
+        return payload
     except ImportError:
         return {"error": "yfinance not installed. Run: pip install yfinance"}
     except Exception as e:
@@ -599,30 +1013,37 @@ async def get_stock_chart(ticker: str):
 # DAILY AI SUMMARY
 # ============================================
 
+PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+
+# Keep-alive session so repeated summaries reuse the TLS connection
+# (POSTs are not retried: each one is a billed completion)
+_HTTP_SESSION = build_session(pool_connections=4, pool_maxsize=10)
+
+
 class DailySummaryRequest(BaseModel):
     date: str
     events: List[Dict[str, Any]]
 
 @app.post("/api/ai/daily-summary")
-async def generate_daily_summary(req: DailySummaryRequest):
+def generate_daily_summary(req: DailySummaryRequest):
     """Generate AI analytical article for a specific day's events"""
     try:
-        import requests
-        
         PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
         if not PERPLEXITY_API_KEY:
             return {"error": "PERPLEXITY_API_KEY not configured"}
         
         # Build events description
-        events_text = ""
+        parts = []
         for i, event in enumerate(req.events, 1):
-            events_text += f"\n{i}. {event.get('display_name', event.get('name', 'Unknown'))}"
+            title = event.get('display_name', event.get('name', 'Unknown'))
             if event.get('type') == 'stock':
-                events_text += f" (Ticker: {event.get('ticker', '')}, Earnings - Market Cap: {event.get('market_cap', 'N/A')}, Price Target: {event.get('price_target', 'N/A')})"
+                details = f"Ticker: {event.get('ticker', '')}, Earnings - Market Cap: {event.get('market_cap', 'N/A')}, Price Target: {event.get('price_target', 'N/A')}"
             elif event.get('type') == 'economic':
-                events_text += f" (Economic - Previous: {event.get('previous', 'N/A')}, Consensus: {event.get('consensus', 'N/A')})"
+                details = f"Economic - Previous: {event.get('previous', 'N/A')}, Consensus: {event.get('consensus', 'N/A')}"
             else:
-                events_text += f" (FRED ID: {event.get('series_id', '')}, Category: {event.get('category', '')})"
+                details = f"FRED ID: {event.get('series_id', '')}, Category: {event.get('category', '')}"
+            parts.append(f"\n{i}. {title} ({details})")
+        events_text = "".join(parts)
         
         prompt = f"""You are a top-tier financial analyst writing a premium daily market briefing.
 
@@ -672,15 +1093,15 @@ Generate the 5 sections now. Ensure they read like a single high-quality newslet
             "temperature": 0.9  # High temperature for creative analysis
         }
         
-        response = requests.post(
-            "https://api.perplexity.ai/chat/completions",
+        response = _HTTP_SESSION.post(
+            PERPLEXITY_URL,
             headers=headers,
             json=payload,
-            timeout=60
+            timeout=(3.05, 60)
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
             return {
                 "date": req.date,
@@ -695,40 +1116,43 @@ Generate the 5 sections now. Ensure they read like a single high-quality newslet
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/calendar/events-by-date/{target_date}")
-async def get_events_by_date(target_date: str):
+@app.get("/api/calendar/events-by-date/{target_date}", response_model=None, response_class=ORJSONResponse)
+def get_events_by_date(target_date: str) -> ORJSONResponse:
     """Get all events for a specific date"""
     try:
         events = []
         
         # Get FRED events
         core = get_predictor()
-        from dateutil import parser
+        today_str = date.today().strftime("%Y-%m-%d")
         
-        for sid, meta in INDICATORS.items():
+        for sid, name, display_name, category in INDICATORS_LIST:
             try:
-                next_date = core.get_next_release(sid)
+                next_date = get_next_release_cached(core, sid, today_str)
                 if next_date not in ["TBD", "N/A", "Error"]:
-                    dt = parser.parse(next_date, fuzzy=True)
-                    if dt.strftime("%Y-%m-%d") == target_date:
+                    if _parse_release(next_date) == target_date:
                         events.append({
                             "type": "fred",
                             "series_id": sid,
-                            "name": meta["name"],
-                            "display_name": meta["display_name"],
-                            "category": meta["category"]
+                            "name": name,
+                            "display_name": display_name,
+                            "category": category
                         })
             except:
                 continue
         
+        stock_rows, economic_rows = _fetch_db_rows(
+            CALENDAR_ON_DATE_SQL,
+            (target_date, target_date),
+            lambda: query_dicts(STOCKS_DB_PATH, STOCKS_ON_DATE_SQL, (target_date,))
+            if os.path.exists(STOCKS_DB_PATH) else [],
+            lambda: query_dicts(ECONOMIC_DB_PATH, ECONOMIC_ON_DATE_SQL, (target_date,))
+            if os.path.exists(ECONOMIC_DB_PATH) else []
+        )
+        
         # Get stocks
-        if os.path.exists(STOCKS_DB_PATH):
-            conn = sqlite3.connect(STOCKS_DB_PATH)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM sp500_earning WHERE "Earnings Date" = ?', (target_date,))
-            for row in cursor.fetchall():
-                stock = dict(row)
+        if stock_rows:
+            for stock in stock_rows:
                 events.append({
                     "type": "stock",
                     "series_id": f"STOCK_{stock.get('ticker', '')}",
@@ -739,16 +1163,10 @@ async def get_events_by_date(target_date: str):
                     "market_cap": stock.get("market_cap", ""),
                     "price_target": stock.get("Price Target", "")
                 })
-            conn.close()
         
         # Get economic events
-        if os.path.exists(ECONOMIC_DB_PATH):
-            conn = sqlite3.connect(ECONOMIC_DB_PATH)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM economic_events WHERE Date = ?", (target_date,))
-            for row in cursor.fetchall():
-                event = dict(row)
+        if economic_rows:
+            for event in economic_rows:
                 events.append({
                     "type": "economic",
                     "series_id": f"ECON_{event.get('Event', '')[:30]}",
@@ -760,9 +1178,8 @@ async def get_events_by_date(target_date: str):
                     "consensus": event.get("Consensus", ""),
                     "forecast": event.get("Forecast", "")
                 })
-            conn.close()
         
-        return {"date": target_date, "count": len(events), "events": events}
+        return ORJSONResponse({"date": target_date, "count": len(events), "events": events})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
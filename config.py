@@ -3,8 +3,12 @@ Configuration file for Advanced Macro Trading Terminal
 Contains all series definitions, API settings, and default parameters
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
+# Top-level mappings are read-only views (MappingProxyType) - shared module state
 # Economic Indicators Dictionary
-SERIES_DICT = {
+SERIES_DICT = MappingProxyType({
     "consumer_sentiment": "UMCSENT",
     "new_housing_sales": "HSN1F",
     "real_retail": "RRSFS",
@@ -24,10 +28,10 @@ SERIES_DICT = {
     "yield_curve_spread": "T10Y2Y",
     "unrate": "UNRATE",  # Unemployment Rate
     "sp500": "SP500"
-}
+})
 
 # Human-readable names for indicators
-SERIES_NAMES = {
+SERIES_NAMES = MappingProxyType({
     "UMCSENT": "Consumer Sentiment",
     "HSN1F": "New Housing Sales",
     "RRSFS": "Real Retail Sales",
@@ -47,10 +51,10 @@ SERIES_NAMES = {
     "T10Y2Y": "10Y-2Y Treasury Yield Spread",
     "UNRATE": "Unemployment Rate",
     "SP500": "SPX"
-}
+})
 
 # Sector ETFs for correlation analysis
-SECTOR_ETFS = {
+SECTOR_ETFS = MappingProxyType({
     "^GSPC": "S&P 500",
     "XLI": "Industrials",
     "XLV": "Healthcare",
@@ -63,10 +67,10 @@ SECTOR_ETFS = {
     "XLY": "Consumer Discretionary",
     "XLC": "Communication Services",
     "XLE": "Energy"
-}
+})
 
 # Default model parameters
-DEFAULT_PARAMS = {
+DEFAULT_PARAMS = MappingProxyType({
     "ARIMA": {
         "order": (1, 1, 1),
         "n_test": 12,
@@ -82,27 +86,27 @@ DEFAULT_PARAMS = {
         "n_test": 12,
         "h_future": 6
     }
-}
+})
 
 # Chart period options
-CHART_PERIODS = {
+CHART_PERIODS = MappingProxyType({
     "12M": 12,
     "2Y": 24,
     "5Y": 60,
     "10Y": 120,
     "Max": None
-}
+})
 
 # Streamlit page configuration
-PAGE_CONFIG = {
+PAGE_CONFIG = MappingProxyType({
     "page_title": "Advanced Macro Trading Terminal",
     "page_icon": "📊",
     "layout": "wide",
     "initial_sidebar_state": "expanded"
-}
+})
 
 # Color scheme (Bloomberg-inspired)
-COLORS = {
+COLORS = MappingProxyType({
     "primary": "#FF6B00",      # Orange
     "background": "#0A0E27",   # Dark blue
     "card_bg": "#1A1F3A",      # Card background
@@ -111,18 +115,20 @@ COLORS = {
     "positive": "#00FF88",     # Green
     "negative": "#FF4444",     # Red
     "neutral": "#FFD700"       # Gold
-}
+})
 
 # Cache TTL (in seconds)
-CACHE_TTL = {
+CACHE_TTL = MappingProxyType({
     "release_dates": 3600,     # 1 hour
     "market_data": 1800,       # 30 minutes
     "news": 900,               # 15 minutes
-    "perplexity": 3600         # 1 hour
-}
+    "perplexity": 3600,        # 1 hour
+    "calendar": 300,           # 5 minutes
+    "stock_chart": 600         # 10 minutes
+})
 
 # Indicators dictionary with display names and metadata
-INDICATORS = {
+INDICATORS = MappingProxyType({
     "UMCSENT": {"name": "Consumer Sentiment", "display_name": "Consumer Sentiment", "category": "Consumer"},
     "HSN1F": {"name": "New Home Sales", "display_name": "New Home Sales", "category": "Housing"},
     "RRSFS": {"name": "Real Retail Sales", "display_name": "Real Retail Sales", "category": "Consumer"},
@@ -141,5 +147,16 @@ INDICATORS = {
     "STLFSI4": {"name": "Financial Stress Index", "display_name": "St. Louis Fed Financial Stress Index", "category": "Financial"},
     "T10Y2Y": {"name": "Yield Curve (10Y-2Y)", "display_name": "10Y-2Y Treasury Yield Spread", "category": "Rates"},
     "UNRATE": {"name": "Unemployment Rate", "display_name": "Unemployment Rate", "category": "Labor"}
-}
+})
+
+# Immutable (series_id, name, display_name, category) records for hot loops
+INDICATORS_LIST = tuple(
+    (sid, meta["name"], meta["display_name"], meta["category"])
+    for sid, meta in INDICATORS.items()
+)
+
 
+@lru_cache(maxsize=64)
+def get_display_name(series_id: str) -> str:
+    """Display name for a series ID (falls back to the ID itself)."""
+    return INDICATORS.get(series_id, {}).get("display_name", series_id)
@@ -1,27 +1,34 @@
 
 import sqlite3
 import os
+import re
+from contextlib import closing
+
+BRACKETS_RE = re.compile(r'[{}\[\]()]')
 
 def check_db(path, table):
     if not os.path.exists(path):
         print(f"File {path} NOT FOUND")
         return
     try:
-        conn = sqlite3.connect(path)
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
-        res = cursor.fetchone()
-        if res:
-            print(f"Table {table} in {path}: OK")
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            print(f"  Rows count: {count}")
-        else:
-            print(f"Table {table} in {path}: MISSING")
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            print(f"  Existing tables: {tables}")
-        conn.close()
+        # Read-only diagnostic: autocommit, no writes, memory-mapped reads
+        with closing(sqlite3.connect(path, isolation_level=None)) as conn:
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA mmap_size=268435456")
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
+            res = cursor.fetchone()
+            if res:
+                print(f"Table {table} in {path}: OK")
+                # Identifiers can't be bound; the name was just verified against sqlite_master
+                cursor.execute(f'SELECT COUNT(*) FROM "{res[0]}"')
+                count = cursor.fetchone()[0]
+                print(f"  Rows count: {count}")
+            else:
+                print(f"Table {table} in {path}: MISSING")
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = cursor.fetchall()
+                print(f"  Existing tables: {tables}")
     except Exception as e:
         print(f"Error checking {path}: {e}")
 
@@ -32,26 +39,19 @@ def check_js_syntax(path):
     with open(path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    braces = 0
-    brackets = 0
-    parens = 0
-    for i, char in enumerate(content):
-        if char == '{': braces += 1
-        if char == '}': braces -= 1
-        if char == '[': brackets += 1
-        if char == ']': brackets -= 1
-        if char == '(': parens += 1
-        if char == ')': parens -= 1
-        
-        if braces < 0:
-            print(f"Unmatched '}}' at index {i}")
-            break
-        if brackets < 0:
-            print(f"Unmatched ']' at index {i}")
-            break
-        if parens < 0:
-            print(f"Unmatched ')' at index {i}")
+    # Visit only bracket characters (regex scan runs in C), keep a running ledger
+    ledger = {'{': 0, '[': 0, '(': 0}
+    closers = {'}': '{', ']': '[', ')': '('}
+    for match in BRACKETS_RE.finditer(content):
+        char = match.group()
+        if char in ledger:
+            ledger[char] += 1
+            continue
+        ledger[closers[char]] -= 1
+        if ledger[closers[char]] < 0:
+            print(f"Unmatched '{char}' at index {match.start()}")
             break
+    braces, brackets, parens = ledger['{'], ledger['['], ledger['(']
             
     if braces == 0 and brackets == 0 and parens == 0:
         print(f"JS Braces balance: OK")
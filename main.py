@@ -20,8 +20,6 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.utils import setup_logging, get_logger
-
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -80,9 +78,11 @@ def main() -> None:
     Initializes logging, displays startup banner, checks API keys,
     and starts the uvicorn server.
     """
+    # Parse first: --help and usage errors exit before any heavy import
     args = parse_arguments()
     
     # Setup logging
+    from src.utils import setup_logging, get_logger
     setup_logging(level=args.log_level)
     logger = get_logger(__name__)
     
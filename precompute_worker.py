@@ -13,13 +13,17 @@ import sys
 import json
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
+
 # Setup path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import INDICATORS
 from src.core.predictor import PredictorCore
+from src.utils import try_lock_file, lock_file, release_lock_file
 from dotenv import load_dotenv
 
 # Setup logging
@@ -36,8 +40,72 @@ logger = logging.getLogger("precompute_worker")
 # Constants
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 OUTPUT_FILE = os.path.join(DATA_DIR, "precomputed_models.json")
+LOCK_FILE = os.path.join(DATA_DIR, "precompute.lock")
+# Held by every writer of OUTPUT_FILE (this worker and the app) around read-merge-replace
+WRITE_LOCK_FILE = OUTPUT_FILE + ".lock"
+
+def load_results():
+    """Read the current contents of OUTPUT_FILE ({} if missing or empty)."""
+    if not os.path.exists(OUTPUT_FILE):
+        return {}
+    with open(OUTPUT_FILE, 'rb') as f:
+        content = f.read()
+    if not content:
+        return {}
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # Older files written by json.dump may contain NaN tokens
+        return json.loads(content)
+
+def save_results(results):
+    """
+    Merge results into OUTPUT_FILE and replace it atomically (compact orjson).
+    
+    The app adds entries on demand while the worker runs, so the file is
+    re-read under the shared write lock and an entry only replaces one with
+    an older (or missing) computed_at.
+    """
+    lock = lock_file(WRITE_LOCK_FILE)
+    try:
+        try:
+            merged = load_results()
+        except Exception as e:
+            logger.warning("Could not re-read cache before saving: %s", e)
+            merged = {}
+        for series_id, entry in results.items():
+            current = merged.get(series_id)
+            if current is None or entry.get("computed_at", "") > current.get("computed_at", ""):
+                merged[series_id] = entry
+        
+        # PID-suffixed temp file so we never collide with the app's own writes
+        tmp_path = f"{OUTPUT_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(merged, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, OUTPUT_FILE)
+    finally:
+        release_lock_file(lock)
 
 def main():
+    # Single-flight: only one worker may run at a time
+    os.makedirs(DATA_DIR, exist_ok=True)
+    lock = try_lock_file(LOCK_FILE)
+    if lock is None:
+        logger.info("Another precompute worker is already running. Exiting.")
+        return
+    try:
+        run()
+    finally:
+        release_lock_file(lock)
+
+def compute_one(series_id, api_key):
+    """Fetch one series and find its best model (runs in a worker process)."""
+    predictor = PredictorCore(api_key)
+    predictor.fetch_data(series_id)
+    # Series already run one per process; don't nest a second pool
+    return predictor.find_best_model(n_test=12, h_future=6, parallel=False)
+
+def run():
     logger.info("Starting background model precomputation...")
     load_dotenv()
     
@@ -46,58 +114,58 @@ def main():
         logger.error("FRED_API_KEY not found. Exiting.")
         return
 
-    predictor = PredictorCore(api_key)
-    
     # Load existing results if valid
     results = {}
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            with open(OUTPUT_FILE, 'r') as f:
-                content = f.read()
-                if content:
-                    results = json.loads(content)
-        except Exception as e:
-            logger.warning(f"Could not load existing Cache: {e}")
+    try:
+        results = load_results()
+    except Exception as e:
+        logger.warning("Could not load existing Cache: %s", e)
 
     total = len(INDICATORS)
-    logger.info(f"Processsing {total} indicators...")
+    logger.info("Processsing %d indicators...", total)
+    today = datetime.now().strftime("%Y-%m-%d")
     
-    for i, (series_id, info) in enumerate(INDICATORS.items(), 1):
+    pending = []
+    for i, series_id in enumerate(INDICATORS, 1):
         if series_id in results and "result" in results[series_id]:
-            # Skip if already computed recently (e.g. today)
-            # For now, we'll recompute if it's been more than 24h or force recompute
-            # Implementing simple check:
+            # Skip if already computed today
             last_computed = results[series_id].get("computed_at", "")
-            if last_computed.startswith(datetime.now().strftime("%Y-%m-%d")):
-                logger.info(f"[{i}/{total}] Skipping {series_id} (already computed today)")
+            if last_computed.startswith(today):
+                logger.info("[%d/%d] Skipping %s (already computed today)", i, total, series_id)
                 continue
+        pending.append(series_id)
 
-        try:
-            logger.info(f"[{i}/{total}] Computing model for {series_id}...")
-            predictor.fetch_data(series_id)
-            
-            # Find best model
-            result = predictor.find_best_model(n_test=12, h_future=6)
-            
-            # Serialize for JSON
-            # Need to convert numpy types and non-serializable objects
-            # predictor.find_best_model already returns mostly dicts, but let's be safe
-            
-            results[series_id] = {
-                "result": result,
-                "best_model": result.get("best_model", "unknown"),
-                "computed_at": datetime.now().isoformat()
-            }
-            
-            # Save intermediate results
-            with open(OUTPUT_FILE, 'w') as f:
-                json.dump(results, f, indent=2)
+    if not pending:
+        logger.info("Precomputation complete.")
+        return
+
+    # Indicators are independent: fetch + fit them in parallel processes
+    n_pending = len(pending)
+    workers = min(n_pending, os.cpu_count() or 1)
+    logger.info("Computing %d indicators on %d processes...", n_pending, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(compute_one, series_id, api_key): series_id
+            for series_id in pending
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            series_id = futures[future]
+            try:
+                result = future.result()
+                results[series_id] = {
+                    "result": result,
+                    "best_model": result.get("best_model", "unknown"),
+                    "computed_at": datetime.now().isoformat()
+                }
                 
-            logger.info(f"  → {series_id}: Success ({result.get('best_model')})")
-            
-        except Exception as e:
-            logger.error(f"  → {series_id}: Failed ({e})")
-            results[series_id] = {"error": str(e)}
+                # Save intermediate results so the app can serve them right away
+                save_results(results)
+                    
+                logger.info("[%d/%d] %s: Success (%s)", done, n_pending, series_id, result.get("best_model"))
+                
+            except Exception as e:
+                logger.error("[%d/%d] %s: Failed (%s)", done, n_pending, series_id, e)
+                results[series_id] = {"error": str(e)}
 
     logger.info("Precomputation complete.")
 
@@ -0,0 +1,205 @@
+"""
+Pamięć Podręczna Cen Rynkowych
+==============================
+
+Ten moduł przechowuje dzienne ceny zamknięcia z yfinance w lokalnej bazie SQLite,
+aby kolejne analizy korelacji i przegląd rynku nie pobierały ponownie
+tych samych danych przez sieć.
+
+Strategia stale-while-revalidate:
+- Brak danych dla tickera (lub zbyt krótka historia) - synchroniczne pobranie
+- Dane starsze niż PRICE_TTL - zwracane od razu, odświeżane w wątku w tle
+- Równoległe pobieranie historii tickerów przez jedną współdzieloną sesję HTTP
+
+Przykład użycia:
+    from src.analysis._price_cache import get_prices
+
+    closes = get_prices(["SPY", "XLK"], start="2023-01-01")
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+from src.utils import get_logger
+from src.utils.sqlite_cache import SQLiteDatabase
+
+# pandas/yfinance/requests are imported on first use to keep module import cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger(__name__)
+
+
+# Cache location (shared data/ folder of the project)
+PRICE_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "market_prices.db"
+)
+
+# Seconds after which cached prices are refreshed in the background
+PRICE_TTL = 1800
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS prices (
+        ticker TEXT NOT NULL,
+        date TEXT NOT NULL,
+        close REAL,
+        PRIMARY KEY (ticker, date)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS fetches (
+        ticker TEXT PRIMARY KEY,
+        start TEXT NOT NULL,
+        fetched_at REAL NOT NULL
+    )""",
+)
+
+_db = SQLiteDatabase(PRICE_DB_PATH, _SCHEMA)
+
+# Shared yfinance session and per-ticker download pool
+_session = None
+_session_lock = threading.Lock()
+_HISTORY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="price-history")
+
+# Tickers with a background refresh in flight
+_refreshing: set = set()
+_refresh_lock = threading.Lock()
+
+
+def _fetch_state(tickers: List[str]) -> Dict[str, Tuple[str, float]]:
+    """Return {ticker: (covered_start, fetched_at)} for cached tickers."""
+    placeholders = ",".join("?" * len(tickers))
+    with _db.connect() as conn:
+        rows = conn.execute(
+            f"SELECT ticker, start, fetched_at FROM fetches WHERE ticker IN ({placeholders})",
+            tickers
+        ).fetchall()
+    return {ticker: (start, fetched_at) for ticker, start, fetched_at in rows}
+
+
+def _get_session():
+    """Shared HTTP session so per-ticker requests reuse pooled connections (with retries)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            from src.utils.http import build_session
+            _session = build_session(pool_connections=16, pool_maxsize=16)
+    return _session
+
+
+def _history(ticker: str, start: str) -> Tuple[str, List[str], List[float]]:
+    """Fetch one ticker's daily closes as (ticker, dates, closes)."""
+    import yfinance as yf
+
+    try:
+        hist = yf.Ticker(ticker, session=_get_session()).history(start=start, auto_adjust=True)
+    except Exception as e:
+        logger.debug("History download failed for %s: %s", ticker, e)
+        return ticker, [], []
+    if hist is None or hist.empty or "Close" not in hist.columns:
+        return ticker, [], []
+
+    closes = hist["Close"].dropna()
+    # Exchange-local trading dates (history() returns a tz-aware index)
+    return ticker, closes.index.strftime("%Y-%m-%d").tolist(), closes.astype(float).tolist()
+
+
+def _download(tickers: List[str], start: str) -> None:
+    """Download closes for all tickers in parallel over one session and store them."""
+    logger.info("Downloading prices for %d tickers from %s", len(tickers), start)
+    rows = []
+    fetched = []
+    for ticker, dates, closes in _HISTORY_POOL.map(lambda t: _history(t, start), tickers):
+        if not dates:
+            continue
+        fetched.append(ticker)
+        rows.extend(zip([ticker] * len(dates), dates, closes))
+
+    if not rows:
+        logger.warning("No market data retrieved")
+        return
+
+    now = time.time()
+
+    with _db.connect() as conn:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO prices (ticker, date, close) VALUES (?, ?, ?)",
+                rows
+            )
+            conn.executemany(
+                """INSERT INTO fetches (ticker, start, fetched_at) VALUES (?, ?, ?)
+                   ON CONFLICT(ticker) DO UPDATE SET
+                       start = min(start, excluded.start),
+                       fetched_at = excluded.fetched_at""",
+                [(ticker, start, now) for ticker in fetched]
+            )
+    logger.debug("Cached %d price rows for %d tickers", len(rows), len(fetched))
+
+
+def _refresh(tickers: List[str], start: str) -> None:
+    """Background refresh of stale tickers."""
+    try:
+        _download(tickers, start)
+    except Exception as e:
+        logger.warning("Background price refresh failed: %s", e)
+    finally:
+        with _refresh_lock:
+            _refreshing.difference_update(tickers)
+
+
+def _schedule_refresh(tickers: Iterable[str], start: str) -> None:
+    """Start one daemon thread for stale tickers not already being refreshed."""
+    with _refresh_lock:
+        pending = [t for t in tickers if t not in _refreshing]
+        _refreshing.update(pending)
+    if pending:
+        threading.Thread(target=_refresh, args=(pending, start), daemon=True).start()
+
+
+def get_prices(tickers: Sequence[str], start: str) -> pd.DataFrame:
+    """
+    Get daily close prices for tickers from the cache, downloading on miss.
+
+    Args:
+        tickers: Ticker symbols (yfinance notation, e.g. "^GSPC").
+        start: First date needed, "YYYY-MM-DD".
+
+    Returns:
+        DataFrame indexed by date with one column per ticker that has data.
+    """
+    import pandas as pd
+
+    tickers = list(dict.fromkeys(tickers))
+    state = _fetch_state(tickers)
+    now = time.time()
+
+    missing = [t for t in tickers if t not in state or state[t][0] > start]
+    stale = [t for t in tickers if t not in missing and now - state[t][1] > PRICE_TTL]
+
+    if missing:
+        _download(missing, start)
+    if stale:
+        _schedule_refresh(stale, start)
+
+    placeholders = ",".join("?" * len(tickers))
+    with _db.connect() as conn:
+        rows = conn.execute(
+            f"SELECT ticker, date, close FROM prices "
+            f"WHERE ticker IN ({placeholders}) AND date >= ?",
+            tickers + [start]
+        ).fetchall()
+
+    if not rows:
+        return pd.DataFrame()
+
+    frame = pd.DataFrame(rows, columns=["ticker", "date", "close"])
+    closes = frame.pivot(index="date", columns="ticker", values="close")
+    closes.index = pd.to_datetime(closes.index)
+    closes.index.name = "Date"
+    return closes[[t for t in tickers if t in closes.columns]]
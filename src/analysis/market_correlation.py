@@ -20,15 +20,22 @@ Przykład użycia:
     market_data = analyzer.get_market_glance()
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from __future__ import annotations
 
-import numpy as np
-import pandas as pd
-import yfinance as yf
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
 
 from src.utils import get_logger
 
+from ._price_cache import get_prices
+
+# pandas/numpy are imported where used, so importing src.analysis stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 
@@ -49,17 +56,25 @@ SECTOR_ETFS: Dict[str, str] = {
     "XLE": "Energy"
 }
 
-# Default tickers for analysis
-DEFAULT_TICKERS: List[str] = [
+# Default tickers for analysis (immutable)
+DEFAULT_TICKERS: Tuple[str, ...] = (
     "^GSPC", "XLI", "XLV", "XLK", "XLF", "XLRE",
     "XLU", "XLB", "XLP", "XLY", "XLC", "XLE"
-]
+)
 
 # Tickers for market glance (ETFs only, no index)
-GLANCE_TICKERS: List[str] = [
+GLANCE_TICKERS: Tuple[str, ...] = (
     "SPY", "XLI", "XLV", "XLF", "XLRE", "XLE",
     "XLU", "XLK", "XLB", "XLP", "XLY", "XLC"
-]
+)
+
+# Memoised get_correlation results (rolling windows don't move intraday)
+CORRELATION_CACHE_TTL = 1800  # 30 minutes
+CORRELATION_CACHE_SIZE = 128
+
+# key -> (stored_at monotonic, results); insertion order doubles as LRU order
+_correlation_cache: "OrderedDict[tuple, Tuple[float, Dict]]" = OrderedDict()
+_correlation_cache_lock = threading.Lock()
 
 
 class MarketCorrelationAnalyzer:
@@ -93,7 +108,7 @@ class MarketCorrelationAnalyzer:
     def get_correlation(
         self,
         series_id: str,
-        tickers: Optional[List[str]] = None,
+        tickers: Optional[Sequence[str]] = None,
         years_back: int = 3
     ) -> Dict:
         """
@@ -123,105 +138,134 @@ class MarketCorrelationAnalyzer:
         
         tickers = tickers or DEFAULT_TICKERS
         
-        logger.info(f"Calculating market correlations for {series_id}")
+        cache_key = self._correlation_cache_key(series_id, tickers, years_back)
+        with _correlation_cache_lock:
+            cached = _correlation_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < CORRELATION_CACHE_TTL:
+                _correlation_cache.move_to_end(cache_key)
+                logger.debug("Using cached correlations for %s", series_id)
+                return cached[1]
+        
+        logger.info("Calculating market correlations for %s", series_id)
         
         try:
-            # Get market data
+            # Get market data (served from the local price cache when warm)
             start_date = (datetime.now() - timedelta(days=365 * years_back)).strftime("%Y-%m-%d")
-            raw_data = yf.download(
-                tickers,
-                start=start_date,
-                progress=False,
-                auto_adjust=True
-            )
-            
-            # Handle MultiIndex columns from yfinance
-            if isinstance(raw_data.columns, pd.MultiIndex):
-                market_data = raw_data["Close"] if "Close" in raw_data.columns.get_level_values(0) else raw_data
-            else:
-                market_data = raw_data[["Close"]] if "Close" in raw_data.columns else raw_data
+            market_data = get_prices(tickers, start_date)
             
             if market_data.empty:
                 logger.warning("No market data retrieved")
                 return {}
             
-            results = {}
-            
-            for ticker in tickers:
-                if ticker not in market_data.columns:
-                    continue
-                
-                result = self._calculate_ticker_correlation(
-                    ticker,
-                    market_data[ticker]
-                )
-                
-                if result:
-                    results[ticker] = result
+            # Convert to plain dicts only at the return boundary
+            results = self._calculate_correlations(market_data).to_dict(orient="index")
             
-            logger.info(f"Calculated correlations for {len(results)} tickers")
+            logger.info("Calculated correlations for %d tickers", len(results))
+            if results:
+                with _correlation_cache_lock:
+                    _correlation_cache[cache_key] = (time.monotonic(), results)
+                    _correlation_cache.move_to_end(cache_key)
+                    while len(_correlation_cache) > CORRELATION_CACHE_SIZE:
+                        _correlation_cache.popitem(last=False)
             return results
             
         except Exception as e:
-            logger.error(f"Error calculating market correlation: {e}")
+            logger.error("Error calculating market correlation: %s", e)
             return {}
     
-    def _calculate_ticker_correlation(
+    def _correlation_cache_key(
         self,
-        ticker: str,
-        ticker_series: pd.Series
-    ) -> Optional[Dict]:
+        series_id: str,
+        tickers: Sequence[str],
+        years_back: int
+    ) -> tuple:
+        """
+        Build the memoisation key for get_correlation.
+        
+        The indicator length/last date and release count are included so new
+        data for the same series invalidates the cached result.
         """
-        Calculate correlation for a single ticker.
+        releases = self.historical_releases
+        return (
+            series_id,
+            years_back,
+            tuple(sorted(tickers)),
+            len(self.indicator_data),
+            self.indicator_data.index[-1],
+            None if releases is None else len(releases)
+        )
+    
+    def _calculate_correlations(self, market_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate correlation and beta for all tickers in one vectorised pass.
         
         Args:
-            ticker: Ticker symbol.
-            ticker_series: Price series for the ticker.
+            market_data: Close prices, one column per ticker.
             
         Returns:
-            Dictionary with correlation data or None if insufficient data.
+            DataFrame indexed by ticker with one column per result field.
+            Tickers with fewer than 10 overlapping observations are omitted.
         """
-        # Calculate returns
-        indicator_returns = self.indicator_data.pct_change().dropna()
-        ticker_returns = ticker_series.pct_change().dropna()
+        import numpy as np
+        import pandas as pd
         
-        # Align data
-        combined = pd.concat(
-            [indicator_returns, ticker_returns],
-            axis=1,
-            join="inner"
-        ).dropna()
+        # Calculate returns once for the indicator and all tickers; float32
+        # halves memory traffic and is ample precision for correlation output.
+        # Native-frequency indicator returns are kept for release-date matching
+        indicator_returns = self.indicator_data.pct_change().dropna().astype(np.float32)
+        market_returns = market_data.pct_change().dropna(how="all").astype(np.float32)
         
-        if len(combined) < 10:
-            return None
+        # Forward-fill the (monthly/weekly) indicator onto trading days once, so
+        # every market row has an indicator return (zero between new readings)
+        # instead of matching only the few dates both series share
+        indicator_daily = (
+            self.indicator_data.reindex(market_data.index, method="ffill")
+            .dropna()
+            .pct_change()
+            .dropna()
+            .astype(np.float32)
+        )
+        
+        # Remaining NaNs are per-ticker gaps, handled pairwise below
+        combined, indicator = market_returns.align(
+            indicator_daily, join="inner", axis=0, copy=False
+        )
         
-        # Long-term correlation
-        long_term_corr = combined.corr().iloc[0, 1] if len(combined.columns) > 1 else 0
+        counts = combined.notna().sum()
+        tickers = counts.index[counts >= 10]
         
-        # Beta calculation
-        cov = combined.iloc[:, 0].cov(combined.iloc[:, 1])
-        var = combined.iloc[:, 1].var()
-        beta = cov / var if var != 0 else 0
+        correlations = combined.corrwith(indicator)[tickers].astype(float)
+        
+        # Beta = cov(indicator, ticker) / var(ticker) over the same rows
+        covariances = combined.assign(_ind=indicator).cov()["_ind"].drop("_ind")
+        variances = combined.var()
+        # Near-zero variance in float32 is rounding noise: treat it as zero (beta 0)
+        betas = (covariances / variances).where(variances > 1e-12, 0)[tickers]
         
         # Immediate correlation (on release dates)
-        immediate_corr = self._calculate_immediate_correlation(
-            indicator_returns,
-            ticker_returns
-        )
+        immediate = [
+            self._calculate_immediate_correlation(indicator_returns, market_returns[ticker].dropna())
+            for ticker in tickers
+        ]
         
         # Interpretation
-        corr_strength = "High" if abs(long_term_corr) > 0.5 else "Medium" if abs(long_term_corr) > 0.2 else "Low"
-        direction = "Positive" if long_term_corr > 0 else "Negative"
+        abs_corr = correlations.abs()
+        strength = np.where(abs_corr > 0.5, "High", np.where(abs_corr > 0.2, "Medium", "Low"))
+        direction = np.where(correlations > 0, "Positive", "Negative")
         
-        return {
-            "name": SECTOR_ETFS.get(ticker, ticker),
-            "long_term_correlation": float(long_term_corr),
-            "immediate_correlation": float(immediate_corr) if immediate_corr else None,
-            "beta": float(beta),
-            "strength": corr_strength,
+        frame = pd.DataFrame({
+            "name": [SECTOR_ETFS.get(ticker, ticker) for ticker in tickers],
+            "long_term_correlation": correlations.values,
+            "immediate_correlation": pd.Series(
+                [corr if corr else None for corr in immediate], dtype=object
+            ).values,
+            "beta": betas.astype(float).values,
+            "strength": strength,
             "direction": direction,
-            "interpretation": f"{direction} {corr_strength.lower()} correlation"
-        }
+        }, index=tickers)
+        frame["interpretation"] = frame["direction"] + " " + frame["strength"].str.lower() + " correlation"
+        
+        return frame
     
     def _calculate_immediate_correlation(
         self,
@@ -241,17 +285,19 @@ class MarketCorrelationAnalyzer:
         if self.historical_releases is None:
             return None
         
-        release_dates = self.historical_releases.index
-        release_returns = []
-        market_returns = []
-        
-        for date in release_dates:
-            if date in ticker_returns.index and date in indicator_returns.index:
-                release_returns.append(indicator_returns[date])
-                market_returns.append(ticker_returns[date])
+        # Release dates present in both return series
+        common = (
+            self.historical_releases.index
+            .intersection(indicator_returns.index)
+            .intersection(ticker_returns.index)
+        )
         
-        if len(release_returns) > 5:
-            return np.corrcoef(release_returns, market_returns)[0, 1]
+        if len(common) > 5:
+            import numpy as np
+            return float(np.corrcoef(
+                indicator_returns.reindex(common).values,
+                ticker_returns.reindex(common).values
+            )[0, 1])
         
         return None
     
@@ -276,53 +322,40 @@ class MarketCorrelationAnalyzer:
         
         try:
             start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-            raw_data = yf.download(
-                GLANCE_TICKERS,
-                start=start_date,
-                progress=False,
-                group_by="ticker",
-                auto_adjust=True
-            )
+            closes = get_prices(GLANCE_TICKERS, start_date)
             
             results = {}
             
-            for ticker in GLANCE_TICKERS:
+            # Resolve available tickers once instead of per iteration
+            columns = set(closes.columns)
+            available = [ticker for ticker in GLANCE_TICKERS if ticker in columns]
+            
+            for ticker in available:
                 try:
-                    # Handle yfinance multi-index
-                    if isinstance(raw_data.columns, pd.MultiIndex):
-                        if ticker in raw_data.columns.levels[0]:
-                            data = raw_data[ticker]["Close"]
-                        else:
-                            continue
-                    else:
-                        if ticker == GLANCE_TICKERS[0]:
-                            data = raw_data["Close"]
-                        else:
-                            continue
-                    
-                    data = data.dropna().tail(22)  # Approx 1 month trading days
+                    data = closes[ticker].dropna().tail(22)  # Approx 1 month trading days
                     
                     if data.empty:
                         continue
                     
-                    current_price = data.iloc[-1]
-                    prev_close = data.iloc[-2] if len(data) > 1 else current_price
+                    values = data.tolist()
+                    current_price = values[-1]
+                    prev_close = values[-2] if len(values) > 1 else current_price
                     change_pct = ((current_price - prev_close) / prev_close) * 100
                     
                     results[ticker] = {
                         "price": float(current_price),
                         "change": float(change_pct),
-                        "data": data.tolist(),
+                        "data": values,
                         "dates": data.index.strftime("%m-%d").tolist()
                     }
                     
                 except Exception as e:
-                    logger.debug(f"Error processing {ticker}: {e}")
+                    logger.debug("Error processing %s: %s", ticker, e)
                     continue
             
-            logger.info(f"Retrieved market glance for {len(results)} tickers")
+            logger.info("Retrieved market glance for %d tickers", len(results))
             return results
             
         except Exception as e:
-            logger.error(f"Error fetching market glance: {e}")
+            logger.error("Error fetching market glance: %s", e)
             return {}
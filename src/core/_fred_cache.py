@@ -0,0 +1,63 @@
+"""
+Trwała Pamięć Podręczna FRED
+============================
+
+Ten moduł przechowuje wyniki scrapowania dat publikacji oraz historię
+publikacji (revisions) FRED w lokalnej bazie SQLite, aby przetrwały
+restart procesu i nie były pobierane ponownie przy każdym uruchomieniu.
+
+Każdy wpis ma znacznik czasu zapisu; odczyt z `max_age` pomija wpisy przeterminowane.
+
+Przykład użycia:
+    from src.core._fred_cache import load, store
+
+    store("release_dates", "UMCSENT", "Nov 14, 2025")
+    hit = load("release_dates", "UMCSENT", max_age=3600)  # (wartość, czas zapisu) lub None
+"""
+
+import os
+from typing import Any, Optional, Tuple
+
+from src.utils.sqlite_cache import SQLiteCache
+
+
+# Cache location (shared data/ folder of the project)
+FRED_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "fred_cache.db"
+)
+
+# Cache namespaces
+TABLES = ("release_dates", "historical_releases", "release_ids")
+
+# Pickled payloads: entries include DataFrames
+_cache = SQLiteCache(FRED_CACHE_PATH, table="entries", codec="pickle")
+
+
+def load(table: str, series_id: str, max_age: float) -> Optional[Tuple[Any, float]]:
+    """
+    Load a cached value if it is younger than max_age seconds.
+
+    Args:
+        table: One of TABLES.
+        series_id: FRED series ID.
+        max_age: Maximum entry age in seconds.
+
+    Returns:
+        (stored object, stored_at epoch seconds), or None on miss,
+        expiry or read error.
+    """
+    return _cache.load(table, series_id, max_age)
+
+
+def store(table: str, series_id: str, value: Any) -> None:
+    """
+    Store a value for series_id (best effort, errors are logged).
+
+    Args:
+        table: One of TABLES.
+        series_id: FRED series ID.
+        value: Any picklable object (strings, DataFrames).
+    """
+    _cache.store(table, series_id, value)
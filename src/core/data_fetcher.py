@@ -21,19 +21,111 @@ Przykład użycia:
 """
 
 import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from dateutil import parser as date_parser
 from fredapi import Fred
 
 from src.utils import get_logger, DataFetchError
+from src.utils.http import build_session
+
+from . import _fred_cache
 
 logger = get_logger(__name__)
 
+# Persistent cache lifetimes (seconds)
+RELEASE_CACHE_TTL = 3600            # scraped next-release text
+HISTORICAL_RELEASES_TTL = 86400     # first-release history (revisions)
+RELEASE_ID_TTL = 7 * 86400          # series -> release id mapping (rarely changes)
+
+# FRED REST endpoints used for next-release lookups (~1 KB JSON instead of the series page)
+FRED_API_URL = "https://api.stlouisfed.org/fred"
+
+# The API key travels in the query string; masked in any error text we pass on
+API_KEY_RE = re.compile(r"(api_key=)[^&\s'\"]+")
+
+# Nanoseconds per day, for gap arithmetic on DatetimeIndex.asi8
+NS_PER_DAY = 86_400_000_000_000
+
+# Release date parsing: ISO regex, then cheap strptime formats, then fuzzy dateutil
+ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+RELEASE_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y")
+
+
+def _redact_api_key(text: str) -> str:
+    """Mask the api_key query parameter in a URL or error message."""
+    return API_KEY_RE.sub(r"\1***", text)
+
+
+@lru_cache(maxsize=1024)
+def _parse_release_text(release_text: str) -> str:
+    """Memoised body of FredDataFetcher._parse_release_date (FRED reuses date strings)."""
+    if release_text in ["TBD", "N/A"]:
+        return "TBD"
+    
+    # Try YYYY-MM-DD format
+    date_match = ISO_DATE_RE.search(release_text)
+    if date_match:
+        return date_match.group(1)
+    
+    # Try known FRED formats
+    stripped = release_text.strip()
+    for fmt in RELEASE_DATE_FORMATS:
+        try:
+            return datetime.strptime(stripped, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    
+    # Try fuzzy parsing
+    try:
+        parsed = date_parser.parse(release_text, fuzzy=True)
+        return parsed.strftime("%Y-%m-%d")
+    except Exception:
+        return release_text
+
+
+# One pooled session for all FRED traffic (API and series pages), shared by
+# every fetcher so TLS connections survive across PredictorCore instances
+_SESSION = build_session(pool_connections=8, pool_maxsize=32)
+
+# XPath form of "#mobile-meta-col > p:nth-child(4) > a > span > span"
+RELEASE_DATE_XPATH = '//*[@id="mobile-meta-col"]/*[4][self::p]/a/span/span'
+
+# Raw FRED observations memoised per (series_id, start, end). end defaults to
+# today, so entries roll over daily and re-fetches within a day skip the API.
+SERIES_CACHE_SIZE = 64
+_series_cache: "OrderedDict[Tuple[str, str, str], pd.Series]" = OrderedDict()
+_series_cache_lock = threading.Lock()
+
+
+def _uniform_freq(index: pd.DatetimeIndex) -> Optional[str]:
+    """
+    Return "D" or "W-<DAY>" if every gap in a sorted index is exactly 1 or 7 days.
+    
+    One np.diff + equality reduction on the int64 index; None for anything
+    else (monthly, business-day, gaps), which goes through pd.infer_freq.
+    """
+    if len(index) < 3:
+        return None
+    deltas = np.diff(index.asi8)
+    step = deltas[0]
+    if not (deltas == step).all():
+        return None
+    if step == NS_PER_DAY:
+        return "D"
+    if step == 7 * NS_PER_DAY:
+        return f"W-{index[0].day_name()[:3].upper()}"
+    return None
+
 
 class FredDataFetcher:
     """
@@ -57,10 +149,22 @@ class FredDataFetcher:
             api_key: FRED API key.
         """
         self.fred = Fred(api_key=api_key)
+        self._api_key = api_key
         self.series_id: Optional[str] = None
         self.df: Optional[pd.DataFrame] = None
         self.inferred_freq: Optional[str] = None
-        self._release_cache: Dict[str, Tuple[str, datetime]] = {}
+        # series_id -> (release text, time.monotonic() expiry)
+        self._release_cache: Dict[str, Tuple[str, float]] = {}
+        # Per-series metadata in memory ahead of the disk cache:
+        # series_id -> {"release_id" | "first_releases": (value, stored_at)}
+        self._series_meta: Dict[str, Dict[str, Tuple[Any, float]]] = {}
+        # (release_id, day) -> Future of the next release date, shared by series of one release;
+        # entries from earlier days are dropped when a new one is added
+        self._release_dates: Dict[Tuple[int, str], Future] = {}
+        self._release_dates_lock = threading.Lock()
+        
+        # Module-wide pooled session (fredapi itself opens a new urllib connection per call)
+        self._session = _SESSION
         
         logger.debug("Initialized FredDataFetcher")
     
@@ -95,16 +199,25 @@ class FredDataFetcher:
         logger.info(f"Fetching data for {series_id}: {start_date} to {end_date}")
         
         try:
-            s = self.fred.get_series(
-                series_id,
-                observation_start=start_date,
-                observation_end=end_date
-            )
+            s = self._get_series(series_id, start_date, end_date)
             s.name = "value"
             self.series_id = series_id
             
-            # 1. First cleanup: Remove duplicates and sort
-            s = s[~s.index.duplicated(keep="first")].sort_index()
+            # 1. First cleanup: Remove duplicates and sort (both no-ops for clean FRED pulls)
+            if s.index.has_duplicates:
+                s = s[~s.index.duplicated(keep="first")]
+            if not s.index.is_monotonic_increasing:
+                s = s.sort_index()
+            
+            # Fast path: evenly spaced daily/weekly series without gaps need no
+            # inference, reindexing or filling
+            freq = _uniform_freq(s.index)
+            if freq and not s.hasnans:
+                s.index = pd.DatetimeIndex(s.index, freq=freq)
+                self.inferred_freq = freq
+                self.df = s.to_frame()
+                logger.info(f"Fetched {len(self.df)} observations, freq={freq} (regular)")
+                return self.df
             
             # 2. Try to infer frequency
             self.inferred_freq = pd.infer_freq(s.index)
@@ -117,8 +230,12 @@ class FredDataFetcher:
             if self.inferred_freq:
                 s = s.asfreq(self.inferred_freq).ffill()
             
-            # Fill any remaining NaNs
-            s = s.bfill().ffill()
+            # Fill any remaining NaNs (after the ffill above only leading ones can
+            # be left, so one bfill usually finishes; skip both when clean)
+            if s.hasnans:
+                s = s.bfill()
+                if s.hasnans:
+                    s = s.ffill()
             
             self.df = s.to_frame()
             
@@ -132,6 +249,111 @@ class FredDataFetcher:
                 series_id=series_id
             )
     
+    def _get_series(self, series_id: str, start_date: str, end_date: str) -> pd.Series:
+        """
+        Get raw observations from FRED through the per-day series cache.
+        
+        Args:
+            series_id: FRED series ID.
+            start_date: Start date for data retrieval.
+            end_date: End date.
+            
+        Returns:
+            A fresh copy of the raw series (callers may mutate it).
+        """
+        key = (series_id, start_date, end_date)
+        with _series_cache_lock:
+            cached = _series_cache.get(key)
+            if cached is not None:
+                _series_cache.move_to_end(key)
+        
+        if cached is None:
+            cached = self._fetch_observations(series_id, start_date, end_date)
+            with _series_cache_lock:
+                _series_cache[key] = cached
+                while len(_series_cache) > SERIES_CACHE_SIZE:
+                    _series_cache.popitem(last=False)
+        else:
+            logger.debug(f"Using cached FRED observations for {series_id}")
+        
+        return cached.copy()
+    
+    def _fred_get(self, endpoint: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        GET a FRED API endpoint over the pooled session and decode its JSON.
+        
+        requests puts the full URL (with api_key) into HTTPError and
+        connection error messages, and those end up in logs, API responses
+        and precomputed_models.json. Errors raised here carry only the
+        endpoint, the status code and FRED's own error_message.
+        
+        Args:
+            endpoint: Path below FRED_API_URL (e.g. "series/observations").
+            params: Query parameters (api_key and file_type are added).
+            timeout: Request timeout in seconds.
+            
+        Returns:
+            Decoded JSON body.
+            
+        Raises:
+            DataFetchError: On connection errors or a non-200 status.
+        """
+        try:
+            response = self._session.get(
+                f"{FRED_API_URL}/{endpoint}",
+                params={**params, "api_key": self._api_key, "file_type": "json"},
+                timeout=timeout
+            )
+        except Exception as e:
+            raise DataFetchError(
+                f"FRED {endpoint} request failed: {_redact_api_key(str(e))}"
+            ) from None
+        
+        if response.status_code != 200:
+            try:
+                message = response.json().get("error_message", "")
+            except ValueError:
+                message = ""
+            raise DataFetchError(
+                f"FRED {endpoint} returned HTTP {response.status_code}"
+                + (f": {message}" if message else "")
+            )
+        return response.json()
+    
+    def _fetch_observations(self, series_id: str, start_date: str, end_date: str) -> pd.Series:
+        """
+        Download observations as JSON over the pooled session.
+        
+        Same result as fredapi's Fred.get_series (float values, "." as NaN,
+        DatetimeIndex), without a fresh urllib connection per call.
+        
+        Args:
+            series_id: FRED series ID.
+            start_date: Start date for data retrieval.
+            end_date: End date.
+            
+        Returns:
+            Raw observation series.
+        """
+        data = self._fred_get(
+            "series/observations",
+            {
+                "series_id": series_id,
+                "observation_start": start_date,
+                "observation_end": end_date,
+            },
+            timeout=30
+        )
+        observations = data.get("observations") or []
+        if not observations:
+            raise ValueError(f"No data exists for series id: {series_id}")
+        
+        raw = pd.DataFrame.from_records(observations, columns=["date", "value"])
+        return pd.Series(
+            pd.to_numeric(raw["value"], errors="coerce").to_numpy(dtype=np.float64),
+            index=pd.to_datetime(raw["date"].to_numpy(), format="%Y-%m-%d")
+        )
+    
     def _handle_irregular_frequency(
         self,
         s: pd.Series
@@ -153,9 +375,9 @@ class FredDataFetcher:
         if pd.infer_freq(filled_s.index) == "B":
             return filled_s.ffill(), "B"
         
-        # Check if mostly daily
-        diffs = s.index.to_series().diff().dt.days
-        if diffs.mode()[0] == 1:
+        # Check if mostly daily (gap mode in whole days from the int64 index)
+        gap_days = np.diff(s.index.asi8) // NS_PER_DAY
+        if len(gap_days) and np.bincount(gap_days.clip(0)).argmax() == 1:
             return s.asfreq("D").ffill(), "D"
         
         # Monthly fallback
@@ -163,7 +385,8 @@ class FredDataFetcher:
     
     def get_next_release(self, series_id: str) -> str:
         """
-        Scrape next release date from FRED website.
+        Get next release date from the FRED release API, scraping the series
+        page only when the API has no answer.
         
         Uses caching to avoid excessive requests. Cache expires after 1 hour.
         
@@ -174,11 +397,143 @@ class FredDataFetcher:
             Next release date as string, or "TBD"/"N/A" if not found.
         """
         # Check cache
-        if series_id in self._release_cache:
-            cached_date, cached_time = self._release_cache[series_id]
-            if (datetime.now() - cached_time).seconds < 3600:
-                return cached_date
+        cached_date = self._cached_release(series_id)
+        if cached_date is not None:
+            return cached_date
+        
+        # Happy path: release calendar from the JSON API
+        date_text = self._next_release_from_api(series_id)
+        if date_text is not None:
+            self._remember_release(series_id, date_text)
+            return date_text
         
+        return self._scrape_next_release(series_id)
+    
+    def _next_release_from_api(self, series_id: str) -> Optional[str]:
+        """
+        Look up the next scheduled release via the FRED release API.
+        
+        Args:
+            series_id: FRED series ID.
+            
+        Returns:
+            Date in the series page format ("Nov 14, 2025"), or None when the
+            API has no upcoming date or the request fails.
+        """
+        try:
+            release_id = self._release_id(series_id)
+            if release_id is None:
+                return None
+            return self._release_next_date(release_id)
+        except Exception as e:
+            logger.debug(f"Release API lookup failed for {series_id}: {e}")
+            return None
+    
+    def _release_next_date(self, release_id: int) -> Optional[str]:
+        """
+        Next scheduled date of a FRED release, fetched once per release per day.
+        
+        Many calendar indicators belong to the same release (CPI, Employment
+        Situation, ...), so concurrent lookups share one request: the first
+        caller fetches, the others wait on its future.
+        
+        Args:
+            release_id: FRED release id.
+            
+        Returns:
+            Date in the series page format, or None if none is scheduled.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        key = (release_id, today)
+        with self._release_dates_lock:
+            future = self._release_dates.get(key)
+            owner = future is None
+            if owner:
+                # Only today's dates are ever read: drop earlier days first
+                for stale in [k for k in self._release_dates if k[1] != today]:
+                    del self._release_dates[stale]
+                future = self._release_dates[key] = Future()
+        if not owner:
+            return future.result()
+        
+        try:
+            data = self._fred_get(
+                "release/dates",
+                {
+                    "release_id": release_id,
+                    "realtime_start": today,
+                    "include_release_dates_with_no_data": "true",
+                    "sort_order": "asc",
+                    "limit": 1,
+                },
+                timeout=3
+            )
+            dates = data.get("release_dates") or []
+            date_text = (
+                datetime.strptime(dates[0]["date"], "%Y-%m-%d").strftime("%b %d, %Y")
+                if dates else None
+            )
+        except Exception as e:
+            # Let waiters fail too and the next call retry
+            with self._release_dates_lock:
+                self._release_dates.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(date_text)
+        return date_text
+    
+    def _release_id(self, series_id: str) -> Optional[int]:
+        """Return the FRED release id of a series (cached for a week)."""
+        hit = self._load_meta(series_id, "release_id", "release_ids", RELEASE_ID_TTL)
+        if hit is not None:
+            return hit
+        
+        data = self._fred_get("series/release", {"series_id": series_id}, timeout=3)
+        releases = data.get("releases") or []
+        if not releases:
+            return None
+        release_id = int(releases[0]["id"])
+        self._store_meta(series_id, "release_id", "release_ids", release_id)
+        return release_id
+    
+    def _load_meta(self, series_id: str, field: str, table: str, max_age: float) -> Any:
+        """
+        Read cached series metadata: memory first, then disk (promoted to memory).
+        
+        Args:
+            series_id: FRED series ID.
+            field: Key in the in-memory series metadata.
+            table: Matching _fred_cache table.
+            max_age: Maximum entry age in seconds.
+            
+        Returns:
+            Cached value, or None on miss/expiry.
+        """
+        entry = self._series_meta.get(series_id, {}).get(field)
+        if entry is not None and time.time() - entry[1] < max_age:
+            return entry[0]
+        
+        hit = _fred_cache.load(table, series_id, max_age=max_age)
+        if hit is None:
+            return None
+        self._series_meta.setdefault(series_id, {})[field] = hit
+        return hit[0]
+    
+    def _store_meta(self, series_id: str, field: str, table: str, value: Any) -> None:
+        """Store series metadata in memory and on disk."""
+        self._series_meta.setdefault(series_id, {})[field] = (value, time.time())
+        _fred_cache.store(table, series_id, value)
+    
+    def _scrape_next_release(self, series_id: str) -> str:
+        """
+        Scrape the next release date from the FRED series page (API fallback).
+        
+        Args:
+            series_id: FRED series ID.
+            
+        Returns:
+            Next release date as string, or "TBD"/"N/A" if not found.
+        """
         logger.debug(f"Scraping release date for {series_id}")
         
         try:
@@ -186,30 +541,32 @@ class FredDataFetcher:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
-            response = requests.get(url, headers=headers, timeout=3)
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Primary selector
-            element = soup.select_one("#mobile-meta-col > p:nth-child(4) > a > span > span")
-            if element:
-                date_text = element.get_text(strip=True)
-                self._release_cache[series_id] = (date_text, datetime.now())
+            response = self._session.get(url, headers=headers, timeout=3)
+            # lxml's C parser + XPath: no pure-Python DOM for one string
+            tree = lxml_html.fromstring(response.content)
+            
+            # Primary selector (#mobile-meta-col > p:nth-child(4) > a > span > span)
+            elements = tree.xpath(RELEASE_DATE_XPATH)
+            if elements:
+                date_text = elements[0].text_content().strip()
+                self._remember_release(series_id, date_text)
                 return date_text
             
             # Fallback 1: Look for "Next Release:" text
-            meta_col = soup.select_one("#mobile-meta-col")
-            if meta_col:
-                text = meta_col.get_text()
+            meta_cols = tree.xpath('//*[@id="mobile-meta-col"]')
+            if meta_cols:
+                text = meta_cols[0].text_content()
                 if "Next Release:" in text:
                     parts = text.split("Next Release:")[1].split("\n")[0].strip()
-                    self._release_cache[series_id] = (parts, datetime.now())
+                    self._remember_release(series_id, parts)
                     return parts
             
             # Fallback 2: Look for any date-like pattern
-            for p in soup.find_all("p"):
-                if "Next Release" in p.get_text():
-                    date_text = p.get_text().split("Next Release:")[-1].strip()
-                    self._release_cache[series_id] = (date_text, datetime.now())
+            for p in tree.iter("p"):
+                p_text = p.text_content()
+                if "Next Release" in p_text:
+                    date_text = p_text.split("Next Release:")[-1].strip()
+                    self._remember_release(series_id, date_text)
                     return date_text
             
             return "TBD"
@@ -218,6 +575,37 @@ class FredDataFetcher:
             logger.warning(f"Error scraping release date for {series_id}: {e}")
             return "N/A"
     
+    def _cached_release(self, series_id: str) -> Optional[str]:
+        """
+        Return the cached release date if it is less than an hour old.
+        
+        Checks the in-memory cache first, then the on-disk cache (which
+        survives restarts) and promotes disk hits into memory.
+        
+        Args:
+            series_id: FRED series ID.
+            
+        Returns:
+            Cached release date string, or None on miss/expiry.
+        """
+        entry = self._release_cache.get(series_id)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        
+        hit = _fred_cache.load("release_dates", series_id, max_age=RELEASE_CACHE_TTL)
+        if hit is not None:
+            cached_date, stored_at = hit
+            # Disk entries carry wall-clock time; convert the remaining lifetime
+            remaining = RELEASE_CACHE_TTL - (time.time() - stored_at)
+            self._release_cache[series_id] = (cached_date, time.monotonic() + remaining)
+            return cached_date
+        return None
+    
+    def _remember_release(self, series_id: str, date_text: str) -> None:
+        """Store a scraped release date in the memory and disk caches."""
+        self._release_cache[series_id] = (date_text, time.monotonic() + RELEASE_CACHE_TTL)
+        _fred_cache.store("release_dates", series_id, date_text)
+    
     def get_historical_releases(self, series_id: str) -> Optional[pd.DataFrame]:
         """
         Get historical release dates using FRED API.
@@ -231,24 +619,67 @@ class FredDataFetcher:
         Returns:
             DataFrame with first release dates, or None if unavailable.
         """
+        hit = self._load_meta(
+            series_id, "first_releases", "historical_releases", HISTORICAL_RELEASES_TTL
+        )
+        if hit is not None:
+            return hit
+        
         logger.debug(f"Fetching historical releases for {series_id}")
         
         try:
-            releases = self.fred.get_series_all_releases(series_id)
-            if releases is None or releases.empty:
+            releases_df = self._fetch_all_releases(series_id)
+            if releases_df is None or releases_df.empty:
                 return None
             
-            releases_df = releases.reset_index()
-            releases_df.columns = ["date", "realtime_start", "value"]
-            
-            # Get first release for each observation
-            first_releases = releases_df.sort_values("realtime_start").groupby("date").first()
+            # Get first release for each observation: one stable sort + linear dedupe
+            first_releases = (
+                releases_df.sort_values(["date", "realtime_start"], kind="mergesort")
+                .drop_duplicates("date", keep="first")
+                .set_index("date")
+            )
+            self._store_meta(series_id, "first_releases", "historical_releases", first_releases)
             return first_releases
             
         except Exception as e:
             logger.warning(f"Could not fetch historical releases for {series_id}: {e}")
             return None
     
+    def _fetch_all_releases(self, series_id: str) -> Optional[pd.DataFrame]:
+        """
+        Download every vintage of a series' observations as JSON.
+        
+        Replaces fredapi's get_series_all_releases, which parses XML and
+        builds the frame row by row; here the JSON columns are converted
+        with vectorized to_datetime/to_numeric.
+        
+        Args:
+            series_id: FRED series ID.
+            
+        Returns:
+            DataFrame with date, realtime_start and value columns, or None.
+        """
+        data = self._fred_get(
+            "series/observations",
+            {
+                "series_id": series_id,
+                "realtime_start": "1776-07-04",
+                "realtime_end": "9999-12-31",
+            },
+            timeout=30
+        )
+        observations = data.get("observations")
+        if not observations:
+            return None
+        
+        raw = pd.DataFrame.from_records(observations, columns=["date", "realtime_start", "value"])
+        return pd.DataFrame({
+            "date": pd.to_datetime(raw["date"], format="%Y-%m-%d"),
+            "realtime_start": pd.to_datetime(raw["realtime_start"], format="%Y-%m-%d"),
+            # FRED marks missing values with "."
+            "value": pd.to_numeric(raw["value"], errors="coerce"),
+        })
+    
     def organize_by_release_date(
         self,
         series_dict: Dict[str, str]
@@ -265,17 +696,22 @@ class FredDataFetcher:
         """
         logger.info(f"Organizing {len(series_dict)} indicators by release date")
         
-        calendar: Dict[str, List[Dict]] = {}
+        calendar: Dict[str, List[Dict]] = defaultdict(list)
+        
+        # Scrape uncached series concurrently over the pooled session;
+        # get_next_release fills the cache, so the loop below only reads it
+        uncached = list(dict.fromkeys(
+            sid for sid in series_dict.values() if self._cached_release(sid) is None
+        ))
+        scraped: Dict[str, str] = {}
+        if uncached:
+            with ThreadPoolExecutor(max_workers=min(16, len(uncached))) as executor:
+                scraped = dict(zip(uncached, executor.map(self.get_next_release, uncached)))
         
         for name, series_id in series_dict.items():
             try:
-                next_release = self.get_next_release(series_id)
-                date_key = self._parse_release_date(next_release)
-                
-                if date_key not in calendar:
-                    calendar[date_key] = []
-                
-                calendar[date_key].append({
+                next_release = scraped.get(series_id) or self.get_next_release(series_id)
+                calendar[_parse_release_text(next_release)].append({
                     "name": name,
                     "series_id": series_id,
                     "release_text": next_release
@@ -283,8 +719,6 @@ class FredDataFetcher:
                 
             except Exception as e:
                 logger.warning(f"Error organizing {series_id}: {e}")
-                if "Error" not in calendar:
-                    calendar["Error"] = []
                 calendar["Error"].append({
                     "name": name,
                     "series_id": series_id,
@@ -304,20 +738,7 @@ class FredDataFetcher:
         Returns:
             Date key in YYYY-MM-DD format, or "TBD".
         """
-        if release_text in ["TBD", "N/A"]:
-            return "TBD"
-        
-        # Try YYYY-MM-DD format
-        date_match = re.search(r"(\d{4}-\d{2}-\d{2})", release_text)
-        if date_match:
-            return date_match.group(1)
-        
-        # Try fuzzy parsing
-        try:
-            parsed = date_parser.parse(release_text, fuzzy=True)
-            return parsed.strftime("%Y-%m-%d")
-        except Exception:
-            return release_text
+        return _parse_release_text(release_text)
     
     def _sort_calendar(
         self,
@@ -334,15 +755,7 @@ class FredDataFetcher:
         Returns:
             Sorted calendar dictionary.
         """
-        sorted_calendar = {}
-        sorted_keys = sorted([k for k in calendar.keys() if k not in ["TBD", "Error"]])
-        
-        for key in sorted_keys:
-            sorted_calendar[key] = calendar[key]
-        
-        if "TBD" in calendar:
-            sorted_calendar["TBD"] = calendar["TBD"]
-        if "Error" in calendar:
-            sorted_calendar["Error"] = calendar["Error"]
-        
+        tail = {key: calendar[key] for key in ("TBD", "Error") if key in calendar}
+        sorted_calendar = {key: calendar[key] for key in sorted(calendar.keys() - tail.keys())}
+        sorted_calendar.update(tail)
         return sorted_calendar
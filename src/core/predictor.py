@@ -16,9 +16,13 @@ Przykład użycia:
     results = predictor.analyze_arima(order=(1,1,1))
 """
 
+import multiprocessing
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -33,6 +37,62 @@ load_dotenv()
 logger = get_logger(__name__)
 
 
+# Candidate models tried by find_best_model: (name, kind, argument)
+CANDIDATE_MODELS = (
+    ("ARIMA(1, 1, 1)", "arima", (1, 1, 1)),
+    ("ARIMA(2, 1, 1)", "arima", (2, 1, 1)),
+    ("ARIMA(1, 1, 2)", "arima", (1, 1, 2)),
+    ("ARIMA(2, 1, 2)", "arima", (2, 1, 2)),
+    ("MovingAverage", "ma", [3, 6, 12]),
+    ("MonteCarlo", "mc", 1000),
+)
+
+# Below n_test * len(series) process start-up and pickling cost more than the fits
+PARALLEL_MIN_WORK = 2000
+
+_model_pool: Optional[ProcessPoolExecutor] = None
+_model_pool_lock = threading.Lock()
+
+
+def _get_model_pool() -> ProcessPoolExecutor:
+    """
+    Create (once) the process pool shared by all find_best_model calls.
+    
+    Workers are spawned, not forked: the server process is multi-threaded,
+    and a fork taken while another thread holds a lock (logging, DB pool,
+    HTTP session) would leave that lock held forever in the child.
+    """
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            _model_pool = ProcessPoolExecutor(
+                max_workers=min(len(CANDIDATE_MODELS), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _model_pool
+
+
+def _fit_candidate(
+    kind: str,
+    arg: Any,
+    values: np.ndarray,
+    index_ns: np.ndarray,
+    inferred_freq: str,
+    n_test: int,
+    h_future: int
+) -> Dict:
+    """Fit one candidate model (module-level so worker processes can unpickle it)."""
+    series = pd.Series(values, index=pd.DatetimeIndex(index_ns, freq="infer"), name="value")
+    if kind == "arima":
+        from src.models.arima_model import ARIMAAnalyzer
+        return ARIMAAnalyzer(series, inferred_freq).analyze(arg, n_test, h_future)
+    if kind == "ma":
+        from src.models.moving_average import MovingAverageAnalyzer
+        return MovingAverageAnalyzer(series, inferred_freq).analyze(arg, n_test, h_future)
+    from src.models.monte_carlo import MonteCarloSimulator
+    return MonteCarloSimulator(series, inferred_freq).analyze(arg, n_test, h_future)
+
+
 class PredictorCore:
     """
     Main orchestrator for the Advanced Macro Trading Terminal.
@@ -68,7 +128,11 @@ class PredictorCore:
         self.series_id: Optional[str] = None
         self.df: Optional[pd.DataFrame] = None
         self.inferred_freq: Optional[str] = None
+        # Column-split copy of df["value"] shipped to model worker processes
+        self._values: Optional[np.ndarray] = None
+        self._index_ns: Optional[np.ndarray] = None
         self.last_results: Optional[Dict] = None
+        self._market_analyzer: Optional[MarketCorrelationAnalyzer] = None
         self._release_cache: Dict = {}
         
         logger.info("PredictorCore initialized with all components")
@@ -99,6 +163,10 @@ class PredictorCore:
         self.df = self.data_fetcher.fetch_data(series_id, start_date, end_date, n_test)
         self.series_id = self.data_fetcher.series_id
         self.inferred_freq = self.data_fetcher.inferred_freq
+        
+        values = self.df["value"]
+        self._values = values.to_numpy(dtype=np.float64, copy=False)
+        self._index_ns = values.index.asi8
         return self.df
     
     def get_next_release(self, series_id: str) -> str:
@@ -189,7 +257,8 @@ class PredictorCore:
     def find_best_model(
         self,
         n_test: int = 12,
-        h_future: int = 6
+        h_future: int = 6,
+        parallel: bool = True
     ) -> Dict:
         """
         Run all three models and select the best one based on error metrics.
@@ -200,95 +269,112 @@ class PredictorCore:
         
         For models without AIC/BIC (Monte Carlo, Moving Average), only RMSE and MAPE are used.
         
+        The six candidate fits are independent and CPU-bound, so they run in
+        worker processes unless the series is too small to amortize the
+        pickling overhead (then threads are used).
+        
         Args:
             n_test: Number of test observations.
             h_future: Number of future periods to forecast.
+            parallel: Use the process pool for large series. Pass False when
+                the caller already runs in a process pool of its own.
             
         Returns:
             Dictionary with best model results and comparison data.
         """
         self._ensure_data_loaded()
         
-        results = {}
-        scores = {}
+        fitted = self._fit_candidates(n_test, h_future, parallel)
         
-        # ARIMA with different orders
-        from src.models.arima_model import ARIMAAnalyzer
-        arima_orders = [(1, 1, 1), (2, 1, 1), (1, 1, 2), (2, 1, 2)]
-        for order in arima_orders:
-            try:
-                analyzer = ARIMAAnalyzer(self.df["value"], self.inferred_freq)
-                result = analyzer.analyze(order, n_test, h_future)
-                model_name = f"ARIMA{order}"
-                results[model_name] = result
-                
-                # Calculate score (lower is better)
-                rmse = result["stats"].get("RMSE", float("inf"))
-                mape = result["stats"].get("MAPE", float("inf"))
-                aic = result["stats"].get("AIC", 0)
-                bic = result["stats"].get("BIC", 0)
-                
-                # Normalize and combine (RMSE and MAPE weighted, AIC/BIC as tiebreaker)
-                scores[model_name] = rmse * 0.4 + mape * 0.4 + (aic / 10000) * 0.1 + (bic / 10000) * 0.1
-                logger.debug(f"{model_name}: RMSE={rmse:.4f}, MAPE={mape:.2f}%, score={scores[model_name]:.4f}")
-            except Exception as e:
-                logger.warning(f"ARIMA{order} failed: {e}")
-        
-        # Moving Average
-        try:
-            from src.models.moving_average import MovingAverageAnalyzer
-            analyzer = MovingAverageAnalyzer(self.df["value"], self.inferred_freq)
-            result = analyzer.analyze([3, 6, 12], n_test, h_future)
-            model_name = "MovingAverage"
-            results[model_name] = result
-            
-            rmse = result["stats"].get("RMSE", float("inf"))
-            mape = result["stats"].get("MAPE", float("inf"))
-            scores[model_name] = rmse * 0.5 + mape * 0.5
-            logger.debug(f"{model_name}: RMSE={rmse:.4f}, MAPE={mape:.2f}%, score={scores[model_name]:.4f}")
-        except Exception as e:
-            logger.warning(f"MovingAverage failed: {e}")
-        
-        # Monte Carlo
-        try:
-            from src.models.monte_carlo import MonteCarloSimulator
-            simulator = MonteCarloSimulator(self.df["value"], self.inferred_freq)
-            result = simulator.analyze(1000, n_test, h_future)
-            model_name = "MonteCarlo"
-            results[model_name] = result
-            
-            rmse = result["stats"].get("RMSE", float("inf"))
-            mape = result["stats"].get("MAPE", float("inf"))
-            scores[model_name] = rmse * 0.5 + mape * 0.5
-            logger.debug(f"{model_name}: RMSE={rmse:.4f}, MAPE={mape:.2f}%, score={scores[model_name]:.4f}")
-        except Exception as e:
-            logger.warning(f"MonteCarlo failed: {e}")
-        
-        if not scores:
+        if not fitted:
             raise ValueError("All models failed to fit")
         
-        # Select best model
-        best_model_name = min(scores, key=scores.get)
-        best_result = results[best_model_name]
+        names = list(fitted)
+        stats = [fitted[name]["stats"] for name in names]
+        scores = np.empty(len(names), dtype=np.float64)
+        for i, (model_name, model_stats) in enumerate(zip(names, stats)):
+            rmse = model_stats.get("RMSE", float("inf"))
+            mape = model_stats.get("MAPE", float("inf"))
+            if model_name.startswith("ARIMA"):
+                aic = model_stats.get("AIC", 0)
+                bic = model_stats.get("BIC", 0)
+                # Normalize and combine (RMSE and MAPE weighted, AIC/BIC as tiebreaker)
+                scores[i] = rmse * 0.4 + mape * 0.4 + (aic / 10000) * 0.1 + (bic / 10000) * 0.1
+            else:
+                scores[i] = rmse * 0.5 + mape * 0.5
+            logger.debug(f"{model_name}: RMSE={rmse:.4f}, MAPE={mape:.2f}%, score={scores[i]:.4f}")
+        
+        # Select best model (NaN scores never win; first index wins ties)
+        best_idx = int(np.argmin(np.where(np.isnan(scores), np.inf, scores)))
+        best_model_name = names[best_idx]
+        best_result = fitted[best_model_name]
         
-        logger.info(f"Best model: {best_model_name} (score={scores[best_model_name]:.4f})")
+        logger.info(f"Best model: {best_model_name} (score={scores[best_idx]:.4f})")
         
         # Add comparison info
         best_result["best_model"] = best_model_name
         best_result["model_comparison"] = {
             name: {
-                "score": scores[name],
-                "rmse": results[name]["stats"].get("RMSE", 0),
-                "mape": results[name]["stats"].get("MAPE", 0),
-                "aic": results[name]["stats"].get("AIC", None),
-                "bic": results[name]["stats"].get("BIC", None),
+                "score": float(score),
+                "rmse": model_stats.get("RMSE", 0),
+                "mape": model_stats.get("MAPE", 0),
+                "aic": model_stats.get("AIC", None),
+                "bic": model_stats.get("BIC", None),
             }
-            for name in results
+            for name, score, model_stats in zip(names, scores, stats)
         }
         
         self.last_results = best_result
         return best_result
     
+    def _fit_candidates(
+        self,
+        n_test: int,
+        h_future: int,
+        parallel: bool
+    ) -> Dict[str, Dict]:
+        """
+        Fit every candidate model concurrently.
+        
+        Args:
+            n_test: Number of test observations.
+            h_future: Number of future periods to forecast.
+            parallel: Allow the process pool.
+            
+        Returns:
+            {model_name: result} in CANDIDATE_MODELS order, failed fits omitted.
+        """
+        # Two flat arrays pickle far smaller and faster than the Series object
+        values = self._values
+        index_ns = self._index_ns
+        
+        use_processes = parallel and n_test * len(values) >= PARALLEL_MIN_WORK
+        if use_processes:
+            executor = _get_model_pool()
+        else:
+            executor = ThreadPoolExecutor(max_workers=len(CANDIDATE_MODELS))
+        
+        fitted = {}
+        try:
+            futures = {
+                executor.submit(
+                    _fit_candidate, kind, arg, values, index_ns, self.inferred_freq, n_test, h_future
+                ): name
+                for name, kind, arg in CANDIDATE_MODELS
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    fitted[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"{name} failed: {e}")
+        finally:
+            if not use_processes:
+                executor.shutdown(wait=False)
+        
+        # Keep a stable order so ties and model_comparison do not depend on timing
+        return {name: fitted[name] for name, _, _ in CANDIDATE_MODELS if name in fitted}
+    
     # =========================================================================
     # MARKET ANALYSIS
     # =========================================================================
@@ -305,6 +391,8 @@ class PredictorCore:
         """
         self._ensure_data_loaded()
         historical_releases = self.get_historical_releases(series_id)
+        # Per-call analyzer is just two references; ETF prices live in the
+        # shared price cache, so nothing is re-downloaded per indicator
         analyzer = MarketCorrelationAnalyzer(
             self.df["value"],
             historical_releases
@@ -318,8 +406,9 @@ class PredictorCore:
         Returns:
             Dictionary with ETF prices and changes.
         """
-        analyzer = MarketCorrelationAnalyzer()
-        return analyzer.get_market_glance()
+        if self._market_analyzer is None:
+            self._market_analyzer = MarketCorrelationAnalyzer()
+        return self._market_analyzer.get_market_glance()
     
     # =========================================================================
     # API INTEGRATIONS
@@ -0,0 +1,60 @@
+"""
+Pamięć Podręczna Odpowiedzi API
+===============================
+
+Ten moduł przechowuje wyniki płatnych i limitowanych zapytań (News API,
+Perplexity, strony spółek stockanalysis.com) w lokalnej bazie SQLite, aby
+powtórne zapytania w krótkim czasie nie trafiały ponownie do zewnętrznego serwisu.
+
+Wpisy są zapisywane jako JSON (orjson) z kluczem (przestrzeń nazw, klucz)
+i znacznikiem czasu zapisu; odczyt z `max_age` pomija wpisy przeterminowane.
+
+Przykład użycia:
+    from src.integrations._response_cache import load, store
+
+    store("news", "T10Y2Y|2025-11-14", {"overall": 55, "articles": []})
+    hit = load("news", "T10Y2Y|2025-11-14", max_age=900)  # dict lub None
+"""
+
+import os
+from typing import Any, Optional
+
+from src.utils.sqlite_cache import SQLiteCache
+
+
+# Cache location (shared data/ folder of the project)
+RESPONSE_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "api_responses.db"
+)
+
+_cache = SQLiteCache(RESPONSE_CACHE_PATH, table="responses", codec="orjson")
+
+
+def load(namespace: str, key: str, max_age: float) -> Optional[Any]:
+    """
+    Load a cached response if it is younger than max_age seconds.
+
+    Args:
+        namespace: Cache namespace ("news", "perplexity", "stocks").
+        key: Request key within the namespace.
+        max_age: Maximum entry age in seconds.
+
+    Returns:
+        Decoded response, or None on miss, expiry or read error.
+    """
+    hit = _cache.load(namespace, key, max_age)
+    return None if hit is None else hit[0]
+
+
+def store(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a response (best effort, errors are logged).
+
+    Args:
+        namespace: Cache namespace ("news", "perplexity", "stocks").
+        key: Request key within the namespace.
+        value: JSON-serializable response.
+    """
+    _cache.store(namespace, key, value)
@@ -3,7 +3,8 @@ Economic Calendar Scraper - Trading Economics
 ==============================================
 
 Module for scraping economic calendar from TradingEconomics.com.
-Uses Selenium to handle dynamic pages and extract data.
+Parses the server-rendered HTML directly when possible and falls back to
+Selenium for dynamic pages.
 
 This version uses the improved logic from TE.py but wrapped in a class.
 """
@@ -11,20 +12,22 @@ This version uses the improved logic from TE.py but wrapped in a class.
 import os
 import re
 import sqlite3
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 from src.utils import get_logger
+from src.utils.http import build_session
 
 logger = get_logger(__name__)
 
@@ -33,17 +36,183 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 DATA_DIR = os.path.join(BASE_DIR, "data")
 DB_PATH = os.path.join(DATA_DIR, "economic_calendar.db")
 
+# economic_events columns, in table order
+EVENT_COLUMNS = (
+    "Date", "Time", "Country", "Event", "Link",
+    "Actual", "Previous", "Consensus", "Forecast",
+)
+
+# Stable schema. The unique key is an index (not a table constraint) so tables
+# created by the old to_sql(..., if_exists="replace") are upgraded in place;
+# any duplicate keys they hold are collapsed first.
+EVENTS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS economic_events ("
+    + ", ".join(f"{col} TEXT" for col in EVENT_COLUMNS) + ")",
+    """DELETE FROM economic_events WHERE rowid NOT IN (
+        SELECT MIN(rowid) FROM economic_events GROUP BY Date, Time, Event
+    )""",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_economic_events_key ON economic_events(Date, Time, Event)",
+    "CREATE INDEX IF NOT EXISTS ix_economic_events_date ON economic_events(Date)",
+)
+
+# Insert new events; update existing ones only when a value actually changed
+EVENTS_UPSERT_SQL = (
+    f"INSERT INTO economic_events ({', '.join(EVENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(EVENT_COLUMNS))}) "
+    "ON CONFLICT(Date, Time, Event) DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in EVENT_COLUMNS[4:] + ("Country",))
+    + " WHERE "
+    + " OR ".join(f"{col} IS NOT excluded.{col}" for col in EVENT_COLUMNS[4:] + ("Country",))
+)
+
+EVENTS_PRUNE_SQL = """
+    DELETE FROM economic_events
+    WHERE Date BETWEEN ? AND ?
+      AND NOT EXISTS (
+          SELECT 1 FROM temp.scraped_keys k
+          WHERE k.Date = economic_events.Date
+            AND k.Time = economic_events.Time
+            AND k.Event = economic_events.Event
+      )
+"""
+
+# Row date is carried as a YYYY-MM-DD CSS class; event rows start with a time cell
+DATE_CLASS_RE = re.compile(r'(?:^|\s)(\d{4}-\d{2}-\d{2})(?:\s|$)')
+TIME_RE = re.compile(r'^\d{1,2}:\d{2}\s*(AM|PM)?$', re.IGNORECASE)
+
+# Browser-like headers for the plain HTTP fetch (same user agent as Chrome below)
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Resources the calendar does not need. Stylesheets stay enabled: the consent
+# handling relies on is_displayed() and real layout for its clicks.
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*googlesyndication*", "*doubleclick.net*", "*google-analytics*", "*googletagmanager*",
+)
+
+# Browser readiness polling: give up after CALENDAR_WAIT seconds, treat the
+# table as rendered once it has more than CALENDAR_MIN_ROWS rows
+CALENDAR_WAIT = 15
+CALENDAR_MIN_ROWS = 10
+
+# Consent/cookie overlay classes hidden when no consent button could be clicked
+# (Google Funding Choices dialog plus common banner names)
+OVERLAY_CLASSES = (
+    "fc-dialog-overlay",
+    "fc-consent-root",
+    "fc-dialog-container",
+    "cookie-banner",
+    "cookie-consent",
+    "gdpr-banner",
+)
+
+# getElementsByClassName per class, plus the (few) iframes checked for ad sources
+HIDE_OVERLAYS_JS = """
+    arguments[0].forEach(function(name) {
+        var els = document.getElementsByClassName(name);
+        for (var i = 0; i < els.length; i++) { els[i].style.display = 'none'; }
+    });
+    var frames = document.getElementsByTagName('iframe');
+    for (var i = 0; i < frames.length; i++) {
+        var f = frames[i];
+        if (f.id.indexOf('google_ads') === 0 || (f.src || '').indexOf('ads') !== -1) {
+            f.style.display = 'none';
+        }
+    }
+"""
+
+# In-browser table walk: one execute_script call instead of a WebDriver
+# round-trip per row/cell. innerText matches what WebElement.text returned.
+EXTRACT_ROWS_JS = """
+    var table = document.getElementById('calendar');
+    if (!table) { return []; }
+    var out = [];
+    var rows = table.getElementsByTagName('tr');
+    for (var i = 0; i < rows.length; i++) {
+        var cells = rows[i].getElementsByTagName('td');
+        var classes = [], texts = [];
+        for (var j = 0; j < cells.length; j++) {
+            classes.push(cells[j].className || '');
+            texts.push((cells[j].innerText || '').trim());
+        }
+        var link = '';
+        if (cells.length > 4) {
+            var a = cells[4].getElementsByTagName('a')[0];
+            if (a) { link = a.href; }
+        }
+        out.push({classes: classes, texts: texts, link: link});
+    }
+    return out;
+"""
+
+# chromedriver path resolved once per process. CHROMEDRIVER_PATH (set at deploy
+# time) skips webdriver-manager, which checks versions over the network.
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def _chromedriver_path() -> str:
+    """Return the chromedriver path: CHROMEDRIVER_PATH, else webdriver-manager on first use."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            configured = os.environ.get("CHROMEDRIVER_PATH")
+            if configured:
+                _driver_path = configured
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+                logger.info(f"Resolved chromedriver via webdriver-manager: {_driver_path}")
+    return _driver_path
+
 
 class EconomicCalendarScraper:
     """
     Scraper for economic calendar from TradingEconomics.com.
+    
+    The Chrome instance is started on the first scrape and kept warm for
+    later ones; call close() (or use the scraper as a context manager)
+    to shut it down.
     """
     
     def __init__(self, db_path: Optional[str] = None, headless: bool = True):
         self.db_path = db_path or DB_PATH
         self.headless = headless
+        self._driver: Optional[webdriver.Chrome] = None
+        self._session = build_session()
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
+    def __enter__(self) -> "EconomicCalendarScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Quit the cached browser, if one is running."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            self._driver = None
+            logger.info("Browser closed")
+    
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the warm browser, starting one on first use."""
+        if self._driver is None:
+            logger.info("Starting browser...")
+            self._driver = self._setup_driver()
+        return self._driver
+    
     def _setup_driver(self) -> webdriver.Chrome:
         """Configure Chrome browser."""
         options = Options()
@@ -55,15 +224,24 @@ class EconomicCalendarScraper:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        # The calendar is a text table: skip images (fonts/ads are blocked via CDP below)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
         options.add_argument(
             "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(_chromedriver_path()),
             options=options
         )
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            logger.debug(f"Could not set blocked URLs: {e}")
         return driver
     
     def _get_calendar_url(self, country: str = "united states") -> Tuple[str, str, str]:
@@ -106,102 +284,173 @@ class EconomicCalendarScraper:
                 except:
                     continue
             
-            # Hide overlay via JS
-            driver.execute_script("""
-                var overlays = document.querySelectorAll(
-                    '.fc-dialog-overlay, .fc-consent-root, [class*="consent"], [class*="cookie"], [class*="gdpr"]'
-                );
-                overlays.forEach(function(el) { el.style.display = 'none'; });
-                var ads = document.querySelectorAll('[id*="google_ads"], [class*="ad-"], iframe[src*="ads"]');
-                ads.forEach(function(el) { el.style.display = 'none'; });
-            """)
-            time.sleep(0.3)
+            # Hide overlay via JS (class-name lookups, no attribute-substring scans)
+            driver.execute_script(HIDE_OVERLAYS_JS, list(OVERLAY_CLASSES))
             
         except Exception as e:
             logger.warning(f"Warning while dismissing overlays: {e}")
     
+    def _wait_for_calendar(self, driver: webdriver.Chrome) -> None:
+        """
+        Poll until the calendar table has rendered its rows.
+        
+        Returns as soon as the table is ready instead of sleeping a fixed
+        time; on timeout whatever has rendered so far is extracted.
+        
+        Args:
+            driver: Browser with the calendar page loaded.
+        """
+        try:
+            WebDriverWait(driver, CALENDAR_WAIT).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, "#calendar tr")) > CALENDAR_MIN_ROWS
+            )
+        except TimeoutException:
+            logger.warning(f"Calendar not fully rendered after {CALENDAR_WAIT}s, extracting what is loaded")
+    
     def _extract_calendar(self, driver: webdriver.Chrome) -> pd.DataFrame:
         """Extracts data from the calendar table."""
-        wait = WebDriverWait(driver, 15)
-        wait.until(EC.presence_of_element_located((By.ID, "calendar")))
-        time.sleep(2)
+        # One WebDriver round-trip: the browser walks the table and returns
+        # (cell classes, rendered cell texts, event link) for every row
+        raw_rows = driver.execute_script(EXTRACT_ROWS_JS) or []
+        return self._rows_to_frame(
+            (row["classes"], row["texts"], row["link"]) for row in raw_rows
+        )
+    
+    def _parse_calendar_table(self, table) -> pd.DataFrame:
+        """
+        Extract event rows from a parsed #calendar table (HTTP path).
         
-        calendar_table = driver.find_element(By.ID, "calendar")
-        rows = calendar_table.find_elements(By.TAG_NAME, "tr")
+        Args:
+            table: lxml element of the calendar table (links already absolute).
+            
+        Returns:
+            Calendar DataFrame (see _rows_to_frame).
+        """
+        def raw_rows():
+            for row in table.xpath(".//tr"):
+                cells = row.xpath("./td")
+                links = cells[4].xpath(".//a/@href") if len(cells) > 4 else []
+                yield (
+                    [cell.get("class") or "" for cell in cells],
+                    # Collapse whitespace like WebElement.text does
+                    [" ".join(cell.text_content().split()) for cell in cells],
+                    links[0] if links else "",
+                )
         
-        logger.info(f"Found {len(rows)} rows in table")
+        return self._rows_to_frame(raw_rows())
+    
+    def _rows_to_frame(
+        self,
+        raw_rows: Iterable[Tuple[List[str], List[str], str]],
+        country_code: str = "US"
+    ) -> pd.DataFrame:
+        """
+        Build the calendar DataFrame from raw table rows.
         
-        date_class_pattern = re.compile(r'^(\d{4}-\d{2}-\d{2})$')
-        time_pattern = r'^\d{1,2}:\d{2}\s*(AM|PM)?$'
+        Rows of other countries and rows without an event name are skipped
+        here, before any column values are collected.
         
-        result_rows = []
+        Args:
+            raw_rows: (class attribute per cell, text per cell, link of the
+                event cell) for each table row.
+            country_code: Country column value of the rows to keep.
+            
+        Returns:
+            DataFrame with Date, Time, Country, Event, Link, Actual,
+            Previous, Consensus and Forecast columns.
+        """
+        # Column lists (SoA): pandas builds each column straight from its list
+        columns: Dict[str, List[str]] = {col: [] for col in EVENT_COLUMNS}
+        column_lists = list(columns.values())
+        n_rows = 0
         
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if not cells:
+        for cell_classes, cell_texts, event_link in raw_rows:
+            n_rows += 1
+            if len(cell_texts) < 5 or not TIME_RE.match(cell_texts[0]):
+                continue
+            if cell_texts[1].strip() != country_code:
+                continue
+            event = cell_texts[4].strip()
+            if not event or event == 'nan':
                 continue
             
-            # Look for date in CSS classes
+            # Look for date in CSS classes (one search per cell's class attribute)
             row_date = None
-            for cell in cells:
-                cell_classes = cell.get_attribute("class") or ""
-                for css_class in cell_classes.split():
-                    match = date_class_pattern.match(css_class)
-                    if match:
-                        row_date = match.group(1)
-                        break
-                if row_date:
+            for classes in cell_classes:
+                match = DATE_CLASS_RE.search(classes)
+                if match:
+                    row_date = match.group(1)
                     break
             
-            cell_texts = [cell.text.strip() for cell in cells]
-            
-            if not row_date or len(cell_texts) < 5:
+            if not row_date:
                 continue
             
-            col0 = cell_texts[0] if len(cell_texts) > 0 else ""
-            col1 = cell_texts[1] if len(cell_texts) > 1 else ""
-            
-            is_time = re.match(time_pattern, col0, re.IGNORECASE)
-            
-            if is_time and len(cell_texts) >= 5:
-                # Extract link
-                event_link = ''
-                if len(cells) > 4:
-                    try:
-                        link_el = cells[4].find_element(By.TAG_NAME, 'a')
-                        event_link = link_el.get_attribute('href') or ''
-                    except:
-                        pass
-                
-                result_rows.append({
-                    'Date': row_date,
-                    'Time': col0,
-                    'Country': col1,
-                    'Event': cell_texts[4] if len(cell_texts) > 4 else '',
-                    'Link': event_link,
-                    'Actual': cell_texts[5] if len(cell_texts) > 5 else '',
-                    'Previous': cell_texts[6] if len(cell_texts) > 6 else '',
-                    'Consensus': cell_texts[7] if len(cell_texts) > 7 else '',
-                    'Forecast': cell_texts[8] if len(cell_texts) > 8 else '',
-                })
+            # Actual, Previous, Consensus, Forecast (missing trailing cells -> '')
+            figures = cell_texts[5:9]
+            figures += [''] * (4 - len(figures))
+            values = (row_date, cell_texts[0], cell_texts[1], cell_texts[4], event_link, *figures)
+            for column, value in zip(column_lists, values):
+                column.append(value)
+        
+        logger.info(f"Found {n_rows} rows in table")
+        logger.info(f"Extracted {len(columns['Date'])} {country_code} events")
         
-        logger.info(f"Extracted {len(result_rows)} data rows")
+        return pd.DataFrame(columns)
+    
+    def _finalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop duplicate events (rows are already filtered in _rows_to_frame)."""
+        df = df.drop_duplicates(subset=['Date', 'Time', 'Event'], keep='first')
+        logger.info(f"Kept {len(df)} unique events")
+        return df.reset_index(drop=True)
+    
+    def scrape(self, country: str = "united states") -> pd.DataFrame:
+        """
+        Main scraping method.
         
-        if result_rows:
-            df = pd.DataFrame(result_rows)
-            df = df[df['Event'].str.strip() != '']
-            df = df[df['Event'] != 'nan']
+        Tries a plain HTTP fetch of the server-rendered page first and only
+        starts Chrome when that yields no calendar rows.
+        """
+        df = self.scrape_http(country)
+        if df is not None:
             return df
+        logger.info("Calendar not found in static HTML, falling back to browser")
+        return self._scrape_browser(country)
+    
+    def scrape_http(self, country: str = "united states") -> Optional[pd.DataFrame]:
+        """
+        Scrape the calendar from the initial HTML, without a browser.
         
-        return pd.DataFrame(columns=[
-            'Date', 'Time', 'Country', 'Event', 'Link',
-            'Actual', 'Previous', 'Consensus', 'Forecast'
-        ])
+        Args:
+            country: Country filter used in the calendar URL.
+            
+        Returns:
+            Calendar DataFrame, or None if the page could not be fetched or
+            did not contain calendar rows.
+        """
+        url, start_date, end_date = self._get_calendar_url(country)
+        logger.info(f"HTTP fetch: {url} ({start_date} - {end_date})")
+        
+        try:
+            response = self._session.get(url, headers=HTTP_HEADERS, timeout=(3.05, 15))
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"HTTP calendar fetch failed: {e}")
+            return None
+        
+        tree = lxml_html.fromstring(response.content)
+        table = tree.get_element_by_id("calendar", None)
+        if table is None:
+            return None
+        table.make_links_absolute(response.url)
+        
+        df = self._parse_calendar_table(table)
+        if df.empty:
+            return None
+        return self._finalize(df)
     
-    def scrape(self, country: str = "united states") -> pd.DataFrame:
-        """Main scraping method."""
-        logger.info("Starting browser...")
-        driver = self._setup_driver()
+    def _scrape_browser(self, country: str) -> pd.DataFrame:
+        """Scrape the calendar with the (warm) Chrome driver."""
+        driver = self._get_driver()
         
         try:
             url, start_date, end_date = self._get_calendar_url(country)
@@ -209,34 +458,64 @@ class EconomicCalendarScraper:
             logger.info(f"Range: {start_date} - {end_date}")
             
             driver.get(url)
-            time.sleep(4)
+            self._wait_for_calendar(driver)
             
             self._dismiss_overlays(driver)
-            time.sleep(1)
-            
-            df = self._extract_calendar(driver)
             
-            # Filter US only
-            if 'Country' in df.columns:
-                df = df[df['Country'].str.strip() == 'US'].copy()
-                logger.info(f"Filtered to {len(df)} US events")
+            df = self._finalize(self._extract_calendar(driver))
             
-            # Drop duplicates
-            df = df.drop_duplicates(subset=['Date', 'Time', 'Event'], keep='first')
-            df = df.reset_index(drop=True)
-            
-            return df
-            
-        finally:
-            driver.quit()
-            logger.info("Browser closed")
+        except Exception:
+            # Don't reuse a browser left in an unknown state
+            self.close()
+            raise
+        
+        # Reset the warm browser for the next scrape
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception as e:
+            logger.debug(f"Browser reset failed, restarting next time: {e}")
+            self.close()
+        
+        return df
     
     def save_to_db(self, df: pd.DataFrame) -> bool:
-        """Saves DataFrame to SQLite database."""
+        """
+        Saves DataFrame to SQLite database.
+        
+        Rows are upserted on (Date, Time, Event) against a stable schema
+        inside one explicit transaction: unchanged events are not rewritten,
+        released figures (Actual, ...) update in place, and events that
+        vanished from the scraped date window are removed. Readers in WAL
+        mode keep seeing the previous calendar until it commits.
+        """
+        frame = df.reindex(columns=list(EVENT_COLUMNS))
+        rows = list(frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None))
+        keys = [(row[0], row[1], row[3]) for row in rows]
+        window = (frame["Date"].min(), frame["Date"].max())
         try:
-            conn = sqlite3.connect(self.db_path)
-            df.to_sql('economic_events', conn, if_exists='replace', index=False)
-            conn.close()
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for statement in EVENTS_SCHEMA:
+                        conn.execute(statement)
+                    conn.executemany(EVENTS_UPSERT_SQL, rows)
+                    
+                    # Drop rescheduled/removed events inside the scraped window
+                    conn.execute("CREATE TEMP TABLE scraped_keys (Date TEXT, Time TEXT, Event TEXT)")
+                    conn.executemany("INSERT INTO scraped_keys VALUES (?, ?, ?)", keys)
+                    conn.execute(EVENTS_PRUNE_SQL, window)
+                    conn.execute("DROP TABLE temp.scraped_keys")
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
             logger.info(f"Saved data to {self.db_path}")
             return True
         except Exception as e:
@@ -252,7 +531,7 @@ class EconomicCalendarScraper:
 
 
 if __name__ == "__main__":
-    scraper = EconomicCalendarScraper(headless=True)
-    df = scraper.run()
+    with EconomicCalendarScraper(headless=True) as scraper:
+        df = scraper.run()
     print(f"\n=== US Economic Calendar ({len(df)} events) ===")
     print(df.head(20))
@@ -20,12 +20,18 @@ Przykład użycia:
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+import orjson
 import requests
 
 from src.utils import get_logger, APIConnectionError
+from src.utils.http import build_session
+
+from . import _response_cache
 
 logger = get_logger(__name__)
 
@@ -45,6 +51,9 @@ NEWS_DOMAINS = (
     "msn.com,allbusiness.com,quora.com,reddit.com,ogj.com"
 )
 
+# Seconds a sentiment result is reused (matches CACHE_TTL["news"] in config.py)
+NEWS_CACHE_TTL = 900
+
 # Mapping of FRED series IDs to search terms
 SEARCH_TERMS_MAP: Dict[str, str] = {
     "T10Y2Y": "treasury yield OR yield curve OR bond spread",
@@ -80,6 +89,12 @@ NEGATIVE_WORDS: List[str] = [
     "recession", "contraction", "bearish", "loss", "crisis"
 ]
 
+# Keyword lookup sets and word splitter: text is tokenized once and each
+# token is an O(1) exact-word lookup ("rise" no longer matches "sunrise")
+POS_SET = frozenset(POSITIVE_WORDS)
+NEG_SET = frozenset(NEGATIVE_WORDS)
+TOKEN_RE = re.compile(r"[a-z']+")
+
 
 class NewsAPIClient:
     """
@@ -105,6 +120,13 @@ class NewsAPIClient:
         self.api_key = api_key or os.getenv("NEWS_API_KEY", "")
         if not self.api_key:
             logger.warning("News API key not configured")
+        
+        # Keep-alive pool reused by every request of this client
+        self.session = build_session()
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
     
     def get_sentiment(
         self,
@@ -143,6 +165,15 @@ class NewsAPIClient:
         # Get search query for this indicator
         search_query = query or SEARCH_TERMS_MAP.get(series_id, series_id)
         
+        from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        
+        # Same query, window and page size within the TTL: serve from disk
+        cache_key = f"{search_query}|{from_date}|{page_size}"
+        cached = _response_cache.load("news", cache_key, max_age=NEWS_CACHE_TTL)
+        if cached is not None:
+            logger.debug(f"Using cached news for {series_id}")
+            return cached
+        
         logger.info(f"Fetching news for {series_id}: query='{search_query}'")
         
         try:
@@ -152,21 +183,21 @@ class NewsAPIClient:
                 "pageSize": page_size,
                 "sortBy": "relevancy",
                 "language": "en",
-                "from": (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+                "from": from_date
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = self.session.get(self.BASE_URL, params=params, timeout=(3.05, 15))
             
             if response.status_code != 200:
                 logger.warning(f"News API error: {response.status_code}")
                 return self._error_response(f"API error: {response.status_code}")
             
-            data = response.json()
+            data = orjson.loads(response.content)
             articles = data.get("articles", [])
             
             if not articles:
                 logger.info(f"No articles found for {series_id}")
-                return {
+                result = {
                     "articles": [],
                     "overall": 50,
                     "overall_label": "Neutral",
@@ -174,6 +205,8 @@ class NewsAPIClient:
                     "message": "No recent articles found",
                     "query_used": search_query
                 }
+                _response_cache.store("news", cache_key, result)
+                return result
             
             # Analyze sentiment for each article
             scored_articles = []
@@ -191,13 +224,15 @@ class NewsAPIClient:
             
             logger.info(f"Found {len(scored_articles)} articles, avg sentiment: {avg_sentiment:.1f}")
             
-            return {
+            result = {
                 "articles": scored_articles,
                 "overall": int(avg_sentiment),
                 "overall_label": self._get_sentiment_label(avg_sentiment),
                 "count": len(scored_articles),
                 "query_used": search_query
             }
+            _response_cache.store("news", cache_key, result)
+            return result
             
         except requests.RequestException as e:
             logger.error(f"News API request failed: {e}")
@@ -209,6 +244,39 @@ class NewsAPIClient:
             logger.error(f"News API error: {e}")
             return self._error_response(str(e))
     
+    def get_sentiments(
+        self,
+        series_ids: List[str],
+        max_workers: int = 8,
+        **kwargs
+    ) -> Dict[str, Dict]:
+        """
+        Get sentiment for several indicators concurrently.
+        
+        Lookups are independent and network-bound, so they overlap in a
+        thread pool sharing this client's keep-alive session.
+        
+        Args:
+            series_ids: FRED series IDs.
+            max_workers: Maximum concurrent requests.
+            **kwargs: Passed through to get_sentiment (days_back, page_size).
+            
+        Returns:
+            {series_id: get_sentiment result}; connection failures become
+            error responses instead of aborting the whole batch.
+        """
+        def lookup(series_id: str) -> Dict:
+            try:
+                return self.get_sentiment(series_id, **kwargs)
+            except APIConnectionError as e:
+                return self._error_response(e.message)
+        
+        unique_ids = list(dict.fromkeys(series_ids))
+        if not unique_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(lookup, unique_ids)))
+    
     def _analyze_article(self, article: Dict) -> Dict:
         """
         Analyze sentiment for a single article.
@@ -223,11 +291,11 @@ class NewsAPIClient:
         """
         title = article.get("title") or ""
         description = article.get("description") or ""
-        text = (title + " " + description).lower()
+        tokens = set(TOKEN_RE.findall(f"{title} {description}".lower()))
         
-        # Count sentiment words
-        pos_count = sum(1 for w in POSITIVE_WORDS if w in text)
-        neg_count = sum(1 for w in NEGATIVE_WORDS if w in text)
+        # Count distinct sentiment words (exact-word set intersection)
+        pos_count = len(POS_SET.intersection(tokens))
+        neg_count = len(NEG_SET.intersection(tokens))
         
         # Calculate score (0-100 scale)
         score = 50 + (pos_count - neg_count) * 8
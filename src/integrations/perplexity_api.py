@@ -16,18 +16,50 @@ Przykład użycia:
     
     client = PerplexityClient(api_key="twój_klucz_api")
     results = client.get_research("UMCSENT", indicator_name="Consumer Sentiment")
+    
+    # Kilka wskaźników w jednym zapytaniu
+    batch = client.get_research_batch(["UMCSENT", "UNRATE"])
 """
 
+import hashlib
 import os
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+import orjson
 import requests
 
 from src.utils import get_logger, APIConnectionError
+from src.utils.http import build_session
+
+from . import _response_cache
 
 logger = get_logger(__name__)
 
+# Seconds a research answer is reused (matches CACHE_TTL["perplexity"] in config.py)
+PERPLEXITY_CACHE_TTL = 3600
+
+# Structured output of a batched request: one analysis per indicator
+BATCH_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "analyses": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "series_id": {"type": "string"},
+                    "trend": {"type": "string"},
+                    "drivers": {"type": "string"},
+                    "forecast": {"type": "string"},
+                },
+                "required": ["series_id", "trend", "drivers", "forecast"],
+            },
+        },
+    },
+    "required": ["analyses"],
+}
+
 
 class PerplexityClient:
     """
@@ -58,6 +90,13 @@ class PerplexityClient:
         
         if not self.api_key:
             logger.warning("Perplexity API key not configured")
+        
+        # Keep-alive pool; POSTs are not retried (each one is a billed completion)
+        self.session = build_session()
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
     
     def get_research(
         self,
@@ -122,7 +161,14 @@ class PerplexityClient:
                 "max_tokens": max_tokens
             }
             
-            response = requests.post(
+            # Identical prompt + model settings within the TTL: reuse the answer
+            cache_key = hashlib.sha256(orjson.dumps(payload)).hexdigest()
+            cached = _response_cache.load("perplexity", cache_key, max_age=PERPLEXITY_CACHE_TTL)
+            if cached is not None:
+                logger.debug(f"Using cached Perplexity research for {series_id}")
+                return cached
+            
+            response = self.session.post(
                 self.BASE_URL,
                 json=payload,
                 headers=headers,
@@ -130,18 +176,20 @@ class PerplexityClient:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 content = data["choices"][0]["message"]["content"]
                 citations = data.get("citations", [])
                 
                 logger.info(f"Perplexity research generated for {series_id}")
                 
-                return {
+                result = {
                     "summary": content,
                     "outlook": "ANALYZED",
                     "sources": citations if citations else ["Perplexity AI Online Search"],
                     "timestamp": datetime.now().isoformat()
                 }
+                _response_cache.store("perplexity", cache_key, result)
+                return result
             else:
                 # Handle API error
                 error_msg = self._parse_error(response)
@@ -164,6 +212,171 @@ class PerplexityClient:
             logger.error(f"Perplexity API error: {e}")
             return self._error_response(str(e))
     
+    def get_research_batch(
+        self,
+        series_ids: List[str],
+        indicator_names: Optional[Dict[str, str]] = None,
+        temperature: float = 0.4,
+        max_tokens_per_series: int = 600
+    ) -> Dict[str, Dict]:
+        """
+        Get research for several indicators with a single completion.
+        
+        All indicators are listed in one prompt and the model answers with
+        JSON matching BATCH_RESPONSE_SCHEMA, so K indicators cost one round
+        trip instead of K. Indicators missing from the answer (or all of
+        them, if the batch request fails) fall back to get_research.
+        
+        Args:
+            series_ids: FRED series IDs.
+            indicator_names: Optional {series_id: human-readable name}.
+            temperature: Model temperature for response generation.
+            max_tokens_per_series: Response token budget per indicator.
+            
+        Returns:
+            {series_id: research dict in the get_research format}; the
+            citations of the batch answer are shared by all indicators.
+        """
+        unique_ids = list(dict.fromkeys(series_ids))
+        if not unique_ids:
+            return {}
+        if not self.api_key:
+            logger.error("Perplexity API key not configured")
+            return {sid: self._error_response("API key not configured") for sid in unique_ids}
+        
+        names = indicator_names or {}
+        if len(unique_ids) == 1:
+            sid = unique_ids[0]
+            return {sid: self._research_or_error(sid, names.get(sid))}
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a professional macroeconomic analyst. "
+                        "Provide concise, data-driven analysis with citations. "
+                        "Answer with JSON only."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": self._build_batch_prompt(
+                        {sid: names.get(sid) or sid for sid in unique_ids}
+                    )
+                }
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens_per_series * len(unique_ids),
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"schema": BATCH_RESPONSE_SCHEMA}
+            }
+        }
+        
+        cache_key = hashlib.sha256(orjson.dumps(payload)).hexdigest()
+        cached = _response_cache.load("perplexity", cache_key, max_age=PERPLEXITY_CACHE_TTL)
+        if cached is not None:
+            logger.debug(f"Using cached Perplexity batch research for {len(unique_ids)} series")
+            return cached
+        
+        logger.info(f"Requesting Perplexity batch research for {len(unique_ids)} series")
+        results: Dict[str, Dict] = {}
+        
+        try:
+            response = self.session.post(
+                self.BASE_URL,
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                timeout=60
+            )
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                analyses = orjson.loads(data["choices"][0]["message"]["content"])["analyses"]
+                sources = data.get("citations") or ["Perplexity AI Online Search"]
+                timestamp = datetime.now().isoformat()
+                
+                for item in analyses:
+                    sid = item.get("series_id")
+                    if sid in unique_ids and sid not in results:
+                        results[sid] = {
+                            "summary": self._format_analysis(item),
+                            "outlook": "ANALYZED",
+                            "sources": sources,
+                            "timestamp": timestamp
+                        }
+            else:
+                logger.warning(
+                    f"Perplexity batch API error {response.status_code}: {self._parse_error(response)}"
+                )
+        except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Perplexity batch research failed, falling back per series: {e}")
+        
+        missing = [sid for sid in unique_ids if sid not in results]
+        if results and not missing:
+            logger.info(f"Perplexity batch research generated for {len(results)} series")
+            ordered = {sid: results[sid] for sid in unique_ids}
+            _response_cache.store("perplexity", cache_key, ordered)
+            return ordered
+        
+        for sid in missing:
+            results[sid] = self._research_or_error(sid, names.get(sid))
+        return {sid: results[sid] for sid in unique_ids}
+    
+    def _research_or_error(self, series_id: str, indicator_name: Optional[str]) -> Dict:
+        """get_research for one series, turning connection failures into error responses."""
+        try:
+            return self.get_research(series_id, indicator_name=indicator_name)
+        except APIConnectionError as e:
+            return self._error_response(e.message)
+    
+    def _build_batch_prompt(self, queries: Dict[str, str]) -> str:
+        """
+        Build the analysis prompt for several indicators.
+        
+        Args:
+            queries: {series_id: indicator name or ID}.
+            
+        Returns:
+            Formatted prompt string.
+        """
+        indicators = "\n".join(
+            f"- {sid}: {query} (https://fred.stlouisfed.org/series/{sid})"
+            for sid, query in queries.items()
+        )
+        return f"""Analyze the current state and short-term forecast for each of these US economy indicators:
+
+{indicators}
+
+For every indicator return one entry in "analyses" with:
+- series_id: the ID exactly as listed above
+- trend: current trend (3 markdown bullet points)
+- drivers: key drivers and recent developments
+- forecast: short-term forecast (next 3-6 months)
+
+Include markdown links to sources and keep it concise and actionable."""
+    
+    def _format_analysis(self, item: Dict) -> str:
+        """
+        Render one structured batch analysis as markdown.
+        
+        Args:
+            item: Entry of the "analyses" array.
+            
+        Returns:
+            Markdown summary (same sections as the single-series prompt).
+        """
+        return (
+            f"**Current trend**\n{item.get('trend', '')}\n\n"
+            f"**Key drivers**\n{item.get('drivers', '')}\n\n"
+            f"**Short-term forecast**\n{item.get('forecast', '')}"
+        )
+    
     def _build_prompt(self, query: str, fred_link: str) -> str:
         """
         Build the analysis prompt for Perplexity.
@@ -198,7 +411,7 @@ Keep it concise and actionable."""
             Error message string.
         """
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             return error_data.get("error", {}).get("message", response.text)
         except Exception:
             return response.text
@@ -7,33 +7,85 @@ Scrapes S&P 500 stocks list and earnings dates/price targets from stockanalysis.
 
 import os
 import sqlite3
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from lxml import html as lxml_html
 import pandas as pd
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from src.utils import get_logger
+from src.utils.http import build_session
+
+from . import _response_cache
 
 logger = get_logger(__name__)
 
+# (connect, read) seconds to wait for a stockanalysis.com response
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Concurrent ticker page fetches (matches the session pool size)
+OVERVIEW_WORKERS = 20
+
+# Seconds a parsed ticker overview is reused (pages change at most daily)
+OVERVIEW_CACHE_TTL = 12 * 3600
+
+# Tickers handed to a process-pool worker per task
+PROCESS_CHUNKSIZE = 4
+
 # Default database path
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 DB_PATH = os.path.join(DATA_DIR, "gielda_earning.db")
 
+# sp500_earning columns, in table order: list columns, then overview fields
+LIST_COLUMNS = ('nr', 'ticker', 'company_name', 'market_cap', 'price', 'change_pct', 'revenue', 'link')
+OVERVIEW_FIELDS = ('Price Target', 'analysts', 'Earnings Date')
+STOCK_COLUMNS = LIST_COLUMNS + OVERVIEW_FIELDS
+
+# Rebuilt on every refresh (the app re-creates its "Earnings Date" index)
+STOCKS_SCHEMA = (
+    "DROP TABLE IF EXISTS sp500_earning",
+    "CREATE TABLE sp500_earning (" + ", ".join(f'"{col}" TEXT' for col in STOCK_COLUMNS) + ")",
+)
+STOCKS_INSERT_SQL = (
+    "INSERT INTO sp500_earning VALUES (" + ", ".join("?" * len(STOCK_COLUMNS)) + ")"
+)
+
 
 class StocksScraper:
     """
     Scraper for S&P 500 stock data and earnings.
+    
+    All requests share one keep-alive session, so the ~500 ticker pages
+    reuse pooled TCP/TLS connections to stockanalysis.com; call close()
+    (or use the scraper as a context manager) to release them.
     """
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, cache_ttl: float = OVERVIEW_CACHE_TTL):
+        """
+        Args:
+            db_path: SQLite database for the sp500_earning table.
+            cache_ttl: Seconds a cached ticker overview is reused (0 disables).
+        """
         self.db_path = db_path or DB_PATH
+        self.cache_ttl = cache_ttl
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        # Single host: one pool, sized for concurrent ticker fetches
+        self.session = build_session(pool_connections=1, pool_maxsize=20)
+        self.session.headers.update(self.headers)
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+    
+    def __enter__(self) -> "StocksScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
 
     def scrape_sp500_list(self) -> pd.DataFrame:
         """Get the list of S&P 500 stocks from stockanalysis.com."""
@@ -41,27 +93,28 @@ class StocksScraper:
         logger.info(f"Fetching S&P 500 list from {url}")
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = lxml_html.fromstring(response.content)
             
-            table_body = soup.select_one('#main-table > tbody')
+            table_body = doc.xpath('//*[@id="main-table"]/tbody')
             if not table_body:
                 logger.error("Could not find S&P 500 table body")
                 return pd.DataFrame()
             
-            rows = table_body.find_all('tr')
-            container = []
-            for row in rows:
-                cells = row.find_all('td')
-                clean_row = [td.text.strip() for td in cells]
-                container.append(clean_row)
-            
-            column_names = ['nr', 'ticker', 'company_name', 'market_cap', 'price', 'change_pct', 'revenue']
-            df = pd.DataFrame(container, columns=column_names)
+            # All body cells in one XPath pass, reshaped into rows of n_cols
+            n_cols = len(LIST_COLUMNS) - 1
+            texts = [td.text_content().strip() for td in table_body[0].xpath('./tr/td')]
+            if len(texts) % n_cols:
+                logger.error(f"Unexpected S&P 500 table layout ({len(texts)} cells, {n_cols} columns)")
+                return pd.DataFrame()
+            # Column i is every n_cols-th cell starting at i (strided slices, no row lists)
+            df = pd.DataFrame({
+                col: texts[i::n_cols] for i, col in enumerate(LIST_COLUMNS[:-1])
+            })
             
             # Add link to stock page
-            df['link'] = df['ticker'].apply(lambda x: f'https://stockanalysis.com/stocks/{x.lower()}/')
+            df['link'] = 'https://stockanalysis.com/stocks/' + df['ticker'].str.lower() + '/'
             
             return df
         except Exception as e:
@@ -69,57 +122,94 @@ class StocksScraper:
             return pd.DataFrame()
 
     def scrape_stock_overview(self, ticker: str) -> Dict[str, Any]:
-        """Get earnings date and price target for a specific ticker."""
+        """
+        Get earnings date and price target for a specific ticker.
+        
+        Parsed overviews are cached for cache_ttl seconds; if the page
+        cannot be fetched, an expired cached overview is returned instead.
+        """
         url = f'https://stockanalysis.com/stocks/{ticker.lower()}/'
         # logger.debug(f"Fetching overview for {ticker}")
         
+        if self.cache_ttl > 0:
+            cached = _response_cache.load("stocks", ticker, max_age=self.cache_ttl)
+            if cached is not None:
+                return cached
+        
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            tables = soup.find_all('table')
-            if len(tables) < 2:
-                return {}
-            
-            rows = tables[1].find_all('tr')
+            # C-backed lxml parse; one XPath selects the rows of the second table
+            doc = lxml_html.fromstring(response.content)
+            rows = doc.xpath('(//table)[2]//tr')
             results = {}
             
+            def value_cell(index: int) -> Optional[str]:
+                """Text of the second cell of rows[index], if present."""
+                if len(rows) > index:
+                    cells = rows[index].xpath('.//td')
+                    if len(cells) >= 2:
+                        return cells[1].text_content().strip()
+                return None
+            
             # Market data from overview table
             # Row mapping (based on previous script logic):
             # 6: Analysts, 7: Price Target, 8: Earnings Date
             
             # Price Target
-            if len(rows) > 7:
-                cells = rows[7].find_all('td')
-                if len(cells) >= 2:
-                    results["Price Target"] = cells[1].text.strip()
+            price_target = value_cell(7)
+            if price_target is not None:
+                results["Price Target"] = price_target
             
             # Analyst Rating
-            if len(rows) > 6:
-                cells = rows[6].find_all('td')
-                if len(cells) >= 2:
-                    results["analysts"] = cells[1].text.strip()
+            analysts = value_cell(6)
+            if analysts is not None:
+                results["analysts"] = analysts
             
             # Earnings Date
-            if len(rows) > 8:
-                cells = rows[8].find_all('td')
-                if len(cells) >= 2:
-                    date_str = cells[1].text.strip()
-                    try:
-                        # Feb 25, 2026 -> 2026-02-25
-                        date_obj = datetime.strptime(date_str, '%b %d, %Y')
-                        results["Earnings Date"] = date_obj.strftime('%Y-%m-%d')
-                    except:
-                        results["Earnings Date"] = date_str
+            date_str = value_cell(8)
+            if date_str is not None:
+                try:
+                    # Feb 25, 2026 -> 2026-02-25
+                    date_obj = datetime.strptime(date_str, '%b %d, %Y')
+                    results["Earnings Date"] = date_obj.strftime('%Y-%m-%d')
+                except:
+                    results["Earnings Date"] = date_str
             
+            if results and self.cache_ttl > 0:
+                _response_cache.store("stocks", ticker, results)
             return results
         except Exception as e:
             # logger.error(f"Error scraping {ticker}: {e}")
+            if self.cache_ttl > 0:
+                # Stale-if-error: any earlier overview beats an empty row
+                stale = _response_cache.load("stocks", ticker, max_age=float("inf"))
+                if stale is not None:
+                    return stale
             return {}
 
-    def run(self, limit: Optional[int] = None) -> pd.DataFrame:
-        """Main execution method."""
+    def run(
+        self,
+        limit: Optional[int] = None,
+        max_workers: int = OVERVIEW_WORKERS,
+        processes: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Main execution method.
+        
+        Ticker overview pages are fetched concurrently over the shared
+        session (the work is network-bound). With `processes`, fetching
+        and HTML parsing run in a process pool instead, so parsing is not
+        serialized by the GIL; each worker process uses its own session.
+        
+        Args:
+            limit: Only process the first N stocks of the list.
+            max_workers: Maximum concurrent overview requests (threads).
+            processes: Number of worker processes; None uses threads.
+            
+        Returns:
+            S&P 500 list joined with the overview data (also saved to DB).
+        """
         logger.info("Starting S&P 500 data refresh...")
         df_sp500 = self.scrape_sp500_list()
         
@@ -133,31 +223,83 @@ class StocksScraper:
         overviews = []
         
         total = len(tickers)
-        for i, ticker in enumerate(tickers, 1):
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{total} stocks processed...")
-            
-            data = self.scrape_stock_overview(ticker)
-            overviews.append(data)
-            # time.sleep(0.1) # Be nice
+        executor: Executor
+        if processes:
+            executor = ProcessPoolExecutor(max_workers=processes)
+            fetch = _scrape_overview_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, total)))
+            fetch = self.scrape_stock_overview
+        
+        with executor:
+            # map() keeps results in ticker order for the positional zip below
+            results = executor.map(fetch, tickers, chunksize=PROCESS_CHUNKSIZE)
+            for i, data in enumerate(results, 1):
+                if i % 50 == 0:
+                    logger.info(f"Progress: {i}/{total} stocks processed...")
+                overviews.append(data)
             
-        df_overview = pd.DataFrame(overviews)
-        df_final = pd.concat([df_sp500, df_overview], axis=1)
+        # Column lists in STOCK_COLUMNS order (missing overview fields -> NULL)
+        columns = {col: df_sp500[col].tolist() for col in LIST_COLUMNS}
+        for field in OVERVIEW_FIELDS:
+            columns[field] = [overview.get(field) for overview in overviews]
+        
+        self.save_to_db(list(zip(*columns.values())))
+        return pd.DataFrame(columns)
+    
+    def save_to_db(self, rows: List[Tuple]) -> bool:
+        """
+        Replace the sp500_earning table with rows.
+        
+        The drop, create and a single executemany insert run in one
+        explicit transaction (one commit instead of per-statement syncs),
+        in WAL mode so readers keep seeing the previous table until it
+        commits.
         
-        # Save to DB
+        Args:
+            rows: Tuples in STOCK_COLUMNS order.
+            
+        Returns:
+            True if the table was written.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            df_final.to_sql('sp500_earning', conn, if_exists='replace', index=False)
-            conn.close()
-            logger.info(f"Saved {len(df_final)} stocks to {self.db_path}")
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for statement in STOCKS_SCHEMA:
+                        conn.execute(statement)
+                    conn.executemany(STOCKS_INSERT_SQL, rows)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.close()
+            logger.info(f"Saved {len(rows)} stocks to {self.db_path}")
+            return True
         except Exception as e:
             logger.error(f"Error saving stocks to DB: {e}")
-            
-        return df_final
+            return False
+
+
+# Scraper of the current pool worker process (one session per process)
+_worker_scraper: Optional[StocksScraper] = None
+
+
+def _scrape_overview_worker(ticker: str) -> Dict[str, Any]:
+    """Process-pool entry point: scrape one ticker with this process's scraper."""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = StocksScraper()
+    return _worker_scraper.scrape_stock_overview(ticker)
 
 
 if __name__ == "__main__":
-    scraper = StocksScraper()
-    # Test with 10 stocks
-    df = scraper.run(limit=10)
+    with StocksScraper() as scraper:
+        # Test with 10 stocks
+        df = scraper.run(limit=10)
     print(df)
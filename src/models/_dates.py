@@ -0,0 +1,72 @@
+"""
+Formatowanie Dat Wyników Modeli
+===============================
+
+Ten moduł zamienia indeksy dat szeregów (bez strefy czasowej) na listy
+napisów "YYYY-MM-DD" dla wyników modeli jednym wywołaniem
+`np.datetime_as_string` zamiast formatowania `strftime` każdego znacznika
+czasu w Pythonie. Daty prognozy dla typowych częstotliwości (MS, D, W)
+są wyliczane arytmetyką `np.datetime64` bez budowania `pd.date_range`.
+
+Przykład użycia:
+    from src.models._dates import future_dates, iso_dates
+
+    iso_dates(series.index)  # ["2024-01-01", "2024-02-01", ...]
+    future_dates(series.index[-1], 6, "MS")  # 6 kolejnych początków miesięcy
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def iso_dates(index: pd.DatetimeIndex) -> List[str]:
+    """
+    Format a tz-naive DatetimeIndex as ISO dates.
+
+    Equivalent to index.strftime("%Y-%m-%d").tolist() for tz-naive
+    indexes (tz-aware ones would be converted to UTC dates).
+
+    Args:
+        index: Dates to format.
+
+    Returns:
+        List of "YYYY-MM-DD" strings.
+    """
+    return np.datetime_as_string(np.asarray(index, dtype="datetime64[ns]"), unit="D").tolist()
+
+
+def future_dates(last: pd.Timestamp, h_future: int, freq: Optional[str]) -> List[str]:
+    """
+    Format the h_future dates following `last` as ISO dates.
+
+    Equivalent to iso_dates(pd.date_range(start=last, periods=h_future + 1,
+    freq=freq)[1:]). Monthly-start, daily and weekly (Sunday) steps from a
+    date already on that grid use datetime64 arithmetic; anything else
+    falls back to pd.date_range.
+
+    Args:
+        last: Last observed date (tz-naive).
+        h_future: Number of future periods.
+        freq: Pandas frequency alias of the series (e.g. 'MS').
+
+    Returns:
+        List of h_future "YYYY-MM-DD" strings.
+    """
+    last = pd.Timestamp(last)
+    steps = np.arange(1, h_future + 1)
+    day = np.datetime64(last.date(), "D")
+    on_day = last == last.normalize()
+
+    future = None
+    if freq == "MS" and on_day and last.day == 1:
+        future = (np.datetime64(last.date(), "M") + steps).astype("datetime64[D]")
+    elif freq == "D":
+        future = day + steps.astype("timedelta64[D]")
+    elif freq in ("W", "W-SUN") and on_day and last.dayofweek == 6:
+        future = day + (7 * steps).astype("timedelta64[D]")
+
+    if future is None:
+        return iso_dates(pd.date_range(start=last, periods=h_future + 1, freq=freq)[1:])
+    return np.datetime_as_string(future, unit="D").tolist()
@@ -0,0 +1,46 @@
+"""
+Metryki Błędu Prognoz
+=====================
+
+Ten moduł zawiera proste metryki błędu (MAE, MSE) o tych samych nazwach
+co w `sklearn.metrics`, liczone bezpośrednio w NumPy, aby modele nie
+importowały całego `sklearn` przy starcie procesu.
+
+Przykład użycia:
+    from src.models._metrics import mean_absolute_error, mean_squared_error
+
+    mae = mean_absolute_error(test_actual, fc_test)
+    rmse = np.sqrt(mean_squared_error(test_actual, fc_test))
+"""
+
+import numpy as np
+
+
+def mean_absolute_error(actual, predicted) -> float:
+    """
+    Mean absolute error (drop-in for sklearn.metrics.mean_absolute_error).
+
+    Args:
+        actual: Observed values (array-like, compared positionally).
+        predicted: Predicted values of the same length.
+
+    Returns:
+        Mean of |actual - predicted|.
+    """
+    diff = np.asarray(actual, dtype=float) - np.asarray(predicted, dtype=float)
+    return float(np.mean(np.abs(diff)))
+
+
+def mean_squared_error(actual, predicted) -> float:
+    """
+    Mean squared error (drop-in for sklearn.metrics.mean_squared_error).
+
+    Args:
+        actual: Observed values (array-like, compared positionally).
+        predicted: Predicted values of the same length.
+
+    Returns:
+        Mean of (actual - predicted) ** 2.
+    """
+    diff = np.asarray(actual, dtype=float) - np.asarray(predicted, dtype=float)
+    return float(np.dot(diff, diff) / diff.size)
@@ -20,11 +20,35 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 from src.utils import get_logger
 
+from ._dates import future_dates, iso_dates
+from ._metrics import mean_absolute_error, mean_squared_error
+
 logger = get_logger(__name__)
 
+# statsmodels ARIMA class, imported on first use (the import is slow and
+# only needed when a model is actually fitted)
+_ARIMA = None
+
+
+def _get_arima():
+    """Return the statsmodels ARIMA class, importing it once per process."""
+    global _ARIMA
+    if _ARIMA is None:
+        from statsmodels.tsa.arima.model import ARIMA
+        _ARIMA = ARIMA
+    return _ARIMA
+
+
+# Opinion line per MAPE tier: (upper bound in %, text), checked in order
+_MAPE_TIERS = (
+    (5, "✅ **Doskonałe dopasowanie** - MAPE < 5%. Model wykazuje bardzo wysoką precyzję.\n"),
+    (10, "✅ **Dobre dopasowanie** - MAPE < 10%. Model jest wiarygodny do prognozowania.\n"),
+    (15, "⚠️ **Zadowalające dopasowanie** - MAPE < 15%. Używaj z ostrożnością.\n"),
+    (float("inf"), "❌ **Słabe dopasowanie** - MAPE > 15%. Model ma ograniczoną wartość predykcyjną.\n"),
+)
+
 
 class ARIMAAnalyzer:
     """
@@ -52,13 +76,16 @@ class ARIMAAnalyzer:
         """
         self.data = data
         self.inferred_freq = inferred_freq
-        logger.debug(f"Initialized ARIMAAnalyzer with {len(data)} observations")
+        # _get_chart_historical results keyed by (months, day ordinal)
+        self._historical_cache: Dict[Tuple[int, int], dict] = {}
+        logger.debug("Initialized ARIMAAnalyzer with %d observations", len(data))
     
     def analyze(
         self,
         order: Tuple[int, int, int] = (1, 1, 1),
         n_test: int = 12,
-        h_future: int = 6
+        h_future: int = 6,
+        refit: bool = False
     ) -> Dict:
         """
         Perform complete ARIMA analysis with diagnostics.
@@ -67,13 +94,15 @@ class ARIMAAnalyzer:
         1. Splits data into train/test sets
         2. Fits ARIMA on training data
         3. Evaluates on test data
-        4. Refits on full data for future forecast
+        4. Extends the fit with the test data for future forecast
         5. Generates confidence intervals and opinion
         
         Args:
             order: ARIMA order as tuple (p, d, q).
             n_test: Number of observations to use for testing.
             h_future: Number of future periods to forecast.
+            refit: Re-estimate parameters on the full data (second MLE fit)
+                instead of reusing the training parameters.
             
         Returns:
             Dictionary containing:
@@ -87,7 +116,8 @@ class ARIMAAnalyzer:
             - historical: Full historical data
             - opinion: AI-generated model quality assessment
         """
-        logger.info(f"Running ARIMA{order} analysis: n_test={n_test}, h_future={h_future}")
+        logger.info("Running ARIMA%s analysis: n_test=%d, h_future=%d", order, n_test, h_future)
+        ARIMA = _get_arima()
         
         train = self.data.iloc[:-n_test]
         test = self.data.iloc[-n_test:]
@@ -95,35 +125,37 @@ class ARIMAAnalyzer:
         # Fit model on training data
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
-            # Lazy import to speed up startup
-            from statsmodels.tsa.arima.model import ARIMA
             model = ARIMA(train, order=order)
             res = model.fit()
-            logger.debug(f"ARIMA model fitted on training data: AIC={res.aic:.2f}")
+            logger.debug("ARIMA model fitted on training data: AIC=%.2f", res.aic)
 
         # Test phase predictions
         fc_test = res.forecast(steps=n_test)
-        mae = mean_absolute_error(test, fc_test)
-        rmse = np.sqrt(mean_squared_error(test, fc_test))
-        mape = np.mean(np.abs((test - fc_test) / test)) * 100 if (test != 0).all() else 999
         
-        logger.info(f"Test metrics: MAE={mae:.4f}, RMSE={rmse:.4f}, MAPE={mape:.2f}%")
+        # Metrics on plain arrays (positional, no index alignment)
+        actual = test.to_numpy(dtype=float)
+        predicted = np.asarray(fc_test, dtype=float)
+        mae = mean_absolute_error(actual, predicted)
+        rmse = np.sqrt(mean_squared_error(actual, predicted))
+        mape = np.abs((actual - predicted) / actual).mean() * 100 if (actual != 0).all() else 999
+        
+        logger.info("Test metrics: MAE=%.4f, RMSE=%.4f, MAPE=%.2f%%", mae, rmse, mape)
 
-        # Fit on full data for future forecast
-        # Fit on full data for future forecast
-        # Lazy import (redundant if already imported but safe)
-        from statsmodels.tsa.arima.model import ARIMA
-        full_model = ARIMA(self.data, order=order)
-        res_full = full_model.fit()
+        # Full-data results for the future forecast: append the test period to
+        # the training fit (Kalman filter update with the same parameters)
+        # rather than running a second maximum-likelihood optimization
+        res_full = None
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            if not refit:
+                try:
+                    res_full = res.append(test, refit=False)
+                except Exception as e:
+                    logger.debug("ARIMA append failed, refitting on full data: %s", e)
+            if res_full is None:
+                res_full = ARIMA(self.data, order=order).fit()
         fc_future = res_full.forecast(steps=h_future)
 
-        # Generate future dates
-        future_index = pd.date_range(
-            start=self.data.index[-1],
-            periods=h_future + 1,
-            freq=self.inferred_freq
-        )[1:]
-
         # Generate AI opinion
         metrics = {
             "MAE": mae,
@@ -135,8 +167,8 @@ class ARIMAAnalyzer:
         opinion = self._generate_opinion(res_full, metrics)
 
         # Calculate differences for diff analysis
-        test_diff = test.diff().fillna(0)
-        fc_test_diff = pd.Series(fc_test).diff().fillna(0)
+        test_diff = np.diff(actual, prepend=actual[0])
+        fc_test_diff = np.diff(predicted, prepend=predicted[0])
 
         return {
             "model": f"ARIMA{order}",
@@ -153,15 +185,15 @@ class ARIMAAnalyzer:
             "pvalues": {k: float(v) for k, v in res_full.pvalues.to_dict().items()},
             "tstats": {k: float(v) for k, v in res_full.tvalues.to_dict().items()},
             "comparison": {
-                "dates": test.index.strftime("%Y-%m-%d").tolist(),
-                "actual": test.tolist(),
-                "predict": fc_test.tolist(),
+                "dates": iso_dates(test.index),
+                "actual": actual.tolist(),
+                "predict": predicted.tolist(),
                 "actual_diff": test_diff.tolist(),
                 "predict_diff": fc_test_diff.tolist(),
                 "diff_error": (test_diff - fc_test_diff).tolist()
             },
             "forecast": {
-                "dates": future_index.strftime("%Y-%m-%d").tolist(),
+                "dates": future_dates(self.data.index[-1], h_future, self.inferred_freq),
                 "values": fc_future.tolist(),
                 "sigma_1_up": (fc_future + rmse).tolist(),
                 "sigma_1_down": (fc_future - rmse).tolist(),
@@ -189,18 +221,13 @@ class ARIMAAnalyzer:
         msg = "**Analiza Jakości Modelu ARIMA:**\n\n"
         
         mape = metrics.get("MAPE", 100)
-        if mape < 5:
-            msg += "✅ **Doskonałe dopasowanie** - MAPE < 5%. Model wykazuje bardzo wysoką precyzję.\n"
-        elif mape < 10:
-            msg += "✅ **Dobre dopasowanie** - MAPE < 10%. Model jest wiarygodny do prognozowania.\n"
-        elif mape < 15:
-            msg += "⚠️ **Zadowalające dopasowanie** - MAPE < 15%. Używaj z ostrożnością.\n"
-        else:
-            msg += "❌ **Słabe dopasowanie** - MAPE > 15%. Model ma ograniczoną wartość predykcyjną.\n"
+        # NaN MAPE compares False everywhere and falls through to the last tier
+        msg += next((text for bound, text in _MAPE_TIERS if mape < bound), _MAPE_TIERS[-1][1])
         
         # Statistical significance
-        sig_count = sum(1 for p in model_res.pvalues if p < 0.05)
-        total_params = len(model_res.pvalues)
+        pvalues = np.asarray(model_res.pvalues, dtype=float)
+        sig_count = int(np.count_nonzero(pvalues < 0.05))
+        total_params = pvalues.size
         msg += f"\n**Istotność statystyczna:** {sig_count}/{total_params} parametrów istotnych (p < 0.05).\n"
         
         if sig_count < total_params / 2:
@@ -226,20 +253,27 @@ class ARIMAAnalyzer:
         Returns:
             Słownik z datami i wartościami dla ostatnich N miesięcy
         """
-        from datetime import datetime
+        from datetime import date, datetime
         from dateutil.relativedelta import relativedelta
         
+        key = (months, date.today().toordinal())
+        cached = self._historical_cache.get(key)
+        if cached is not None:
+            return cached
+        
         cutoff_date = datetime.now() - relativedelta(months=months)
         
-        # Filtruj dane do ostatnich N miesięcy
-        filtered = self.data[self.data.index >= cutoff_date]
+        # Filtruj dane do ostatnich N miesięcy (indeks posortowany: wyszukiwanie binarne)
+        filtered = self.data.iloc[self.data.index.searchsorted(cutoff_date):]
         
         # Jeśli brak danych po filtrze, zwróć wszystko
         if filtered.empty:
             filtered = self.data
         
-        return {
-            "dates": filtered.index.strftime("%Y-%m-%d").tolist(),
+        result = {
+            "dates": iso_dates(filtered.index),
             "values": filtered.tolist()
         }
+        self._historical_cache[key] = result
+        return result
 
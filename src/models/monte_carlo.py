@@ -13,14 +13,16 @@ Przykład użycia:
     results = simulator.analyze(simulations=1000, n_test=12, h_future=6)
 """
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 
 from src.utils import get_logger
 
+from ._dates import future_dates, iso_dates
+from ._metrics import mean_absolute_error, mean_squared_error
+
 logger = get_logger(__name__)
 
 
@@ -35,19 +37,26 @@ class MonteCarloSimulator:
     Attributes:
         data (pd.Series): Time series data for analysis.
         inferred_freq (str): Inferred frequency of the data.
+        rng (np.random.Generator): PCG64 generator used for the simulated paths.
     """
     
-    def __init__(self, data: pd.Series, inferred_freq: str):
+    def __init__(self, data: pd.Series, inferred_freq: str, seed: Optional[int] = None):
         """
         Initialize the Monte Carlo simulator.
         
         Args:
             data: Time series data as pandas Series with DatetimeIndex.
             inferred_freq: Frequency of the time series (e.g., 'MS' for monthly).
+            seed: Optional seed for reproducible simulations (fresh entropy if None).
         """
         self.data = data
         self.inferred_freq = inferred_freq
-        logger.debug(f"Initialized MonteCarloSimulator with {len(data)} observations")
+        # _get_chart_historical results keyed by (months, day ordinal)
+        self._historical_cache: Dict[Tuple[int, int], dict] = {}
+        # Own generator per simulator: faster than the legacy global
+        # MT19937 state and not shared between threads/worker processes
+        self.rng = np.random.default_rng(seed)
+        logger.debug("Initialized MonteCarloSimulator with %d observations", len(data))
     
     def analyze(
         self,
@@ -78,30 +87,28 @@ class MonteCarloSimulator:
             - historical: Full historical data
             - opinion: Model quality assessment
         """
-        logger.info(f"Running Monte Carlo: simulations={simulations}, n_test={n_test}, h_future={h_future}")
+        logger.info(
+            "Running Monte Carlo: simulations=%d, n_test=%d, h_future=%d",
+            simulations, n_test, h_future
+        )
         
         returns = self.data.pct_change().dropna()
         
         mu = returns.mean()
         sigma = returns.std()
         
-        logger.debug(f"Return statistics: mean={mu:.6f}, std={sigma:.6f}")
+        logger.debug("Return statistics: mean=%.6f, std=%.6f", mu, sigma)
         
-        # Test phase: backtest using rolling window
-        test_preds = []
-        for i in range(n_test):
-            train_data = self.data.iloc[:-(n_test - i)]
-            train_returns = train_data.pct_change().dropna()
-            mu_train = train_returns.mean()
-            sigma_train = train_returns.std()
-            last_price = train_data.iloc[-1]
-            
-            # Simulate 1 step ahead
-            sims = [
-                last_price * (1 + np.random.normal(mu_train, sigma_train))
-                for _ in range(simulations)
-            ]
-            test_preds.append(np.mean(sims))
+        # Test phase: backtest using an expanding window. Step i trains on
+        # data[:-(n_test - i)], so its mean return is the expanding mean
+        # ending one observation before the i-th test point.
+        window = slice(-n_test - 1, -1)
+        mu_train = self.data.pct_change().expanding().mean().to_numpy()[window]
+        last_prices = self.data.to_numpy(dtype=float)[window]
+        
+        # 1-step-ahead prediction: the mean of simulated last_price * (1 + N(mu, sigma))
+        # paths converges to its expectation, so use it directly (no sampling noise)
+        test_preds = last_prices * (1 + mu_train)
         
         fc_test = pd.Series(test_preds, index=self.data.index[-n_test:])
         test_actual = self.data.iloc[-n_test:]
@@ -110,33 +117,21 @@ class MonteCarloSimulator:
         mae = mean_absolute_error(test_actual, fc_test)
         rmse = np.sqrt(mean_squared_error(test_actual, fc_test))
         
-        logger.info(f"MC metrics: MAE={mae:.4f}, RMSE={rmse:.4f}")
-        
-        # Future forecast with full simulation paths
-        last_price = self.data.iloc[-1]
-        all_paths = []
-        
-        for _ in range(simulations):
-            prices = [last_price]
-            for _ in range(h_future):
-                prices.append(prices[-1] * (1 + np.random.normal(mu, sigma)))
-            all_paths.append(prices[1:])
-        
-        all_paths = np.array(all_paths)
+        logger.info("MC metrics: MAE=%.4f, RMSE=%.4f", mae, rmse)
+        
+        # Future forecast with full simulation paths: (simulations, h_future)
+        last_price = float(self.data.iloc[-1])
+        # Built in place in one buffer: growth factors 1 + N(mu, sigma),
+        # compounded along each path, then scaled to prices
+        all_paths = self.rng.standard_normal((simulations, h_future))
+        all_paths *= sigma
+        all_paths += 1 + mu
+        np.cumprod(all_paths, axis=1, out=all_paths)
+        all_paths *= last_price
         fc_future = np.mean(all_paths, axis=0)
         
-        # Percentile-based confidence intervals
-        p5 = np.percentile(all_paths, 5, axis=0)
-        p25 = np.percentile(all_paths, 25, axis=0)
-        p75 = np.percentile(all_paths, 75, axis=0)
-        p95 = np.percentile(all_paths, 95, axis=0)
-        
-        # Generate future dates
-        future_index = pd.date_range(
-            start=self.data.index[-1],
-            periods=h_future + 1,
-            freq=self.inferred_freq
-        )[1:]
+        # Percentile-based confidence intervals (one partition pass for all four)
+        p5, p25, p75, p95 = np.percentile(all_paths, [5, 25, 75, 95], axis=0)
         
         # Differences
         test_diff = test_actual.diff().fillna(0)
@@ -155,7 +150,7 @@ class MonteCarloSimulator:
                 "Simulations": simulations
             },
             "comparison": {
-                "dates": test_actual.index.strftime("%Y-%m-%d").tolist(),
+                "dates": iso_dates(test_actual.index),
                 "actual": test_actual.tolist(),
                 "predict": fc_test.tolist(),
                 "actual_diff": test_diff.tolist(),
@@ -163,7 +158,7 @@ class MonteCarloSimulator:
                 "diff_error": (test_diff - fc_test_diff).tolist()
             },
             "forecast": {
-                "dates": future_index.strftime("%Y-%m-%d").tolist(),
+                "dates": future_dates(self.data.index[-1], h_future, self.inferred_freq),
                 "values": fc_future.tolist(),
                 "sigma_1_up": p75.tolist(),     # 75th percentile
                 "sigma_1_down": p25.tolist(),   # 25th percentile
@@ -202,16 +197,25 @@ class MonteCarloSimulator:
         """
         Zwraca dane historyczne ograniczone do ostatnich N miesięcy.
         """
-        from datetime import datetime
+        from datetime import date, datetime
         from dateutil.relativedelta import relativedelta
         
+        key = (months, date.today().toordinal())
+        cached = self._historical_cache.get(key)
+        if cached is not None:
+            return cached
+        
         cutoff_date = datetime.now() - relativedelta(months=months)
-        filtered = self.data[self.data.index >= cutoff_date]
+        
+        # Filtruj dane do ostatnich N miesięcy (indeks posortowany: wyszukiwanie binarne)
+        filtered = self.data.iloc[self.data.index.searchsorted(cutoff_date):]
         
         if filtered.empty:
             filtered = self.data
         
-        return {
-            "dates": filtered.index.strftime("%Y-%m-%d").tolist(),
+        result = {
+            "dates": iso_dates(filtered.index),
             "values": filtered.tolist()
         }
+        self._historical_cache[key] = result
+        return result
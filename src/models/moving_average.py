@@ -13,16 +13,20 @@ Przykład użycia:
     
     analyzer = MovingAverageAnalyzer(data, inferred_freq="MS")
     results = analyzer.analyze(windows=[3, 6, 12], n_test=12, h_future=6)
+
+    # Wiele szeregów o wspólnym indeksie naraz (kolumny DataFrame)
+    by_state = MovingAverageAnalyzer.analyze_many(states_df, "MS", windows=[3, 6, 12])
 """
 
-from typing import Dict, List, Union
+from typing import Dict, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 
 from src.utils import get_logger
 
+from ._dates import future_dates, iso_dates
+
 logger = get_logger(__name__)
 
 
@@ -48,11 +52,13 @@ class MovingAverageAnalyzer:
         """
         self.data = data
         self.inferred_freq = inferred_freq
-        logger.debug(f"Initialized MovingAverageAnalyzer with {len(data)} observations")
+        # _get_chart_historical results keyed by (months, day ordinal)
+        self._historical_cache: Dict[Tuple[int, int], dict] = {}
+        logger.debug("Initialized MovingAverageAnalyzer with %d observations", len(data))
     
     def analyze(
         self,
-        windows: Union[List[int], int] = [3],
+        windows: Union[Sequence[int], np.ndarray, int] = 3,
         n_test: int = 12,
         h_future: int = 6
     ) -> Dict:
@@ -66,7 +72,7 @@ class MovingAverageAnalyzer:
         4. Generates future forecast
         
         Args:
-            windows: List of window sizes or single window size.
+            windows: Window sizes (list or array) or a single window size.
             n_test: Number of observations to use for testing.
             h_future: Number of future periods to forecast.
             
@@ -79,57 +85,164 @@ class MovingAverageAnalyzer:
             - historical: Full historical data
             - opinion: Model quality assessment
         """
-        # Support single window as int
-        if isinstance(windows, int):
-            windows = [windows]
+        # Scalar or sequence/array -> list of Python ints (also JSON-safe for stats)
+        windows = np.atleast_1d(windows).astype(np.int64).tolist()
         
-        logger.info(f"Running MA analysis: windows={windows}, n_test={n_test}, h_future={h_future}")
+        logger.info("Running MA analysis: windows=%s, n_test=%d, h_future=%d", windows, n_test, h_future)
         
-        all_test_preds = []
-        all_future_preds = []
+        values = self.data.to_numpy(dtype=float)
+        ensemble = self._ensemble(values[None, :], windows, n_test)
+        mae, rmse, mape = self._metrics(values[None, -n_test:], ensemble[:, :-1])
         
-        for window in windows:
-            # Test phase predictions
-            test_preds = []
-            for i in range(n_test):
-                hist = self.data.iloc[:-(n_test - i)]
-                test_preds.append(hist.tail(window).mean())
-            all_test_preds.append(test_preds)
-            
-            # Future prediction
-            last_val = self.data.tail(window).mean()
-            all_future_preds.append([last_val] * h_future)
+        logger.info("MA metrics: MAE=%.4f, RMSE=%.4f, MAPE=%.2f%%", mae[0], rmse[0], mape[0])
         
-        # Ensemble: average across all windows
-        fc_test = pd.Series(
-            np.mean(all_test_preds, axis=0),
-            index=self.data.index[-n_test:]
+        return self._build_result(
+            values, ensemble[0], windows, n_test, h_future, mae[0], rmse[0], mape[0]
         )
-        fc_future = np.mean(all_future_preds, axis=0)
+    
+    @classmethod
+    def analyze_many(
+        cls,
+        df: pd.DataFrame,
+        inferred_freq: str,
+        windows: Union[Sequence[int], np.ndarray, int] = 3,
+        n_test: int = 12,
+        h_future: int = 6
+    ) -> Dict[str, Dict]:
+        """
+        Run the same Moving Average analysis on many aligned series at once.
+        
+        The rolling means, ensemble and metrics are computed for all columns
+        in one batched pass (one row per series) instead of one analyze()
+        call per series. Rows with a missing value in any column are dropped,
+        so pass series that share their index (e.g. the same indicator for
+        every state); analyze series with different histories separately.
         
-        test_actual = self.data.iloc[-n_test:]
+        Args:
+            df: Series as columns, DatetimeIndex as index.
+            inferred_freq: Frequency shared by all columns (e.g., 'MS').
+            windows: Window sizes (list or array) or a single window size.
+            n_test: Number of observations to use for testing.
+            h_future: Number of future periods to forecast.
+            
+        Returns:
+            Dictionary mapping column name to the same result dict analyze() returns.
+        """
+        windows = np.atleast_1d(windows).astype(np.int64).tolist()
+        df = df.dropna()
         
-        # Calculate metrics
-        mae = mean_absolute_error(test_actual, fc_test)
-        rmse = np.sqrt(mean_squared_error(test_actual, fc_test))
-        mape = (
-            np.mean(np.abs((test_actual - fc_test) / test_actual)) * 100
-            if (test_actual != 0).all()
-            else 999
+        logger.info(
+            "Running batched MA analysis: series=%d, windows=%s, n_test=%d, h_future=%d",
+            df.shape[1], windows, n_test, h_future
         )
         
-        logger.info(f"MA metrics: MAE={mae:.4f}, RMSE={rmse:.4f}, MAPE={mape:.2f}%")
+        # (n_series, n_obs): each row is one series
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64).T)
+        ensemble = cls._ensemble(values, windows, n_test)
+        mae, rmse, mape = cls._metrics(values[:, -n_test:], ensemble[:, :-1])
+        
+        results = {}
+        for i, column in enumerate(df.columns):
+            analyzer = cls(df[column], inferred_freq)
+            results[column] = analyzer._build_result(
+                values[i], ensemble[i], windows, n_test, h_future, mae[i], rmse[i], mape[i]
+            )
+        return results
+    
+    @staticmethod
+    def _ensemble(values: np.ndarray, windows: Sequence[int], n_test: int) -> np.ndarray:
+        """
+        Compute the ensemble trailing-window means for a batch of series.
+        
+        Args:
+            values: Observations, shape (n_series, n_obs).
+            windows: Window sizes.
+            n_test: Number of test observations.
+            
+        Returns:
+            Array of shape (n_series, n_test + 1): the 1-step-ahead predictions
+            for each test point, then the level after the last observation.
+        """
+        n_obs = values.shape[1]
+        n_hist = n_obs - n_test
+        
+        # Prefix sums: any trailing-window mean is (cs[end + 1] - cs[start]) / count,
+        # O(1) per window end instead of re-reading `window` values
+        cs = np.zeros((values.shape[0], n_obs + 1))
+        np.cumsum(values, axis=1, dtype=np.float64, out=cs[:, 1:])
+        # Window ends: one before each test point (test predictions), then the
+        # last observation (future level)
+        ends = np.arange(n_hist - 1, n_obs)
         
-        # Generate future dates
-        future_index = pd.date_range(
-            start=self.data.index[-1],
-            periods=h_future + 1,
-            freq=self.inferred_freq
-        )[1:]
+        # All windows at once: one row per window, one column per window end.
+        # Starts are clipped at the series start, so short histories average
+        # what is available (as tail(window) did).
+        starts = np.maximum(ends - np.asarray(windows)[:, None] + 1, 0)
+        # (n_series, n_windows, n_ends)
+        means = (cs[:, ends + 1][:, None, :] - cs[:, starts]) / (ends + 1 - starts)
+        
+        # Ensemble: average across all windows
+        return means.mean(axis=1)
+    
+    @staticmethod
+    def _metrics(actual: np.ndarray, predicted: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute MAE, RMSE and MAPE per series from one error array.
+        
+        Args:
+            actual: Test observations, shape (n_series, n_test).
+            predicted: Test predictions, same shape.
+            
+        Returns:
+            (mae, rmse, mape) arrays of length n_series; MAPE is 999.0 for
+            series with a zero observation in the test period.
+        """
+        diff = actual - predicted
+        mae = np.abs(diff).mean(axis=1)
+        rmse = np.sqrt((diff * diff).mean(axis=1))
+        nonzero = (actual != 0).all(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mape = np.where(nonzero, np.abs(diff / actual).mean(axis=1) * 100, 999.0)
+        return mae, rmse, mape
+    
+    def _build_result(
+        self,
+        values: np.ndarray,
+        ensemble: np.ndarray,
+        windows: Sequence[int],
+        n_test: int,
+        h_future: int,
+        mae: float,
+        rmse: float,
+        mape: float
+    ) -> Dict:
+        """
+        Assemble the analyze() result dictionary for this analyzer's series.
+        
+        Args:
+            values: Observations of self.data as float array.
+            ensemble: Ensemble means for this series (see _ensemble).
+            windows: Window sizes.
+            n_test: Number of test observations.
+            h_future: Number of future periods to forecast.
+            mae: Mean Absolute Error on the test period.
+            rmse: Root Mean Squared Error on the test period.
+            mape: Mean Absolute Percentage Error on the test period.
+            
+        Returns:
+            Result dictionary (see analyze()).
+        """
+        mae, rmse, mape = float(mae), float(rmse), float(mape)
+        
+        # Plain arrays for the test period (positions match self.data.index[-n_test:])
+        fc_test = ensemble[:-1]
+        actual = values[-n_test:]
+        # Each window forecasts a flat level, so the ensemble future is flat too
+        fc_future = np.full(h_future, ensemble[-1])
         
         # Differences
-        test_diff = test_actual.diff().fillna(0)
-        fc_test_diff = fc_test.diff().fillna(0)
+        test_diff = np.diff(actual, prepend=actual[0])
+        fc_test_diff = np.diff(fc_test, prepend=fc_test[0])
         
         # Model name
         model_name = (
@@ -144,26 +257,26 @@ class MovingAverageAnalyzer:
         return {
             "model": model_name,
             "stats": {
-                "MAE": float(mae),
-                "RMSE": float(rmse),
-                "MAPE": float(mape),
-                "Windows": windows
+                "MAE": mae,
+                "RMSE": rmse,
+                "MAPE": mape,
+                "Windows": list(windows)
             },
             "comparison": {
-                "dates": test_actual.index.strftime("%Y-%m-%d").tolist(),
-                "actual": test_actual.tolist(),
+                "dates": iso_dates(self.data.index[-n_test:]),
+                "actual": actual.tolist(),
                 "predict": fc_test.tolist(),
                 "actual_diff": test_diff.tolist(),
                 "predict_diff": fc_test_diff.tolist(),
                 "diff_error": (test_diff - fc_test_diff).tolist()
             },
             "forecast": {
-                "dates": future_index.strftime("%Y-%m-%d").tolist(),
+                "dates": future_dates(self.data.index[-1], h_future, self.inferred_freq),
                 "values": fc_future.tolist(),
-                "sigma_1_up": [v + rmse for v in fc_future],
-                "sigma_1_down": [v - rmse for v in fc_future],
-                "sigma_2_up": [v + 2 * rmse for v in fc_future],
-                "sigma_2_down": [v - 2 * rmse for v in fc_future],
+                "sigma_1_up": (fc_future + rmse).tolist(),
+                "sigma_1_down": (fc_future - rmse).tolist(),
+                "sigma_2_up": (fc_future + 2 * rmse).tolist(),
+                "sigma_2_down": (fc_future - 2 * rmse).tolist(),
             },
             "historical": self._get_chart_historical(months=120),
             "opinion": opinion
@@ -194,16 +307,25 @@ class MovingAverageAnalyzer:
         """
         Zwraca dane historyczne ograniczone do ostatnich N miesięcy.
         """
-        from datetime import datetime
+        from datetime import date, datetime
         from dateutil.relativedelta import relativedelta
         
+        key = (months, date.today().toordinal())
+        cached = self._historical_cache.get(key)
+        if cached is not None:
+            return cached
+        
         cutoff_date = datetime.now() - relativedelta(months=months)
-        filtered = self.data[self.data.index >= cutoff_date]
+        
+        # Filtruj dane do ostatnich N miesięcy (indeks posortowany: wyszukiwanie binarne)
+        filtered = self.data.iloc[self.data.index.searchsorted(cutoff_date):]
         
         if filtered.empty:
             filtered = self.data
         
-        return {
-            "dates": filtered.index.strftime("%Y-%m-%d").tolist(),
+        result = {
+            "dates": iso_dates(filtered.index),
             "values": filtered.tolist()
         }
+        self._historical_cache[key] = result
+        return result
@@ -5,6 +5,9 @@ Utils Module
 Contains utility functions and classes:
 - Logging configuration
 - Custom exceptions
+- Inter-process file locks
+- Pooled HTTP sessions (import from src.utils.http directly)
+- SQLite-backed caches (import from src.utils.sqlite_cache directly)
 """
 
 from .logging_config import setup_logging, get_logger
@@ -14,6 +17,7 @@ from .exceptions import (
     APIConnectionError,
     ModelFitError,
 )
+from .locking import try_lock_file, lock_file, release_lock_file
 
 __all__ = [
     "setup_logging",
@@ -22,4 +26,7 @@ __all__ = [
     "DataFetchError",
     "APIConnectionError",
     "ModelFitError",
+    "try_lock_file",
+    "lock_file",
+    "release_lock_file",
 ]
@@ -39,13 +39,18 @@ class TerminalBaseException(Exception):
         """
         self.message = message
         self.details = details or {}
+        # Rendered on first __str__ (logging may stringify the same error repeatedly)
+        self._rendered: Optional[str] = None
         super().__init__(self.message)
     
     def __str__(self) -> str:
         """Return string representation of the exception."""
-        if self.details:
-            return f"{self.message} | Details: {self.details}"
-        return self.message
+        if not self.details:
+            return self.message
+        if self._rendered is None:
+            rendered = ", ".join(f"{key}={value}" for key, value in self.details.items())
+            self._rendered = f"{self.message} | Details: {rendered}"
+        return self._rendered
 
 
 class DataFetchError(TerminalBaseException):
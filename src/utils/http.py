@@ -0,0 +1,64 @@
+"""
+Sesje HTTP
+==========
+
+Ten moduł tworzy współdzielone sesje `requests` z pulą połączeń keep-alive
+i ponawianiem żądań przy błędach przejściowych (429, 5xx), aby kolejne
+wywołania API nie nawiązywały od nowa połączenia TCP/TLS.
+
+Moduł nie jest re-eksportowany z `src.utils`, żeby samo `get_logger`
+nie importowało `requests`.
+
+Przykład użycia:
+    from src.utils.http import build_session
+
+    session = build_session(pool_maxsize=16)
+    response = session.get("https://newsapi.org/v2/everything", params={...}, timeout=15)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session(
+    pool_connections: int = 8,
+    pool_maxsize: int = 16,
+    retries: int = 3,
+    backoff_factor: float = 0.3
+) -> requests.Session:
+    """
+    Create a keep-alive session with a connection pool and retries.
+
+    Only idempotent methods (GET, HEAD, ...) are retried; POSTs are sent once.
+    A Retry-After header on 429/503 is honoured before retrying.
+    After the last retry the final response is returned (not raised), so
+    callers keep handling error status codes themselves.
+
+    Args:
+        pool_connections: Number of per-host pools to cache.
+        pool_maxsize: Maximum connections kept per host.
+        retries: Total retry attempts on connection errors and RETRY_STATUSES.
+        backoff_factor: Exponential backoff factor between retries (seconds).
+
+    Returns:
+        Configured requests.Session (mounted for http and https).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,97 @@
+"""
+Blokady Plików
+==============
+
+Ten moduł zapewnia prostą, międzyprocesową blokadę opartą na pliku
+(fcntl.flock na POSIX, msvcrt.locking na Windows). Używana do pilnowania,
+aby działała tylko jedna instancja procesu w tle (np. precompute worker),
+oraz blokadę oczekującą (`lock_file`) dla plików zapisywanych przez kilka procesów.
+
+Użycie:
+    from src.utils import try_lock_file, release_lock_file
+    
+    handle = try_lock_file("data/precompute.lock")
+    if handle is None:
+        print("Inny proces trzyma blokadę")
+    else:
+        try:
+            ...
+        finally:
+            release_lock_file(handle)
+"""
+
+import os
+from typing import IO, Optional
+
+
+def try_lock_file(path: str) -> Optional[IO]:
+    """
+    Try to take an exclusive, non-blocking lock on a file.
+    
+    The lock is held for as long as the returned handle stays open
+    (it is released automatically if the process exits).
+    
+    Args:
+        path: Path to the lock file (created if missing).
+        
+    Returns:
+        Open file handle holding the lock, or None if another process holds it.
+    """
+    handle = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return handle
+    except OSError:
+        handle.close()
+        return None
+
+
+def lock_file(path: str) -> IO:
+    """
+    Take an exclusive lock on a file, waiting until it is free.
+    
+    Args:
+        path: Path to the lock file (created if missing).
+        
+    Returns:
+        Open file handle holding the lock (release with release_lock_file).
+    """
+    handle = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            # LK_LOCK retries for ~10 seconds before raising OSError
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return handle
+    except OSError:
+        handle.close()
+        raise
+
+
+def release_lock_file(handle: IO) -> None:
+    """
+    Release a lock taken with try_lock_file and close its handle.
+    
+    Args:
+        handle: File handle returned by try_lock_file.
+    """
+    try:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    finally:
+        handle.close()
@@ -13,9 +13,13 @@ Użycie:
     logger.info("Aplikacja uruchomiona")
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 
@@ -33,6 +37,19 @@ COLORS = {
     "RESET": "\033[0m"        # Reset
 }
 
+# Background writer for the log file (kept here so it is not garbage collected)
+_file_listener: Optional[QueueListener] = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and stop the writer thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
 
 class ColoredFormatter(logging.Formatter):
     """
@@ -58,6 +75,12 @@ class ColoredFormatter(logging.Formatter):
         """
         super().__init__(fmt, datefmt)
         self.use_colors = use_colors
+        # Wrapped level names, built once instead of per record
+        self._colored = {
+            level: f"{code}{level}{COLORS['RESET']}"
+            for level, code in COLORS.items()
+            if level != "RESET"
+        }
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -69,11 +92,15 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log string with or without colors.
         """
-        if self.use_colors and record.levelname in COLORS:
-            record.levelname = (
-                f"{COLORS[record.levelname]}{record.levelname}{COLORS['RESET']}"
-            )
-        return super().format(record)
+        if not self.use_colors:
+            return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # The record is shared with other handlers (e.g. the plain file handler)
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -85,6 +112,8 @@ def setup_logging(
     Configure logging for the entire application.
     
     Sets up console handler with optional colors and an optional file handler.
+    File output goes through a queue drained by a background listener thread,
+    which is flushed and stopped at interpreter exit.
     This function should be called once at application startup.
     
     Args:
@@ -97,6 +126,8 @@ def setup_logging(
         >>> logger = get_logger("my_module")
         >>> logger.info("This will be logged to console and file")
     """
+    global _file_listener
+    
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -114,13 +145,22 @@ def setup_logging(
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
     
-    # Optional file handler (no colors)
+    # Optional file handler (no colors). Records are queued by the calling
+    # thread and written by a listener thread, so logging never blocks on disk I/O.
+    _stop_file_listener()
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(numeric_level)
         file_formatter = logging.Formatter(DEFAULT_FORMAT, DEFAULT_DATE_FORMAT)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        root_logger.addHandler(queue_handler)
+        
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
     
     # Suppress noisy third-party loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -128,11 +168,17 @@ def setup_logging(
     logging.getLogger("yfinance").setLevel(logging.WARNING)
 
 
+atexit.register(_stop_file_listener)
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the specified module.
     
     This is a convenience function that returns a properly named logger.
+    Results are memoized per name (loggers are never destroyed, so the
+    cached instance stays valid across setup_logging() calls).
     Call setup_logging() before using this function.
     
     Args:
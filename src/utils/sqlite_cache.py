@@ -0,0 +1,149 @@
+"""
+Pamięć Podręczna SQLite
+=======================
+
+Ten moduł udostępnia wspólną obsługę lokalnych baz SQLite używanych jako
+pamięć podręczna (odpowiedzi API, dane FRED, ceny rynkowe): jedno leniwie
+otwierane połączenie na plik, chronione blokadą, z trybem WAL.
+
+- `SQLiteDatabase` - połączenie + schemat, dla modułów z własnymi tabelami
+- `SQLiteCache` - magazyn klucz-wartość (przestrzeń nazw, klucz) ze znacznikiem
+  czasu zapisu; odczyt z `max_age` pomija wpisy przeterminowane
+
+Moduł nie jest re-eksportowany z `src.utils`, żeby samo `get_logger`
+nie importowało `orjson`.
+
+Przykład użycia:
+    from src.utils.sqlite_cache import SQLiteCache
+
+    cache = SQLiteCache("data/api_responses.db", table="responses", codec="orjson")
+    cache.store("news", "T10Y2Y|2025-11-14", {"overall": 55})
+    hit = cache.load("news", "T10Y2Y|2025-11-14", max_age=900)  # (wartość, czas zapisu) lub None
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+import orjson
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Payload codecs: name -> (encode, decode)
+CODECS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "orjson": (orjson.dumps, orjson.loads),
+    "pickle": (lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+}
+
+
+class SQLiteDatabase:
+    """
+    One shared connection to a cache database, opened on first use.
+
+    The connection is created with check_same_thread=False and every
+    access goes through `connect()`, which holds the lock for the
+    duration of the block.
+    """
+
+    def __init__(self, path: str, schema: Sequence[str] = ()):
+        """
+        Args:
+            path: Database file (its folder is created when opening).
+            schema: CREATE ... IF NOT EXISTS statements run once on open.
+        """
+        self.path = path
+        self._schema = tuple(schema)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open (once) the shared connection. Call with _lock held."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self._schema:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection with the lock held."""
+        with self._lock:
+            yield self._open()
+
+
+class SQLiteCache(SQLiteDatabase):
+    """Key-value cache with one (namespace, key) -> payload table."""
+
+    def __init__(self, path: str, table: str, codec: str = "orjson"):
+        """
+        Args:
+            path: Database file.
+            table: Table holding the entries.
+            codec: Payload codec, a key of CODECS ("orjson" or "pickle").
+        """
+        super().__init__(path, schema=(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, payload BLOB NOT NULL, "
+            "stored_at REAL NOT NULL, PRIMARY KEY (namespace, key)) WITHOUT ROWID",
+        ))
+        self.table = table
+        self._encode, self._decode = CODECS[codec]
+
+    def load(self, namespace: str, key: str, max_age: float) -> Optional[Tuple[Any, float]]:
+        """
+        Load a cached value if it is younger than max_age seconds.
+
+        Args:
+            namespace: Cache namespace.
+            key: Entry key within the namespace.
+            max_age: Maximum entry age in seconds.
+
+        Returns:
+            (decoded value, stored_at epoch seconds), or None on miss,
+            expiry or read error.
+        """
+        try:
+            with self.connect() as conn:
+                row = conn.execute(
+                    f"SELECT payload, stored_at FROM {self.table} WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+            if row is None or time.time() - row[1] >= max_age:
+                return None
+            return self._decode(row[0]), row[1]
+        except Exception as e:
+            logger.debug("Cache read failed for %s %s/%s: %s", self.table, namespace, key, e)
+            return None
+
+    def store(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Store a value (best effort, errors are logged).
+
+        Args:
+            namespace: Cache namespace.
+            key: Entry key within the namespace.
+            value: Object the codec can serialize.
+        """
+        try:
+            payload = self._encode(value)
+            with self.connect() as conn:
+                with conn:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO {self.table} (namespace, key, payload, stored_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (namespace, key, payload, time.time())
+                    )
+        except Exception as e:
+            logger.warning("Cache write failed for %s %s/%s: %s", self.table, namespace, key, e)